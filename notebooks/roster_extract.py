@@ -16,36 +16,54 @@ def _(mo):
 def _(
     LaunchState,
     MAX_ATTEMPTS_LAUNCH,
+    REPROCESS_ARCHIVE,
+    RUN_BENCHMARKS,
     Templates,
     close_active_game,
+    ensure_live_layout_measured,
+    extract_roster,
     focus_first_game_tile,
     launch_cfb_game,
     launch_dynasty,
     launch_ps5,
     logger,
+    mo,
+    navigate_to_rosters,
     return_to_home_screen,
     route_launch_error,
     shutdown_pipeline,
-    time,
 ):
+    # Batch re-processing runs from the "Batch Roster Re-processing" cells,
+    # and benchmarks from the "Benchmark Command" cell.
+    mo.stop(REPROCESS_ARCHIVE is not None or RUN_BENCHMARKS)
+
     try:
-        is_stream_active = False
-        for attempt in range(MAX_ATTEMPTS_LAUNCH):
+        # Fail before touching the console if a live run would stop partway.
+        ensure_live_layout_measured()
+
+        attempt = 0
+        # Set once the recovery sequence has relaunched CFB, so the next pass
+        # resumes at the game's main menu.
+        game_launched = False
+        while attempt < MAX_ATTEMPTS_LAUNCH:
             try:
                 # ==== Launch Sequence ======================================
                 with logger.contextualize(phase="launch"):
-                    launch_ps5(target_config=Templates.PS5_SETTINGS_ICON)
-                    focus_first_game_tile()
-                    launch_cfb_game(target_config=Templates.CFB_GAME_TITLE)
-                    launch_dynasty()
-                    # navigate_to_rosters()
+                    if not game_launched:
+                        launch_ps5(target_config=Templates.PS5_SETTINGS_ICON)
+                        focus_first_game_tile()
+                        launch_cfb_game(target_config=Templates.CFB_GAME_TITLE)
+                    launch_dynasty(
+                        top_menu_config=Templates.CFB_MAIN_MENU,
+                        hotfix_config=Templates.CFB_HOTFIX_OVERLAY,
+                    )
+                    navigate_to_rosters()
                     logger.success("Main launch sequence completed successfully!")
 
                 # ==== Roster Extraction ====================================
                 with logger.contextualize(phase="extraction"):
-                    # Simulate roster extraction and completion.
                     logger.info("Initiating data extraction...")
-                    time.sleep(15)
+                    extract_roster()
 
                 # ==== Shut Down Process ====================================
                 with logger.contextualize(phase="shutdown"):
@@ -61,26 +79,28 @@ def _(
                     state = route_launch_error(e, attempt, MAX_ATTEMPTS_LAUNCH)
 
                 if state == LaunchState.RECOVERED:
-                    # ==== Roster Extraction ================================
-                    with logger.contextualize(phase="extraction"):
-                        # The game was recovered and successfully launched. Proceed to extraction.
-                        logger.info("Initiating data extraction after recovery...")
-                        time.sleep(15)
-
-                    # ==== Shut Down Process ================================
-                    with logger.contextualize(phase="shutdown"):
-                        # Move to the PS5 home screen and close the CFB game.
-                        return_to_home_screen()
-                        close_active_game()
-                    break
+                    # The unclosed game was closed and CFB relaunched. Resume
+                    # from its main menu. Only the first recovery is free, so
+                    # a game that keeps reappearing still uses up attempts.
+                    if game_launched:
+                        logger.warning("Recovered again; counting it as an attempt.")
+                        attempt += 1
+                    game_launched = True
+                    continue
 
                 elif state == LaunchState.RETRY:
-                    # The stream was hung, and the PS5 was reset. Try to launch again.
+                    # The stream was hung and the PS5 reset, or the game was
+                    # closed. Launch again from the home screen.
+                    game_launched = False
+                    attempt += 1
                     continue
 
-                elif state == LaunchState.ABORT:
+                else:
                     # A fatal error occurred or max attempts reached. Break the loop.
+                    logger.error(f"Launch sequence stopped ({state.name}).")
                     break
+        else:
+            logger.error(f"Launch sequence failed after {attempt} attempts.")
 
     finally:
         with logger.contextualize(phase="shutdown"):
@@ -99,9 +119,9 @@ def _(mo):
     #### Build the `navigate_to_rosters` function
     - [ ] Build `navigate_to_rosters` to get from the dynasty home screen to the "View Rosters" screen.
     #### Optimize timeouts
-    - [ ] add timers to everything to see how long the actions are taking.
+    - [x] add timers to everything to see how long the actions are taking.
     - [ ] run the pipeline several times and collect and average the times.
-    - [ ] create a table that shows the name of the timer, the average execution time, and the assigned timeout value.
+    - [x] create a table that shows the name of the timer, the average execution time, and the assigned timeout value.
     - [ ] reduce timeouts where there is a large discrepancy between the timeout and the actual time a given task is taking.
     #### Split code into modules
     - [ ] decide on number of modules and module names for the current pipeline code
@@ -123,18 +143,33 @@ def _(mo):
 
 @app.cell
 def _():
+    import contextvars
     import ctypes
+    import functools
+    import hashlib
+    import heapq
+    import inspect
+    import itertools
+    import json
+    import math
+    import os
     import platform
+    import queue
+    import re
     import subprocess
     import sys
+    import threading
     import time
+    import tracemalloc
+    import weakref
+    from concurrent.futures import Executor, Future, ThreadPoolExecutor
+    from datetime import datetime
     from enum import Enum, auto
     from pathlib import Path
     from typing import NamedTuple
 
     import marimo as mo
     import numpy as np
-    import vgamepad as vg
     from loguru import logger
     from PIL import Image
 
@@ -250,33 +285,201 @@ def _():
                     "Critical: Could not lock Windows DPI scaling."
                 ) from e
 
-    _configure_logging()
-    _make_dpi_aware()
+    # ======================
+    # Capture Source
+    # ======================
+    # "dxcam" captures the live chiaki-ng stream from the desktop and
+    # "simulator" drives the in-process `ConsoleSimulator` instead of a PS5.
+    # Any other value is treated as the path to a recorded session (a
+    # directory of PNG frames or a raw BGRA recording) and replayed through a
+    # `FrameSource`.
+    CAPTURE_SOURCE = os.environ.get("CFB_CAPTURE_SOURCE", "dxcam")
+
+    # `--reprocess DIRECTORY` re-reads archived roster pages instead of
+    # driving the console (see `reprocess_roster_archive`). The archive is
+    # replayed as the capture source, so the run never touches the desktop.
+    REPROCESS_ARCHIVE = mo.cli_args().get("reprocess")
+    if REPROCESS_ARCHIVE is not None:
+        CAPTURE_SOURCE = str(REPROCESS_ARCHIVE)
+
+    # `--benchmark` runs the vision benchmarks on stored frames instead of
+    # driving the console (see "Benchmark Command").
+    RUN_BENCHMARKS = "benchmark" in mo.cli_args()
+    if RUN_BENCHMARKS:
+        CAPTURE_SOURCE = "simulator"
+
+    IS_LIVE_CAPTURE = CAPTURE_SOURCE == "dxcam"
+    IS_SIMULATED = CAPTURE_SOURCE == "simulator"
+
+    # Optional "WIDTHxHEIGHT" size every captured frame is downscaled to
+    # before matching, e.g. "1280x720" to match at 720p on a 4K monitor.
+    _capture_resolution = os.environ.get("CFB_CAPTURE_RESOLUTION")
+    CAPTURE_RESOLUTION = (
+        tuple(int(value) for value in _capture_resolution.lower().split("x"))
+        if _capture_resolution
+        else None
+    )
+
+    # Controller inputs are logged at TRACE, below the default file level.
+    # Set "TRACE" to record a session for `record_macro`.
+    _configure_logging(file_level=os.environ.get("CFB_LOG_FILE_LEVEL", "DEBUG"))
+
+    # Replayed sessions never touch the Windows desktop, so they can run on
+    # any OS without DPI awareness.
+    if IS_LIVE_CAPTURE:
+        _make_dpi_aware()
 
     # Delayed iumports (GUI/Display Dependent).
     import cv2
-    import dxcam_cpp as dxcam
-    import win32api
-    import win32con
-    import win32gui
+
+    if IS_LIVE_CAPTURE:
+        import dxcam_cpp as dxcam
+        import vgamepad as vg
+        import win32api
+        import win32con
+        import win32gui
+    else:
+        dxcam = vg = win32api = win32con = win32gui = None
+
+    # First-party modules import OpenCV, so they are delayed with it. The
+    # DS4 input constants in `cfb_analysis.gamepad` carry vgamepad's values,
+    # so only live runs (which send inputs through ViGEm) import vgamepad.
+    from cfb_analysis import macros
+    from cfb_analysis.archive import reprocess_roster_archive
+    from cfb_analysis.capture import CaptureSession, RegionFeed
+    from cfb_analysis.frames import (
+        FrameSource,
+        RawRecordingFrameSource,
+        create_frame_source,
+    )
+    from cfb_analysis.gamepad import (
+        DS4_DPAD_DIRECTIONS,
+        Button,
+        Gamepad,
+        InputStep,
+        InputType,
+        NullGamepad,
+    )
+    from cfb_analysis.geometry import (
+        REFERENCE_RESOLUTION,
+        denormalize_region,
+        normalize_region,
+    )
+    from cfb_analysis.glyphs import GlyphBank
+    from cfb_analysis.home import HOME_TILE_ROW
+    from cfb_analysis.macros import CompiledMacro, MacroSyntaxError, MacroTiming
+    from cfb_analysis.matching import (
+        TemplateMatch,
+        build_template_pyramid,
+        find_template,
+    )
+    from cfb_analysis.roster import (
+        ROSTER_TABLE,
+        ROSTER_TABLE_MEASURED,
+        PlayerRecord,
+        RosterExtraction,
+        RosterPageTiming,
+        RosterTable,
+        read_roster_page,
+        segment_roster_page,
+        write_roster_records,
+    )
+    from cfb_analysis.sim import ConsoleSimulator, SimulatorScenario
+    from cfb_analysis.store import RosterKey, RosterStore
+    from cfb_analysis.timing import (
+        StabilizationWindow,
+        StepTiming,
+        TimeoutBounds,
+        TimeoutPolicy,
+        TimingStore,
+    )
 
     return (
+        Button,
+        CAPTURE_RESOLUTION,
+        CAPTURE_SOURCE,
+        CaptureSession,
+        CompiledMacro,
+        ConsoleSimulator,
+        DS4_DPAD_DIRECTIONS,
         Enum,
+        Executor,
+        FrameSource,
+        Future,
+        Gamepad,
+        GlyphBank,
+        HOME_TILE_ROW,
+        IS_LIVE_CAPTURE,
+        IS_SIMULATED,
         Image,
+        InputStep,
+        InputType,
+        MacroSyntaxError,
+        MacroTiming,
         NamedTuple,
+        NullGamepad,
         Path,
+        PlayerRecord,
+        REFERENCE_RESOLUTION,
+        REPROCESS_ARCHIVE,
+        ROSTER_TABLE,
+        ROSTER_TABLE_MEASURED,
+        RUN_BENCHMARKS,
+        RawRecordingFrameSource,
+        RegionFeed,
+        RosterExtraction,
+        RosterKey,
+        RosterPageTiming,
+        RosterStore,
+        RosterTable,
+        SimulatorScenario,
+        StabilizationWindow,
+        StepTiming,
+        TemplateMatch,
+        ThreadPoolExecutor,
+        TimeoutBounds,
+        TimeoutPolicy,
+        TimingStore,
         auto,
+        build_template_pyramid,
+        contextvars,
+        create_frame_source,
+        ctypes,
         cv2,
+        datetime,
+        denormalize_region,
         dxcam,
+        find_template,
+        functools,
+        hashlib,
+        heapq,
+        inspect,
+        itertools,
+        json,
         logger,
+        macros,
+        math,
         mo,
+        normalize_region,
         np,
+        os,
+        platform,
+        queue,
+        re,
+        read_roster_page,
+        reprocess_roster_archive,
+        segment_roster_page,
         subprocess,
+        sys,
+        threading,
         time,
+        tracemalloc,
         vg,
+        weakref,
         win32api,
         win32con,
         win32gui,
+        write_roster_records,
     )
 
 
@@ -289,13 +492,27 @@ def _(mo):
 
 
 @app.cell
-def _(Enum, NamedTuple, Path, auto, cv2, dxcam, np, vg):
+def _(Enum, NamedTuple, Path, TemplateMatch, auto, cv2, normalize_region, np):
     MAX_ATTEMPTS_LAUNCH = 2
     WINDOW_TITLE = "chiaki-ng"
-    camera: dxcam.DXCamera = dxcam.create(  # ty: ignore
-        device_idx=0, output_idx=0, output_color="BGRA"
-    )
+    CAPTURE_TARGET_FPS = 60
     _PROJECT_DIR = Path.cwd().parent
+    # Templates scaled to other output sizes are kept here between runs.
+    TEMPLATE_CACHE_DIR = _PROJECT_DIR / ".cache" / "templates"
+    # One PNG per character of the game's roster font, in a directory per
+    # capture resolution (see `GlyphBank`).
+    GLYPH_DIR = _PROJECT_DIR / "assets" / "templates" / "glyphs"
+    # Extracted rosters are written here, one file per extraction.
+    ROSTER_DIR = _PROJECT_DIR / "data" / "rosters"
+    # The columnar roster store, one directory per dynasty (see
+    # `RosterStore`).
+    ROSTER_STORE_DIR = _PROJECT_DIR / "data" / "store"
+    # The committed vision benchmark results new runs are compared with
+    # (see `compare_benchmarks`).
+    BENCHMARK_BASELINE = _PROJECT_DIR / "benchmarks" / "vision_baseline.json"
+    # The committed 1080p home screen frames the vision benchmarks replay,
+    # as a directory of PNG frames (see `load_fixture_frames`).
+    BENCHMARK_FIXTURES = _PROJECT_DIR / "benchmarks" / "fixtures"
 
     class TemplateFileNotFoundError(Exception):
         """Raised when the image template file is not found."""
@@ -321,6 +538,15 @@ def _(Enum, NamedTuple, Path, auto, cv2, dxcam, np, vg):
     class HotfixAppliedError(Exception):
         """Raised when a hotfix is detected and dismissed, requiring a clean game restart."""
 
+    class RosterPageTimeoutError(Exception):
+        """Raised when a roster page does not settle within its timeout."""
+
+    class LiveLayoutNotMeasuredError(Exception):
+        """Raised when a live run needs a screen that is only simulated so far."""
+
+    class BenchmarkRegressionError(Exception):
+        """Raised when a benchmark run is slower than the committed baseline."""
+
     def _load_template(path: Path) -> np.ndarray:
         """
         Loads a grayscale image from disk and validates it.
@@ -381,127 +607,112 @@ def _(Enum, NamedTuple, Path, auto, cv2, dxcam, np, vg):
         log_context : str
             A descriptive string identifying the target, utilized for context
             in logging output.
+        confidence_threshold : float, optional
+            The minimum match value (0.0 to 1.0) required to consider the
+            target present. Default is 0.90.
         """
 
         template: np.ndarray
         region: tuple[int, int, int, int]  # (left, top, right, bottom)
         log_context: str
+        confidence_threshold: float = 0.90
 
-    class Templates:
+    class ScreenClassification(NamedTuple):
         """
-        Pre-configured visual templates used throughout the pipeline.
+        The outcome of scoring one frame against several known screens.
 
-        This class acts as a namespace to hold instantiated `TemplateConfig`
-        objects, ensuring templates are loaded into memory once and their
-        search regions are standardized.
+        Attributes
+        ----------
+        state : str | None
+            The name of the best matching `Templates` entry, or None if no
+            candidate cleared its confidence threshold.
+        confidence : float
+            The confidence of `state`, or the highest confidence seen if no
+            candidate matched.
+        scores : dict[str, TemplateMatch]
+            The individual result for every candidate that was scored.
+        """
+
+        state: str | None
+        confidence: float
+        scores: dict[str, TemplateMatch]
+
+    class TemplateSpec(NamedTuple):
+        """
+        A resolution-independent definition of a template matching target.
 
         Attributes
         ----------
-        PS5_SETTINGS_ICON : TemplateConfig
-            Configuration for detecting the settings icon on the PS5 home
+        template : np.ndarray
+            The grayscale template as cut at `REFERENCE_RESOLUTION`.
+        region : tuple[float, float, float, float]
+            The (left, top, right, bottom) search region as fractions of the
+            screen size (see `normalize_region`).
+        log_context : str
+            A descriptive string identifying the target, utilized for context
+            in logging output.
+        confidence_threshold : float, optional
+            The minimum match value (0.0 to 1.0) required to consider the
+            target present. Default is 0.90.
+        """
+
+        template: np.ndarray
+        region: tuple[float, float, float, float]
+        log_context: str
+        confidence_threshold: float = 0.90
+
+    class TemplateSpecs:
+        """
+        The reference definitions of every visual template in the pipeline.
+
+        Regions are normalized, so the same definitions apply at any output
+        resolution. The `Templates` namespace holds these specs scaled to
+        the resolution actually being captured.
+
+        Attributes
+        ----------
+        PS5_SETTINGS_ICON : TemplateSpec
+            Specification for detecting the settings icon on the PS5 home
             screen.
-        CFB_GAME_TITLE : TemplateConfig
-            Configuration for detecting the College Football game title.
+        CFB_GAME_TITLE : TemplateSpec
+            Specification for detecting the College Football game title.
         """
 
-        PS5_SETTINGS_ICON = TemplateConfig(
+        PS5_SETTINGS_ICON = TemplateSpec(
             template=_load_template(_TemplatePaths.PS5_SETTINGS_ICON),
-            region=(1430, 20, 1520, 105),
+            region=normalize_region((1430, 20, 1520, 105)),
             log_context="PS5 Home Screen",
         )
-        CFB_GAME_TITLE = TemplateConfig(
+        CFB_GAME_TITLE = TemplateSpec(
             template=_load_template(_TemplatePaths.CFB_GAME_TITLE),
-            region=(330, 225, 880, 300),
+            region=normalize_region((330, 225, 880, 300)),
             log_context="CFB Game Title",
         )
 
-    class InputType(Enum):
+    class ExpectedChange(NamedTuple):
         """
-        Categorizes the types of virtual controller inputs.
-
-        This enumeration ensures that each button press is routed to the
-        correct underlying `vgamepad` method, as standard buttons, D-Pad
-        directions, and special buttons require different API calls.
+        A visible screen change that confirms an input took effect.
 
         Attributes
         ----------
-        STANDARD : InputType
-            Represents standard face buttons, options button, bumpers, and
-            triggers.
-        DPAD : InputType
-            Represents directional pad inputs.
-        SPECIAL : InputType
-            Represents special buttons, such as the PlayStation button.
-        """
-
-        DPAD = auto()
-        SPECIAL = auto()
-        STANDARD = auto()
-
-    class Button(Enum):
+        region : tuple[int, int, int, int] | None
+            The screen coordinates (left, top, right, bottom) to watch, or
+            None for the full screen.
+        template : np.ndarray | None, optional
+            A grayscale template whose presence in `region` confirms the
+            input, or None to accept any visible change. Default is None.
+        appears : bool, optional
+            True if the template must appear, False if it must disappear.
+            Default is True.
+        confidence_threshold : float, optional
+            The minimum match value for the template to count as present.
+            Default is 0.90.
         """
-        Mappings for virtual DualShock 4 (DS4) controller inputs.
 
-        This enumeration maps readable button names to their corresponding
-        input categories and vgamepad bitmasks. The `.value` property of each
-        member returns a `tuple[InputType, int]`.
-
-        Attributes
-        ----------
-        DPAD_UP : Button
-            The D-Pad North (Up) direction.
-        DPAD_DOWN : Button
-            The D-Pad South (Down) direction.
-        DPAD_LEFT : Button
-            The D-Pad West (Left) direction.
-        DPAD_RIGHT : Button
-            The D-Pad East (Right) direction.
-        DPAD_NEUTRAL : Button
-            The state representing a released or neutral D-Pad.
-        SQUARE : Button
-            The Square face button.
-        TRIANGLE : Button
-            The Triangle face button.
-        CROSS : Button
-            The Cross (X) face button.
-        CIRCLE : Button
-            The Circle face button.
-        L1 : Button
-            The L1 bumper button.
-        R1 : Button
-            The R1 bumper button.
-        L2 : Button
-            The L2 trigger button.
-        R2 : Button
-            The R2 trigger button.
-        PS : Button
-            The PlayStation (PS) special menu button.
-        OPTIONS : Button
-            The Options menu button.
-        """
-
-        # D-Pad Directions.
-        DPAD_UP = (InputType.DPAD, vg.DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_NORTH)
-        DPAD_DOWN = (InputType.DPAD, vg.DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_SOUTH)
-        DPAD_LEFT = (InputType.DPAD, vg.DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_WEST)
-        DPAD_RIGHT = (InputType.DPAD, vg.DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_EAST)
-        DPAD_NEUTRAL = (InputType.DPAD, vg.DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_NONE)
-
-        # Face Buttons.
-        SQUARE = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_SQUARE)
-        TRIANGLE = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_TRIANGLE)
-        CROSS = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_CROSS)
-        CIRCLE = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_CIRCLE)
-
-        # Bumpers and Triggers.
-        L1 = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_SHOULDER_LEFT)
-        R1 = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_SHOULDER_RIGHT)
-        L2 = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_TRIGGER_LEFT)
-        R2 = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_TRIGGER_RIGHT)
-
-        # Menu Buttons.
-        PS = (InputType.SPECIAL, vg.DS4_SPECIAL_BUTTONS.DS4_SPECIAL_BUTTON_PS)
-        OPTIONS = (InputType.STANDARD, vg.DS4_BUTTONS.DS4_BUTTON_OPTIONS)
+        region: tuple[int, int, int, int] | None
+        template: np.ndarray | None = None
+        appears: bool = True
+        confidence_threshold: float = 0.90
 
     class LaunchState(Enum):
         """
@@ -545,25 +756,306 @@ def _(Enum, NamedTuple, Path, auto, cv2, dxcam, np, vg):
         MAIN_MENU = auto()
         HOTFIX = auto()
 
+    class ScreenEventType(Enum):
+        """
+        The kinds of events published by a screen watcher.
+
+        Attributes
+        ----------
+        CHANGED : auto
+            The watched region changed visibly.
+        APPEARED : auto
+            The watched template started matching.
+        DISAPPEARED : auto
+            The watched template stopped matching.
+        """
+
+        CHANGED = auto()
+        APPEARED = auto()
+        DISAPPEARED = auto()
+
+    class ScreenEvent(NamedTuple):
+        """
+        A state change observed by a screen watcher.
+
+        Attributes
+        ----------
+        name : str
+            The name of the watched template.
+        type : ScreenEventType
+            What was observed.
+        confidence : float
+            The match confidence on the frame that produced the event (0.0 for
+            `CHANGED` events, which do not match).
+        timestamp : float
+            The `time.monotonic()` time the frame was evaluated.
+        """
+
+        name: str
+        type: ScreenEventType
+        confidence: float
+        timestamp: float
+
     return (
-        Button,
+        BENCHMARK_BASELINE,
+        BENCHMARK_FIXTURES,
+        BenchmarkRegressionError,
+        CAPTURE_TARGET_FPS,
         CFBGameTitleNotFoundError,
+        CFBMainMenuState,
         ChiakiExecutableNotFoundError,
         ChiakiFullscreenError,
         ChiakiWindowNotFoundError,
+        ExpectedChange,
+        GLYPH_DIR,
         HotfixAppliedError,
-        InputType,
         LaunchState,
+        LiveLayoutNotMeasuredError,
         MAX_ATTEMPTS_LAUNCH,
         PS5SettingsIconNotFoundError,
+        ROSTER_DIR,
+        ROSTER_STORE_DIR,
+        RosterPageTimeoutError,
+        ScreenClassification,
+        ScreenEvent,
+        ScreenEventType,
+        TEMPLATE_CACHE_DIR,
         TemplateConfig,
+        TemplateFileNotFoundError,
         TemplateMatchTimeoutError,
-        Templates,
+        TemplateSpec,
+        TemplateSpecs,
         WINDOW_TITLE,
-        camera,
     )
 
 
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Console Simulator
+    #### `console_simulator`
+    """)
+    return
+
+
+@app.cell
+def _(ConsoleSimulator, IS_SIMULATED, logger):
+    console_simulator = ConsoleSimulator.from_env() if IS_SIMULATED else None
+    if console_simulator is not None:
+        logger.info(f"Simulating the console with {console_simulator.scenario}.")
+    return (console_simulator,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Capture Session
+    #### `capture_session`
+    """)
+    return
+
+
+@app.cell
+def _(
+    CAPTURE_RESOLUTION,
+    CAPTURE_SOURCE,
+    CAPTURE_TARGET_FPS,
+    CaptureSession,
+    console_simulator,
+    create_frame_source,
+    logger,
+):
+    if console_simulator is not None:
+        frame_source = console_simulator
+    else:
+        frame_source = create_frame_source(CAPTURE_SOURCE)
+
+    logger.info(f"Using {type(frame_source).__name__} for screen capture.")
+    capture_session = CaptureSession(
+        frame_source, target_fps=CAPTURE_TARGET_FPS, output_size=CAPTURE_RESOLUTION
+    )
+    return (capture_session,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Scaled Templates
+    #### `scale_template`
+    #### `ScaledTemplateCache`
+    #### `Templates`
+    """)
+    return
+
+
+@app.cell
+def _(
+    Path,
+    REFERENCE_RESOLUTION,
+    TEMPLATE_CACHE_DIR,
+    TemplateConfig,
+    TemplateSpec,
+    TemplateSpecs,
+    capture_session,
+    console_simulator,
+    cv2,
+    denormalize_region,
+    hashlib,
+    logger,
+):
+    def scale_template(
+        spec: TemplateSpec, resolution: tuple[int, int]
+    ) -> TemplateConfig:
+        """
+        Resolves a template specification for frames of size `resolution`.
+
+        Parameters
+        ----------
+        spec : TemplateSpec
+            The reference template and its normalized region.
+        resolution : tuple[int, int]
+            The (width, height) of the frames that will be matched.
+
+        Returns
+        -------
+        TemplateConfig
+            The template resized by the ratio of `resolution` to
+            `REFERENCE_RESOLUTION`, with its region in pixels.
+        """
+        width, height = resolution
+        reference_width, reference_height = REFERENCE_RESOLUTION
+        template_height, template_width = spec.template.shape
+        size = (
+            max(1, round(template_width * width / reference_width)),
+            max(1, round(template_height * height / reference_height)),
+        )
+
+        template = spec.template
+        if size != (template_width, template_height):
+            shrinking = size[0] < template_width
+            template = cv2.resize(
+                template,
+                size,
+                interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_CUBIC,
+            )
+
+        return TemplateConfig(
+            template=template,
+            region=denormalize_region(spec.region, resolution),
+            log_context=spec.log_context,
+            confidence_threshold=spec.confidence_threshold,
+        )
+
+    class ScaledTemplateCache:
+        """
+        Templates scaled per output resolution, stored on disk.
+
+        Scaled templates are written as PNGs to one directory per resolution,
+        named after the template and a hash of the reference image, so an
+        updated asset is rescaled automatically. Regions are cheap to
+        compute and are always derived from the specification.
+
+        Attributes
+        ----------
+        directory : Path
+            The root directory of the cache.
+        """
+
+        def __init__(self, directory: Path = TEMPLATE_CACHE_DIR) -> None:
+            self.directory = Path(directory)
+
+        def load(
+            self, specs: type, resolution: tuple[int, int]
+        ) -> dict[str, TemplateConfig]:
+            """
+            Returns every `TemplateSpec` on `specs` scaled to `resolution`.
+
+            Parameters
+            ----------
+            specs : type
+                The namespace of specifications, e.g. `TemplateSpecs`.
+            resolution : tuple[int, int]
+                The (width, height) of the frames that will be matched.
+
+            Returns
+            -------
+            dict[str, TemplateConfig]
+                The scaled configurations keyed by attribute name.
+            """
+            width, height = resolution
+            directory = self.directory / f"{width}x{height}"
+            configs = {}
+
+            for name, spec in vars(specs).items():
+                if not isinstance(spec, TemplateSpec):
+                    continue
+
+                digest = hashlib.sha1(spec.template.tobytes()).hexdigest()[:12]
+                path = directory / f"{name.lower()}_{digest}.png"
+                template = (
+                    cv2.imread(path, cv2.IMREAD_GRAYSCALE) if path.is_file() else None
+                )
+
+                if template is None:
+                    template = scale_template(spec, resolution).template
+
+                    # Reference templates are used as they are.
+                    if (width, height) != REFERENCE_RESOLUTION:
+                        directory.mkdir(parents=True, exist_ok=True)
+                        cv2.imwrite(path, template)
+                        logger.debug(f"Cached {name} scaled to {width}x{height}.")
+
+                configs[name] = TemplateConfig(
+                    template=template,
+                    region=denormalize_region(spec.region, resolution),
+                    log_context=spec.log_context,
+                    confidence_threshold=spec.confidence_threshold,
+                )
+
+            return configs
+
+    _scaled = ScaledTemplateCache().load(TemplateSpecs, capture_session.resolution)
+
+    # CFB's main menu and hotfix overlay have no template assets yet. The
+    # simulator draws its own, so simulated runs match those instead.
+    if console_simulator is not None:
+        for _name, _simulated in console_simulator.screen_templates().items():
+            _scaled[_name] = scale_template(
+                TemplateSpec(*_simulated), capture_session.resolution
+            )
+
+    class Templates:
+        """
+        Pre-configured visual templates used throughout the pipeline.
+
+        This class acts as a namespace to hold instantiated `TemplateConfig`
+        objects, ensuring templates are loaded into memory once and their
+        search regions are standardized. Each one is the matching
+        `TemplateSpecs` entry scaled to the capture session's resolution.
+
+        Attributes
+        ----------
+        PS5_SETTINGS_ICON : TemplateConfig
+            Configuration for detecting the settings icon on the PS5 home
+            screen.
+        CFB_GAME_TITLE : TemplateConfig
+            Configuration for detecting the College Football game title.
+        CFB_MAIN_MENU : TemplateConfig | None
+            Configuration for detecting CFB's main menu, or None until its
+            template asset exists.
+        CFB_HOTFIX_OVERLAY : TemplateConfig | None
+            Configuration for detecting the hotfix overlay's "Yes/No" prompt,
+            or None until its template asset exists.
+        """
+
+        PS5_SETTINGS_ICON = _scaled["PS5_SETTINGS_ICON"]
+        CFB_GAME_TITLE = _scaled["CFB_GAME_TITLE"]
+        CFB_MAIN_MENU = _scaled.get("CFB_MAIN_MENU")
+        CFB_HOTFIX_OVERLAY = _scaled.get("CFB_HOTFIX_OVERLAY")
+
+    return Templates, scale_template
+
+
 @app.cell(hide_code=True)
 def _(mo):
     mo.md(r"""
@@ -574,7 +1066,22 @@ def _(mo):
 
 
 @app.cell
-def _(Button, InputType, logger, time, vg):
+def _(
+    Button,
+    Future,
+    Gamepad,
+    IS_LIVE_CAPTURE,
+    InputStep,
+    InputType,
+    NullGamepad,
+    console_simulator,
+    contextvars,
+    logger,
+    queue,
+    threading,
+    time,
+    vg,
+):
     class VirtualController:
         """
         A wrapper class to manage controller emulation and input sequences.
@@ -584,6 +1091,15 @@ def _(Button, InputType, logger, time, vg):
         movements, and special button interactions with appropriate timing
         buffers.
 
+        Inputs are queued and sent by a dedicated dispatcher thread, which
+        presses and releases each button at precomputed monotonic times. The
+        `*_async` methods return a future as soon as the input is queued, so
+        vision work can continue while it plays out; `tap`, `hold` and
+        `sequence` wait for it. A batched sequence costs the sum of its own
+        press and rest times rather than a full default rest per input.
+        `stop` drops the queued inputs and ends the dispatcher; the next
+        queued input starts a new one.
+
         Attributes
         ----------
         DEFAULT_TAP_TIME : float
@@ -593,85 +1109,172 @@ def _(Button, InputType, logger, time, vg):
         DEFAULT_REST_TIME : float
             The standard duration in seconds to wait after an input is
             released, allowing the corresponding UI animation to finish.
-        gamepad : vg.VDS4Gamepad
+        gamepad : Gamepad
             The underlying virtual gamepad instance used to send inputs to the
-            OS.
+            OS, the simulator's fake gamepad, or a gamepad that sends nothing
+            when frames are replayed.
         """
 
         DEFAULT_TAP_TIME = 0.1
         DEFAULT_HOLD_TIME = 1.2
         DEFAULT_REST_TIME = 0.3
 
-        def __init__(self) -> None:
-            """Initializes the virtual gamepad."""
-            self.gamepad = vg.VDS4Gamepad()
+        def __init__(self, gamepad: Gamepad | None = None) -> None:
+            """
+            Initializes the virtual gamepad and its input dispatcher.
+
+            Parameters
+            ----------
+            gamepad : Gamepad | None, optional
+                A gamepad to send inputs to instead of a new ViGEm DS4
+                gamepad. Default is None.
+            """
+            self.gamepad = vg.VDS4Gamepad() if gamepad is None else gamepad
+            # Guards starting and stopping the dispatcher against inputs
+            # queued from other threads.
+            self._lock = threading.Lock()
+            self._inputs: queue.Queue | None = None
+            self._dispatcher: threading.Thread | None = None
+            self._start_dispatcher()
 
             # Allow the OS time to mount the virtual controller before sending
             # inputs.
-            time.sleep(1.0)
+            if gamepad is None:
+                time.sleep(1.0)
 
-        def _execute_action(
-            self,
-            button: Button,
-            action_time: float,
-            rest_time: float,
-        ) -> None:
+        def _set_button(self, button: Button, pressed: bool) -> None:
             """
-            Executes the central sequence of pressing, updating, and releasing.
+            Presses or releases a button and sends the new state.
 
-            This engine standardizes the required delays between sending a
-            state change to the virtual controller and resetting it, routing
-            the input to the correct vgamepad method based on the input type.
+            Routes the input to the correct vgamepad method based on the input
+            type.
 
             Parameters
             ----------
             button : Button
-                The specific Button enum member to be pressed and released.
-            action_time : float
-                The duration in seconds to wait while the button is pressed.
-            rest_time : float
-                The duration in seconds to wait after the button is released.
+                The specific Button enum member to press or release.
+            pressed : bool
+                True to press the button, False to release it.
             """
             input_type, button_val = button.value
 
-            # Press button.
             if input_type == InputType.STANDARD:
-                self.gamepad.press_button(button=button_val)
+                if pressed:
+                    self.gamepad.press_button(button=button_val)
+                else:
+                    self.gamepad.release_button(button=button_val)
             elif input_type == InputType.SPECIAL:
-                self.gamepad.press_special_button(special_button=button_val)
+                if pressed:
+                    self.gamepad.press_special_button(special_button=button_val)
+                else:
+                    self.gamepad.release_special_button(special_button=button_val)
             elif input_type == InputType.DPAD:
+                if not pressed:
+                    button_val = Button.DPAD_NEUTRAL.value[1]
                 self.gamepad.directional_pad(direction=button_val)
 
             self.gamepad.update()
-            time.sleep(action_time)
 
-            # Release button.
-            if input_type == InputType.STANDARD:
-                self.gamepad.release_button(button=button_val)
-            elif input_type == InputType.SPECIAL:
-                self.gamepad.release_special_button(special_button=button_val)
-            elif input_type == InputType.DPAD:
-                neutral_val = Button.DPAD_NEUTRAL.value[1]
-                self.gamepad.directional_pad(direction=neutral_val)
+        def _start_dispatcher(self) -> None:
+            """Starts a dispatcher thread with a queue of its own."""
+            self._inputs = queue.Queue()
+            self._dispatcher = threading.Thread(
+                target=self._dispatch,
+                args=(self._inputs,),
+                name="controller-input",
+                daemon=True,
+            )
+            self._dispatcher.start()
 
-            self.gamepad.update()
-            time.sleep(rest_time)
+        def _dispatch(self, inputs: queue.Queue) -> None:
+            """
+            Plays queued input sequences in order until a None entry arrives.
 
-            action_type = "tap" if action_time == self.DEFAULT_TAP_TIME else "hold"
+            Every press and release is scheduled relative to the start of its
+            sequence, so time spent sending one event does not delay the rest
+            of the sequence.
+            """
+            while True:
+                queued = inputs.get()
+                if queued is None:
+                    return
 
-            logger.trace(
-                f"Controller input executed: {action_type} {button.name} (rest time: {rest_time}s)"
-            )
+                steps, future, context = queued
+                if not future.set_running_or_notify_cancel():
+                    continue
 
-        def tap(
-            self,
-            button: Button,
-            /,
-            *,
-            rest_time: float | None = None,
-        ) -> None:
+                # Log under the submitter's context (e.g. its pipeline phase).
+                context.run(self._play, steps, future)
+
+        def _play(self, steps: list[InputStep], future: Future) -> None:
+            """Plays one queued sequence and resolves its future."""
+            try:
+                deadline = time.monotonic()
+                for step in steps:
+                    self._set_button(step.button, pressed=True)
+                    deadline += step.action_time
+                    time.sleep(max(0.0, deadline - time.monotonic()))
+
+                    self._set_button(step.button, pressed=False)
+                    deadline += step.rest_time
+                    time.sleep(max(0.0, deadline - time.monotonic()))
+
+                    action_type = (
+                        "tap" if step.action_time == self.DEFAULT_TAP_TIME else "hold"
+                    )
+                    logger.trace(
+                        f"Controller input executed: {action_type} {step.button.name} (rest time: {step.rest_time}s)"
+                    )
+            except Exception as e:
+                # Callers of the `*_async` methods often never read the
+                # future, so the failure is logged here as well.
+                logger.exception("Controller input sequence failed.")
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+
+        def stop(self, timeout: float = 5.0) -> None:
             """
-            A quick press and release of a controller button.
+            Drops the queued inputs and stops the dispatcher thread.
+
+            The sequence being played is finished, so no button is left
+            pressed by this controller. Inputs queued afterwards start a new
+            dispatcher.
+
+            Parameters
+            ----------
+            timeout : float, optional
+                The longest time in seconds to wait for the sequence being
+                played. Default is 5.0.
+            """
+            with self._lock:
+                inputs, dispatcher = self._inputs, self._dispatcher
+                self._inputs = self._dispatcher = None
+
+            if dispatcher is None:
+                return
+
+            dropped = 0
+            while True:
+                try:
+                    queued = inputs.get_nowait()
+                except queue.Empty:
+                    break
+                if queued is not None and queued[1].cancel():
+                    dropped += 1
+
+            inputs.put(None)
+            dispatcher.join(timeout)
+
+            if dispatcher.is_alive():
+                logger.warning(
+                    f"Controller input still playing after {timeout}s; stopping anyway."
+                )
+            logger.debug(f"Controller dispatcher stopped ({dropped} inputs dropped).")
+
+        def tap_step(self, button: Button, rest_time: float | None = None) -> InputStep:
+            """
+            Builds a tap for use in `sequence`.
 
             Parameters
             ----------
@@ -680,22 +1283,20 @@ def _(Button, InputType, logger, time, vg):
             rest_time : float, optional
                 The duration in seconds to wait after releasing the button.
                 Falls back to `DEFAULT_REST_TIME` if None.
+
+            Returns
+            -------
+            InputStep
+                The tap step.
             """
             actual_rest = rest_time if rest_time is not None else self.DEFAULT_REST_TIME
+            return InputStep(button, self.DEFAULT_TAP_TIME, actual_rest)
 
-            self._execute_action(
-                button=button, action_time=self.DEFAULT_TAP_TIME, rest_time=actual_rest
-            )
-
-        def hold(
-            self,
-            button: Button,
-            /,
-            *,
-            rest_time: float | None = None,
-        ) -> None:
+        def hold_step(
+            self, button: Button, rest_time: float | None = None
+        ) -> InputStep:
             """
-            A prolonged press and release of a controller button.
+            Builds a hold for use in `sequence`.
 
             Parameters
             ----------
@@ -704,20 +1305,641 @@ def _(Button, InputType, logger, time, vg):
             rest_time : float, optional
                 The duration in seconds to wait after releasing the button.
                 Falls back to `DEFAULT_REST_TIME` if None.
+
+            Returns
+            -------
+            InputStep
+                The hold step.
             """
             actual_rest = rest_time if rest_time is not None else self.DEFAULT_REST_TIME
+            return InputStep(button, self.DEFAULT_HOLD_TIME, actual_rest)
 
-            self._execute_action(
-                button=button, action_time=self.DEFAULT_HOLD_TIME, rest_time=actual_rest
-            )
-
-    logger.info("Initializing DS4 gamepad emulation...")
-    controller = VirtualController()
-    return (controller,)
+        def sequence_async(self, steps: list[InputStep]) -> Future:
+            """
+            Queues a sequence of inputs to be played back to back.
 
+            Parameters
+            ----------
+            steps : list[InputStep]
+                The inputs in the order they are pressed (e.g. four
+                DPAD_RIGHT taps followed by a CROSS tap).
+
+            Returns
+            -------
+            Future
+                Resolves once the last step's rest time has passed.
+            """
+            future: Future = Future()
+            with self._lock:
+                if self._dispatcher is None:
+                    self._start_dispatcher()
+                self._inputs.put((list(steps), future, contextvars.copy_context()))
+            return future
+
+        def sequence(self, steps: list[InputStep]) -> None:
+            """Plays a sequence of inputs and waits for it to finish."""
+            self.sequence_async(steps).result()
+
+        def tap_async(
+            self, button: Button, /, *, rest_time: float | None = None
+        ) -> Future:
+            """Queues a tap; see `tap`."""
+            return self.sequence_async([self.tap_step(button, rest_time)])
+
+        def hold_async(
+            self, button: Button, /, *, rest_time: float | None = None
+        ) -> Future:
+            """Queues a hold; see `hold`."""
+            return self.sequence_async([self.hold_step(button, rest_time)])
 
-@app.cell(hide_code=True)
-def _(mo):
+        def tap(
+            self,
+            button: Button,
+            /,
+            *,
+            rest_time: float | None = None,
+        ) -> None:
+            """
+            A quick press and release of a controller button.
+
+            Parameters
+            ----------
+            button : Button
+                The specific button to tap.
+            rest_time : float, optional
+                The duration in seconds to wait after releasing the button.
+                Falls back to `DEFAULT_REST_TIME` if None.
+            """
+            self.tap_async(button, rest_time=rest_time).result()
+
+        def hold(
+            self,
+            button: Button,
+            /,
+            *,
+            rest_time: float | None = None,
+        ) -> None:
+            """
+            A prolonged press and release of a controller button.
+
+            Parameters
+            ----------
+            button : Button
+                The specific button to hold.
+            rest_time : float, optional
+                The duration in seconds to wait after releasing the button.
+                Falls back to `DEFAULT_REST_TIME` if None.
+            """
+            self.hold_async(button, rest_time=rest_time).result()
+
+    if console_simulator is not None:
+        _gamepad = console_simulator.gamepad
+    elif IS_LIVE_CAPTURE:
+        _gamepad = None
+    else:
+        # Replayed frames never reach a console, so inputs go nowhere.
+        _gamepad = NullGamepad()
+
+    logger.info("Initializing DS4 gamepad emulation...")
+    controller = VirtualController(gamepad=_gamepad)
+    return (controller,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Frame Change Detection
+    #### `FrameChangeDetector`
+    """)
+    return
+
+
+@app.cell
+def _(cv2, np):
+    class FrameChangeDetector:
+        """
+        Cheap change detection used to skip template matching on static frames.
+
+        Each watched region is reduced to a thumbnail of block averages
+        (one value per `block_size x block_size` block and channel) and
+        compared against the thumbnail of the last frame that was reported as
+        changed. A region counts as changed when any block moves by more than
+        `tolerance` intensity levels, which ignores stream compression noise
+        while still catching real UI transitions. Comparing against the last
+        reported frame, rather than the previous one, means slow fades still
+        register once they have accumulated.
+
+        Attributes
+        ----------
+        block_size : int
+            The side length in pixels of each averaged block.
+        tolerance : float
+            The largest per-block difference still treated as unchanged.
+        """
+
+        def __init__(self, block_size: int = 8, tolerance: float = 3.0) -> None:
+            self.block_size = block_size
+            self.tolerance = tolerance
+            self._references: dict[object, np.ndarray] = {}
+
+        def has_changed(
+            self,
+            frame: np.ndarray,
+            region: tuple[int, int, int, int] | None = None,
+            key: object = None,
+        ) -> bool:
+            """
+            Reports whether `region` of `frame` changed since it last did.
+
+            Parameters
+            ----------
+            frame : np.ndarray
+                The captured frame.
+            region : tuple[int, int, int, int] | None, optional
+                The (left, top, right, bottom) area to check, or None for the
+                whole frame. Default is None.
+            key : object, optional
+                Identifies the reference thumbnail to compare against. Defaults
+                to `region`, so each region is tracked independently.
+
+            Returns
+            -------
+            bool
+                True for the first frame seen for `key` and whenever the region
+                differs from the last changed frame.
+            """
+            if region is not None:
+                left, top, right, bottom = region
+                frame = frame[top:bottom, left:right]
+
+            height, width = frame.shape[:2]
+            thumbnail = cv2.resize(
+                frame,
+                (max(1, width // self.block_size), max(1, height // self.block_size)),
+                interpolation=cv2.INTER_AREA,
+            )
+
+            key = region if key is None else key
+            reference = self._references.get(key)
+
+            if (
+                reference is not None
+                and reference.shape == thumbnail.shape
+                and cv2.norm(thumbnail, reference, cv2.NORM_INF) <= self.tolerance
+            ):
+                return False
+
+            self._references[key] = thumbnail
+            return True
+
+        def reset(self) -> None:
+            """Forgets every reference so the next frame counts as changed."""
+            self._references.clear()
+
+    return (FrameChangeDetector,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Polling Scheduler
+    #### `PollScheduler`
+    """)
+    return
+
+
+@app.cell
+def _(CAPTURE_TARGET_FPS, FrameSource, RegionFeed, np, time):
+    class PollScheduler:
+        """
+        Monotonic deadline and adaptive pacing shared by every polling loop.
+
+        Frame-driven loops wait on the frame source's new-frame signal through
+        `next_frame`, bounded by the remaining time, so a screen change is
+        evaluated on the first frame that shows it. Loops that poll something
+        other than frames (such as the OS window list) call `pause`, which
+        sleeps for `interval`.
+
+        When the caller knows roughly when the awaited transition should
+        happen (`expected_after`), checks well before that point are spread
+        out and tighten to `min_interval` as it approaches. Without an
+        expectation every check runs at `min_interval`.
+
+        Attributes
+        ----------
+        timeout : float
+            The total time budget in seconds.
+        expected_after : float | None
+            The elapsed time in seconds at which the transition is expected,
+            or None if unknown.
+        min_interval : float
+            The shortest time in seconds between checks.
+        max_interval : float
+            The longest time in seconds between checks.
+        """
+
+        def __init__(
+            self,
+            timeout: float,
+            expected_after: float | None = None,
+            min_interval: float = 1.0 / CAPTURE_TARGET_FPS,
+            max_interval: float = 0.5,
+        ) -> None:
+            self.timeout = timeout
+            self.expected_after = expected_after
+            self.min_interval = min_interval
+            self.max_interval = max_interval
+            self.start_time = time.monotonic()
+            self._last_check = float("-inf")
+
+        @property
+        def elapsed(self) -> float:
+            """The time in seconds since the scheduler was created."""
+            return time.monotonic() - self.start_time
+
+        @property
+        def remaining(self) -> float:
+            """The time in seconds left before the deadline (never negative)."""
+            return max(0.0, self.timeout - self.elapsed)
+
+        @property
+        def expired(self) -> bool:
+            """True once the deadline has passed."""
+            return self.elapsed >= self.timeout
+
+        @property
+        def interval(self) -> float:
+            """The current time in seconds between checks."""
+            if self.expected_after is None:
+                return self.min_interval
+
+            # Check a few times across the remaining lead time, never less
+            # often than `max_interval`.
+            lead = self.expected_after - self.elapsed
+            return min(self.max_interval, max(self.min_interval, lead / 4))
+
+        def next_frame(self, source: FrameSource | RegionFeed) -> np.ndarray | None:
+            """
+            Waits for the next frame that is due for evaluation.
+
+            Frames that arrive before `interval` has passed since the previous
+            evaluated frame are dropped, so evaluation only slows down while
+            the transition is not expected yet.
+
+            Parameters
+            ----------
+            source : FrameSource | RegionFeed
+                The running frame source or capture session feed to wait on.
+
+            Returns
+            -------
+            np.ndarray | None
+                The frame to evaluate, or None if the deadline passed first.
+            """
+            while not self.expired:
+                frame = source.get_latest_frame(timeout=self.remaining)
+
+                if frame is None:
+                    continue
+
+                # At the minimum interval every frame is due; throttling only
+                # applies while the transition is still far off.
+                now = time.monotonic()
+                interval = self.interval
+                if interval <= self.min_interval or now - self._last_check >= interval:
+                    self._last_check = now
+                    return frame
+
+            return None
+
+        def pause(self) -> None:
+            """Sleeps until the next check is due, without passing the deadline."""
+            time.sleep(min(self.interval, self.remaining))
+
+    return (PollScheduler,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Step Timing
+    #### `timing_store`
+    #### `StepTimer`
+    #### `timed_step`
+    #### `timing_report`
+    #### `poll_step`
+    #### `timeout_policy`
+    """)
+    return
+
+
+@app.cell
+def _(
+    IS_SIMULATED,
+    Path,
+    StepTiming,
+    TemplateMatchTimeoutError,
+    TimeoutBounds,
+    TimeoutPolicy,
+    TimingStore,
+    functools,
+    inspect,
+    logger,
+    np,
+    time,
+):
+    # Simulated runs are kept apart so they never skew the live timeouts.
+    timing_store = TimingStore(
+        Path("logs")
+        / ("simulated_step_timings.jsonl" if IS_SIMULATED else "step_timings.jsonl")
+    )
+
+    class StepTimer:
+        """
+        A context manager that times one pipeline step and records it.
+
+        Exceptions are never suppressed. An exception of one of
+        `timeout_errors` marks the run as timed out; any exception is recorded
+        by name. Matching steps can report the best confidence they saw by
+        setting `max_confidence` before the block exits.
+
+        Attributes
+        ----------
+        step : str
+            The name the run is recorded under.
+        timeout : float | None
+            The configured timeout in seconds, or None.
+        max_confidence : float | None
+            The highest match confidence seen during the step, if any.
+        """
+
+        def __init__(
+            self,
+            step: str,
+            timeout: float | None = None,
+            timeout_errors: tuple[type[Exception], ...] = (TemplateMatchTimeoutError,),
+            store: TimingStore = timing_store,
+        ) -> None:
+            self.step = step
+            self.timeout = timeout
+            self.timeout_errors = timeout_errors
+            self.store = store
+            self.max_confidence: float | None = None
+
+        def __enter__(self) -> "StepTimer":
+            self._started_at = time.time()
+            self._start = time.perf_counter()
+            return self
+
+        def __exit__(self, exc_type, exc, traceback) -> None:
+            duration = time.perf_counter() - self._start
+            record = StepTiming(
+                step=self.step,
+                started_at=self._started_at,
+                duration=duration,
+                timeout=self.timeout,
+                timed_out=isinstance(exc, self.timeout_errors),
+                error=exc_type.__name__ if exc_type is not None else None,
+                max_confidence=self.max_confidence,
+            )
+
+            try:
+                self.store.append(record)
+            except OSError:
+                # Instrumentation must never take the pipeline down.
+                logger.opt(exception=True).warning(
+                    f"Failed to record timing for '{self.step}'."
+                )
+
+            logger.trace(f"Step '{self.step}' took {duration:.3f}s.")
+
+    def timed_step(
+        step: str | None = None,
+        timeout: float | None = None,
+        timeout_errors: tuple[type[Exception], ...] = (TemplateMatchTimeoutError,),
+    ):
+        """
+        Decorates a pipeline function so every call is recorded by `StepTimer`.
+
+        Parameters
+        ----------
+        step : str | None, optional
+            The name to record calls under. Default is None (the function's
+            name).
+        timeout : float | None, optional
+            The configured timeout to record. Default is None, in which case
+            the function's own `timeout` argument is recorded, if it has one.
+        timeout_errors : tuple[type[Exception], ...], optional
+            The exceptions that mean the step ran out of time. Default is
+            `(TemplateMatchTimeoutError,)`.
+
+        Returns
+        -------
+        Callable
+            The decorator.
+        """
+
+        def decorator(func):
+            name = step or func.__name__
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                step_timeout = timeout
+                if step_timeout is None and "timeout" in signature.parameters:
+                    bound = signature.bind(*args, **kwargs)
+                    bound.apply_defaults()
+                    step_timeout = bound.arguments["timeout"]
+
+                with StepTimer(name, step_timeout, timeout_errors):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def timing_report(store: TimingStore = timing_store) -> list[dict]:
+        """
+        Summarizes the recorded durations of every step.
+
+        Percentiles are computed over completed runs only, since a run that
+        timed out or was censored says nothing about how long the step
+        actually takes.
+
+        Parameters
+        ----------
+        store : TimingStore, optional
+            The store to summarize. Default is `timing_store`.
+
+        Returns
+        -------
+        list[dict]
+            One row per step with the run, timeout, censored and error counts,
+            the p50, p95 and max durations in seconds, the most recently
+            configured timeout, and the highest confidence seen.
+        """
+        by_step: dict[str, list[StepTiming]] = {}
+        for record in store.load():
+            by_step.setdefault(record.step, []).append(record)
+
+        rows = []
+        for step, records in sorted(by_step.items()):
+            completed = np.array(
+                [
+                    r.duration
+                    for r in records
+                    if r.error is None and not r.timed_out and not r.censored
+                ]
+            )
+            confidences = [r.max_confidence for r in records if r.max_confidence]
+
+            rows.append(
+                {
+                    "step": step,
+                    "runs": len(records),
+                    "timeouts": sum(r.timed_out for r in records),
+                    "censored": sum(r.censored for r in records),
+                    "errors": sum(
+                        r.error is not None and not r.timed_out for r in records
+                    ),
+                    "p50": round(float(np.percentile(completed, 50)), 3)
+                    if completed.size
+                    else None,
+                    "p95": round(float(np.percentile(completed, 95)), 3)
+                    if completed.size
+                    else None,
+                    "max": round(float(completed.max()), 3) if completed.size else None,
+                    "timeout": records[-1].timeout,
+                    "max_confidence": round(max(confidences), 3)
+                    if confidences
+                    else None,
+                }
+            )
+
+        return rows
+
+    def poll_step(log_context: str) -> str:
+        """Returns the step name `poll_for_template_match` records under."""
+        return f"poll_for_template_match[{log_context}]"
+
+    timeout_policy = TimeoutPolicy(
+        {
+            "_find_and_focus_window": TimeoutBounds(30.0, 5.0, 60.0),
+            poll_step("PS5 Home Screen"): TimeoutBounds(45.0, 15.0, 90.0),
+            poll_step("CFB Game Title"): TimeoutBounds(3.0, 1.0, 5.0),
+            "_poll_main_menu_with_interrupts": TimeoutBounds(60.0, 20.0, 120.0),
+            # The longest wait for a hotfix overlay after the main menu. Never
+            # tuned: most windows see no overlay, and `StabilizationWindow`
+            # ends them early from its own arrival history.
+            "main_menu_stabilization": TimeoutBounds(10.0, 10.0, 10.0),
+            # Leaving the main menu for the Dynasty hub, and the hub for the
+            # View Rosters screen.
+            "enter_dynasty": TimeoutBounds(10.0, 2.0, 20.0),
+            "open_rosters": TimeoutBounds(10.0, 2.0, 20.0),
+            # Settling one roster page, or confirming the turn to the next.
+            "roster_page": TimeoutBounds(5.0, 1.0, 10.0),
+            # Not observable from the PC side, so it never gains history.
+            "ps5_rest_mode": TimeoutBounds(30.0, 30.0, 30.0),
+        },
+        timing_store,
+    )
+
+    return StepTimer, poll_step, timed_step, timeout_policy, timing_report, timing_store
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Grayscale Frame Buffer
+    #### `GrayFrame`
+    """)
+    return
+
+
+@app.cell
+def _(cv2, np):
+    class GrayFrame:
+        """
+        A captured BGRA frame with a lazily converted, reusable gray buffer.
+
+        `load` only records the new frame. Grayscale conversion happens the
+        first time a region is requested and writes into a buffer that is
+        allocated once and reused for every later frame of the same size.
+        Each requested region is converted once per frame, directly into its
+        place in that buffer, and returned as a view of it. Several templates
+        watching one frame therefore share one conversion, and pixels no
+        template looks at are never converted.
+
+        Views returned by `region` are only valid until the next `load`.
+        """
+
+        def __init__(self) -> None:
+            self._frame: np.ndarray | None = None
+            self._gray: np.ndarray | None = None
+            self._converted: list[tuple[int, int, int, int]] = []
+
+        @property
+        def bgra(self) -> np.ndarray | None:
+            """The most recently loaded BGRA frame."""
+            return self._frame
+
+        def load(self, frame: np.ndarray) -> None:
+            """
+            Replaces the current frame without converting it.
+
+            Parameters
+            ----------
+            frame : np.ndarray
+                The BGRA frame (or region view) to serve next.
+            """
+            if self._gray is None or self._gray.shape != frame.shape[:2]:
+                self._gray = np.empty(frame.shape[:2], np.uint8)
+
+            self._frame = frame
+            self._converted.clear()
+
+        def region(self, region: tuple[int, int, int, int] | None = None) -> np.ndarray:
+            """
+            Returns a grayscale view of `region`, converting it if needed.
+
+            Parameters
+            ----------
+            region : tuple[int, int, int, int] | None, optional
+                The (left, top, right, bottom) area in frame coordinates, or
+                None for the whole frame. Default is None.
+
+            Returns
+            -------
+            np.ndarray
+                A single-channel view into the reusable gray buffer.
+            """
+            if region is None:
+                height, width = self._gray.shape
+                region = (0, 0, width, height)
+
+            left, top, right, bottom = region
+            gray_view = self._gray[top:bottom, left:right]
+
+            for c_left, c_top, c_right, c_bottom in self._converted:
+                if (
+                    c_left <= left
+                    and c_top <= top
+                    and right <= c_right
+                    and bottom <= c_bottom
+                ):
+                    return gray_view
+
+            cv2.cvtColor(
+                self._frame[top:bottom, left:right], cv2.COLOR_BGRA2GRAY, dst=gray_view
+            )
+            self._converted.append(region)
+            return gray_view
+
+    return (GrayFrame,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
     mo.md(r"""
     ### Template Matching Functions
     #### `is_image_match`
@@ -728,12 +1950,19 @@ def _(mo):
 
 @app.cell
 def _(
+    CAPTURE_TARGET_FPS,
+    FrameChangeDetector,
+    GrayFrame,
+    PollScheduler,
+    StepTimer,
     TemplateMatchTimeoutError,
-    camera: "dxcam.DXCamera",
+    build_template_pyramid,
+    capture_session,
     cv2,
+    find_template,
     logger,
     np,
-    time,
+    poll_step,
 ):
     def is_image_match(
         frame: np.ndarray, template: np.ndarray, confidence_threshold: float = 0.90
@@ -741,9 +1970,9 @@ def _(
         """
         Evaluates a single image frame against a template using OpenCV.
 
-        Converts the provided color frame to grayscale and performs template
-        matching to determine if the target template is present within the
-        frame.
+        Converts the provided color frame to grayscale and delegates to
+        `find_template` to determine if the target template is present within
+        the frame.
 
         Parameters
         ----------
@@ -765,10 +1994,13 @@ def _(
             frame.
         """
         gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)
-        result = cv2.matchTemplate(gray_frame, template, cv2.TM_CCOEFF_NORMED)
-        _, max_val, _, _ = cv2.minMaxLoc(result)
+        is_match, confidence, _ = find_template(
+            gray_image=gray_frame,
+            template=template,
+            confidence_threshold=confidence_threshold,
+        )
 
-        return max_val > confidence_threshold, max_val
+        return is_match, confidence
 
     def poll_for_template_match(
         template: np.ndarray,
@@ -776,12 +2008,15 @@ def _(
         log_context: str,
         timeout: float = 5.0,
         confidence_threshold: float = 0.90,
+        target_fps: int = CAPTURE_TARGET_FPS,
+        expected_after: float | None = None,
     ) -> None:
         """
         Manages the camera polling loop to wait for a visual match.
 
-        Starts a background capture thread and continuously checks the
-        specified screen region. It delegates the actual visual evaluation to
+        Reads the specified screen region from the persistent capture session
+        and continuously checks it. Frames whose region has not changed since the
+        last evaluated frame are skipped; the rest are delegated to
         `is_image_match`. The loop runs until a match exceeding the
         confidence threshold is found or the timeout is reached.
 
@@ -802,6 +2037,13 @@ def _(
         confidence_threshold : float, optional
             The minimum match value (0.0 to 1.0) required to register a
             success. Default is 0.90.
+        target_fps : int, optional
+            The highest evaluation rate in frames per second. Default is
+            `CAPTURE_TARGET_FPS`.
+        expected_after : float | None, optional
+            The approximate time in seconds after which the match is expected
+            to appear. Frames before that point are evaluated less often (see
+            `PollScheduler`). Default is None (evaluate every frame).
 
         Raises
         ------
@@ -809,53 +2051,885 @@ def _(
             If a match exceeding the confidence threshold is not found within
             the timeout period.
         """
-        logger.info(
-            f"Starting background capture thread: Polling for '{log_context}'..."
+        logger.info(f"Polling for '{log_context}'...")
+        # Only frames captured from now on are considered.
+        feed = capture_session.feed(region)
+        change_detector = FrameChangeDetector()
+        scheduler = PollScheduler(
+            timeout=timeout,
+            expected_after=expected_after,
+            min_interval=1.0 / target_fps,
         )
-        # Start a background camera thread to continuously capture frames.
-        camera.start(target_fps=10, region=region)
-        start_time = time.time()
+        # The gray buffer and template pyramid are reused for every frame.
+        gray = GrayFrame()
+        template_pyramid = build_template_pyramid(template)
 
-        # Use try-finally block to ensure the background camera thread is
-        # stopped even if an error occurs.
         highest_confidence_seen = 0.0
-        try:
-            while time.time() - start_time < timeout:
-                frame: np.ndarray | None = camera.get_latest_frame()
+        with feed, StepTimer(poll_step(log_context), timeout) as timer:
+            while not scheduler.expired:
+                # Blocks until the capture session delivers a new frame, so the
+                # loop runs at the capture rate without sleeping.
+                frame: np.ndarray | None = scheduler.next_frame(feed)
+
+                # An unchanged frame cannot match when the last one did not.
+                if frame is None or not change_detector.has_changed(frame):
+                    continue
 
-                if frame is not None and frame.max() > 0:
-                    is_match, confidence = is_image_match(
-                        frame=frame,
-                        template=template,
+                if frame.max() > 0:
+                    gray.load(frame)
+                    is_match, confidence, _ = find_template(
+                        gray.region(),
+                        template,
                         confidence_threshold=confidence_threshold,
+                        template_pyramid=template_pyramid,
                     )
 
                     if confidence > highest_confidence_seen:
                         highest_confidence_seen = confidence
 
                     if is_match:
+                        timer.max_confidence = confidence
                         logger.success(
                             f"Successfully matched '{log_context}'! (Confidence: {confidence:.2f})"
                         )
                         return
 
-                # Sync with the 10 FPS background camera thread to prevent
-                # redundant cv2 processing.
-                time.sleep(0.1)
-
+            timer.max_confidence = highest_confidence_seen
             logger.debug(
                 f"Polling for '{log_context}' timed out after {timeout} seconds "
                 f"(Max confidence seen: {highest_confidence_seen:.2f})."
             )
 
-            raise TemplateMatchTimeoutError(
-                f"Failed to match '{log_context}' within {timeout}s."
-            )
+            raise TemplateMatchTimeoutError(
+                f"Failed to match '{log_context}' within {timeout}s."
+            )
+
+    return is_image_match, poll_for_template_match
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Template Bank
+    #### `CompiledTemplate`
+    #### `TemplateBank`
+    """)
+    return
+
+
+@app.cell
+def _(
+    Executor,
+    GrayFrame,
+    NamedTuple,
+    TemplateConfig,
+    TemplateMatch,
+    Templates,
+    build_template_pyramid,
+    find_template,
+    np,
+):
+    class CompiledTemplate(NamedTuple):
+        """
+        Per-template data precomputed once when a `TemplateBank` is built.
+
+        Attributes
+        ----------
+        name : str
+            The key the template is registered under in the bank.
+        config : TemplateConfig
+            The source configuration (template, region, threshold).
+        pyramid : list[np.ndarray]
+            The template downscaled for each coarse matching level, where
+            index `i` holds the template halved `i` times.
+        """
+
+        name: str
+        config: TemplateConfig
+        pyramid: list[np.ndarray]
+
+    class TemplateBank:
+        """
+        A set of templates compiled for repeated matching against live frames.
+
+        Everything that depends only on the template (its coarse pyramid
+        levels and confidence threshold) is prepared once at construction.
+        Its mean, norm and spectrum are not: `cv2.matchTemplate` cannot take
+        them precomputed, and a normalized correlation built from a cached
+        spectrum and window sums measured 1.2-2x slower than it at every
+        region size the pipeline searches.
+        Matching a frame converts the searched part of it to grayscale once
+        and evaluates every requested template against views into that single
+        buffer, so watching another screen state adds one coarse-to-fine
+        search rather than another capture and color conversion.
+
+        Attributes
+        ----------
+        templates : dict[str, CompiledTemplate]
+            The compiled templates keyed by name.
+        max_pyramid_level : int
+            The deepest coarse matching level precomputed for each template.
+        """
+
+        def __init__(
+            self, configs: dict[str, TemplateConfig], max_pyramid_level: int = 3
+        ) -> None:
+            """
+            Compiles every configuration in `configs`.
+
+            Parameters
+            ----------
+            configs : dict[str, TemplateConfig]
+                The template configurations keyed by name.
+            max_pyramid_level : int, optional
+                The deepest coarse matching level to precompute. Default is 3.
+            """
+            self.max_pyramid_level = max_pyramid_level
+            self.templates = {
+                name: self._compile(name, config) for name, config in configs.items()
+            }
+
+        @classmethod
+        def from_templates(cls, namespace: type = Templates) -> "TemplateBank":
+            """Builds a bank from every `TemplateConfig` defined on `namespace`."""
+            return cls(
+                {
+                    name: config
+                    for name, config in vars(namespace).items()
+                    if isinstance(config, TemplateConfig)
+                }
+            )
+
+        def _compile(self, name: str, config: TemplateConfig) -> CompiledTemplate:
+            """Precomputes the matching data for a single template."""
+            pyramid = build_template_pyramid(config.template, self.max_pyramid_level)
+            return CompiledTemplate(name=name, config=config, pyramid=pyramid)
+
+        def __getitem__(self, name: str) -> CompiledTemplate:
+            return self.templates[name]
+
+        def __contains__(self, name: str) -> bool:
+            return name in self.templates
+
+        def match(
+            self,
+            frame: np.ndarray | GrayFrame,
+            names: list[str] | None = None,
+            executor: Executor | None = None,
+        ) -> dict[str, TemplateMatch]:
+            """
+            Evaluates templates against one full-screen frame.
+
+            Each template's search region is converted to grayscale at most
+            once per frame, directly into the frame's reusable gray buffer, and
+            the template is matched against a view into it. Regions shared by
+            several templates are therefore only converted once.
+
+            Parameters
+            ----------
+            frame : np.ndarray | GrayFrame
+                The full-screen BGRA frame to evaluate, or a `GrayFrame` that
+                has it loaded. Passing the same `GrayFrame` every poll avoids
+                allocating a gray buffer per frame.
+            names : list[str] | None, optional
+                The templates to evaluate. Default is None (all templates).
+            executor : Executor | None, optional
+                If given, templates are matched concurrently on its workers
+                (OpenCV releases the GIL while matching). Default is None
+                (match sequentially on the calling thread).
+
+            Returns
+            -------
+            dict[str, TemplateMatch]
+                The result for each requested template. Locations are in frame
+                coordinates.
+            """
+            if not isinstance(frame, GrayFrame):
+                gray = GrayFrame()
+                gray.load(frame)
+                frame = gray
+
+            names = list(names or self.templates)
+            # Convert every region up front so workers only read the buffer.
+            regions = [
+                frame.region(self.templates[name].config.region) for name in names
+            ]
+
+            if executor is None:
+                matches = map(self._match_region, names, regions)
+            else:
+                matches = executor.map(self._match_region, names, regions)
+
+            return dict(zip(names, matches))
+
+        def _match_region(self, name: str, gray_region: np.ndarray) -> TemplateMatch:
+            """Matches one template against its converted search region."""
+            template = self.templates[name]
+            left, top, _, _ = template.config.region
+            is_match, confidence, (x, y) = find_template(
+                gray_image=gray_region,
+                template=template.config.template,
+                confidence_threshold=template.config.confidence_threshold,
+                max_pyramid_level=self.max_pyramid_level,
+                template_pyramid=template.pyramid,
+            )
+
+            return TemplateMatch(is_match, confidence, (left + x, top + y))
+
+    template_bank = TemplateBank.from_templates(Templates)
+    return TemplateBank, template_bank
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Screen Classification
+    #### `classify_screen`
+    #### `wait_for_screen`
+    """)
+    return
+
+
+@app.cell
+def _(
+    FrameChangeDetector,
+    GrayFrame,
+    PollScheduler,
+    ScreenClassification,
+    ThreadPoolExecutor,
+    capture_session,
+    logger,
+    np,
+    os,
+    template_bank,
+):
+    # Templates are scored concurrently; matching runs in OpenCV with the GIL
+    # released, so a few workers cover every screen in the registry.
+    _classifier_pool = ThreadPoolExecutor(
+        max_workers=min(len(template_bank.templates), os.cpu_count() or 1),
+        thread_name_prefix="screen-classifier",
+    )
+
+    def classify_screen(
+        frame: np.ndarray | GrayFrame, candidates: list[str] | None = None
+    ) -> ScreenClassification:
+        """
+        Determines which known screen a single frame shows.
+
+        Every candidate from the `Templates` registry is scored against the
+        same frame in parallel, and the best match above its own confidence
+        threshold wins.
+
+        Parameters
+        ----------
+        frame : np.ndarray | GrayFrame
+            The full-screen BGRA frame to classify, or a `GrayFrame` that has
+            it loaded.
+        candidates : list[str] | None, optional
+            The `Templates` names to consider. Default is None (all of them).
+
+        Returns
+        -------
+        ScreenClassification
+            The best matching screen, if any, and every candidate's score.
+        """
+        scores = template_bank.match(frame, candidates, executor=_classifier_pool)
+        matched = {name: score for name, score in scores.items() if score.is_match}
+
+        if not matched:
+            return ScreenClassification(
+                None, max(score.confidence for score in scores.values()), scores
+            )
+
+        state = max(matched, key=lambda name: matched[name].confidence)
+        return ScreenClassification(state, matched[state].confidence, scores)
+
+    def wait_for_screen(
+        candidates: list[str] | None = None, timeout: float = 5.0
+    ) -> ScreenClassification:
+        """
+        Classifies new frames until one of the candidate screens is shown.
+
+        Unlike polling for each screen in turn, every frame is scored against
+        all candidates at once, so the answer is known from the first frame
+        that shows any of them. Frames that have not changed since the last
+        classification are skipped.
+
+        Parameters
+        ----------
+        candidates : list[str] | None, optional
+            The `Templates` names to consider. Default is None (all of them).
+        timeout : float, optional
+            The maximum time in seconds to wait for a recognized screen.
+            Default is 5.0 seconds.
+
+        Returns
+        -------
+        ScreenClassification
+            The first classification with a state, or, on timeout, the last
+            classification made (with a state of None).
+        """
+        feed = capture_session.feed(
+            watch=[
+                template_bank[name].config.region
+                for name in candidates or template_bank.templates
+            ]
+        )
+        change_detector = FrameChangeDetector()
+        gray = GrayFrame()
+        scheduler = PollScheduler(timeout=timeout)
+
+        classification = ScreenClassification(None, 0.0, {})
+        with feed:
+            while not scheduler.expired:
+                frame = scheduler.next_frame(feed)
+
+                if frame is None or not change_detector.has_changed(frame):
+                    continue
+
+                gray.load(frame)
+                classification = classify_screen(gray, candidates)
+
+                if classification.state is not None:
+                    logger.debug(
+                        f"Screen classified as '{classification.state}' "
+                        f"(Confidence: {classification.confidence:.2f})."
+                    )
+                    return classification
+
+        logger.debug(
+            f"No known screen recognized within {timeout} seconds "
+            f"(Max confidence seen: {classification.confidence:.2f})."
+        )
+        return classification
+
+    return classify_screen, wait_for_screen
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Screen Watchers
+    #### `ScreenWatchers`
+    """)
+    return
+
+
+@app.cell
+def _(
+    FrameChangeDetector,
+    GrayFrame,
+    ScreenEvent,
+    ScreenEventType,
+    TemplateBank,
+    ThreadPoolExecutor,
+    capture_session,
+    logger,
+    queue,
+    threading,
+    time,
+):
+    # Each watcher occupies one worker for as long as it runs.
+    _watcher_pool = ThreadPoolExecutor(
+        max_workers=8, thread_name_prefix="screen-watcher"
+    )
+
+    class ScreenWatchers:
+        """
+        Watches several templates on worker threads and publishes events.
+
+        Each watcher reads the shared capture session on its own thread,
+        skips frames whose region has not changed, and publishes a
+        `ScreenEvent` when its region changes and when its template appears
+        or disappears. The thread that drives the controller consumes those
+        events with `next_event`, so frames keep being inspected while it is
+        blocked sending inputs, and detection latency no longer depends on
+        controller rest times.
+
+        Use it as a context manager so every watcher is stopped on exit.
+
+        Attributes
+        ----------
+        bank : TemplateBank
+            The compiled templates that are watched.
+        names : list[str]
+            The names of the watched templates.
+        """
+
+        def __init__(
+            self,
+            bank: TemplateBank,
+            names: list[str] | None = None,
+            stop_check_interval: float = 0.1,
+        ) -> None:
+            """
+            Prepares one watcher per template.
+
+            Parameters
+            ----------
+            bank : TemplateBank
+                The compiled templates to watch.
+            names : list[str] | None, optional
+                The templates to watch. Default is None (all of them).
+            stop_check_interval : float, optional
+                The longest time in seconds a watcher waits for a frame before
+                checking whether it was stopped. Default is 0.1.
+            """
+            self.bank = bank
+            self.names = list(names or bank.templates)
+            self._stop_check_interval = stop_check_interval
+            self._events: queue.Queue[ScreenEvent] = queue.Queue()
+            self._stops = {name: threading.Event() for name in self.names}
+            self._futures = {}
+
+        def __enter__(self) -> "ScreenWatchers":
+            self.start()
+            return self
+
+        def __exit__(self, exc_type, exc, traceback) -> None:
+            self.stop()
+
+        def start(self) -> None:
+            """Starts a worker for every watched template."""
+            for name in self.names:
+                self._futures[name] = _watcher_pool.submit(self._watch, name)
+
+        def stop(self, name: str | None = None) -> None:
+            """
+            Stops one watcher, or all of them, and waits for them to exit.
+
+            Parameters
+            ----------
+            name : str | None, optional
+                The watcher to stop. Default is None (stop all watchers).
+            """
+            names = [name] if name is not None else list(self._futures)
+            for watched in names:
+                self._stops[watched].set()
+
+            for watched in names:
+                future = self._futures.pop(watched, None)
+                if future is not None:
+                    future.result()
+
+        def next_event(self, timeout: float | None = None) -> ScreenEvent | None:
+            """
+            Returns the next published event.
+
+            Parameters
+            ----------
+            timeout : float | None, optional
+                The maximum time in seconds to wait. Default is None (wait
+                indefinitely).
+
+            Returns
+            -------
+            ScreenEvent | None
+                The oldest unconsumed event, or None on timeout.
+            """
+            try:
+                return self._events.get(timeout=timeout)
+            except queue.Empty:
+                return None
+
+        def _publish(
+            self, name: str, event_type: ScreenEventType, confidence: float = 0.0
+        ) -> None:
+            self._events.put(
+                ScreenEvent(name, event_type, confidence, time.monotonic())
+            )
+
+        def _watch(self, name: str) -> None:
+            """Runs one watcher until it is stopped."""
+            stop = self._stops[name]
+            left, top, right, bottom = self.bank[name].config.region
+            feed = capture_session.feed(watch=[(left, top, right, bottom)])
+            change_detector = FrameChangeDetector()
+            gray = GrayFrame()
+            is_visible = False
+
+            try:
+                while not stop.is_set():
+                    frame = feed.get_latest_frame(timeout=self._stop_check_interval)
+
+                    if frame is None or not change_detector.has_changed(
+                        frame, region=(left, top, right, bottom)
+                    ):
+                        continue
+
+                    self._publish(name, ScreenEventType.CHANGED)
+
+                    if frame[top:bottom, left:right].max() == 0:
+                        continue
+
+                    gray.load(frame)
+                    match = self.bank.match(gray, names=[name])[name]
+
+                    if match.is_match != is_visible:
+                        is_visible = match.is_match
+                        event_type = (
+                            ScreenEventType.APPEARED
+                            if is_visible
+                            else ScreenEventType.DISAPPEARED
+                        )
+                        self._publish(name, event_type, match.confidence)
+            except Exception:
+                logger.exception(f"Screen watcher '{name}' failed.")
+                raise
+            finally:
+                feed.close()
+
+    return (ScreenWatchers,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Vision-Confirmed Inputs
+    #### `region_changes`
+    #### `template_appears`
+    #### `template_disappears`
+    #### `sequence_confirmed`
+    #### `tap_confirmed`
+    #### `hold_confirmed`
+    """)
+    return
+
+
+@app.cell
+def _(
+    Button,
+    ExpectedChange,
+    FrameChangeDetector,
+    GrayFrame,
+    InputStep,
+    PollScheduler,
+    TemplateConfig,
+    build_template_pyramid,
+    capture_session,
+    controller,
+    find_template,
+    logger,
+):
+    def region_changes(
+        region: tuple[int, int, int, int] | None = None,
+    ) -> ExpectedChange:
+        """Expects any visible change in `region` (None for full screen)."""
+        return ExpectedChange(region=region)
+
+    def template_appears(config: TemplateConfig) -> ExpectedChange:
+        """Expects the template of `config` to appear in its region."""
+        return ExpectedChange(
+            config.region, config.template, True, config.confidence_threshold
+        )
+
+    def template_disappears(config: TemplateConfig) -> ExpectedChange:
+        """Expects the template of `config` to disappear from its region."""
+        return ExpectedChange(
+            config.region, config.template, False, config.confidence_threshold
+        )
+
+    def sequence_confirmed(
+        steps: list[InputStep], expected: ExpectedChange, timeout: float
+    ) -> bool:
+        """
+        Sends an input sequence and waits until the screen confirms it.
+
+        A reference frame is read before the inputs are sent. Afterwards, only
+        frames that differ from it in the expected region are evaluated, and
+        the first one that shows the expected change ends the wait (once the
+        inputs themselves have finished playing).
+
+        Parameters
+        ----------
+        steps : list[InputStep]
+            The inputs to send.
+        expected : ExpectedChange
+            The change that confirms the inputs.
+        timeout : float
+            The longest time in seconds to wait after the sequence finishes
+            playing.
+
+        Returns
+        -------
+        bool
+            True if the change was seen, or False if `timeout` passed first.
+        """
+        feed = capture_session.feed(watch=[expected.region])
+        change_detector = FrameChangeDetector()
+        reference = feed.get_latest_frame(timeout=0.1)
+        if reference is not None:
+            change_detector.has_changed(reference, region=expected.region)
+
+        gray = GrayFrame()
+        template_pyramid = (
+            build_template_pyramid(expected.template)
+            if expected.template is not None
+            else None
+        )
+
+        sent = controller.sequence_async(steps)
+        scheduler = PollScheduler(
+            timeout=sum(step.action_time + step.rest_time for step in steps) + timeout
+        )
+        last_button = steps[-1].button.name
+
+        with feed:
+            while not scheduler.expired:
+                frame = scheduler.next_frame(feed)
+
+                if frame is None or not change_detector.has_changed(
+                    frame, region=expected.region
+                ):
+                    continue
+
+                if expected.template is not None:
+                    gray.load(frame)
+                    is_match, _, _ = find_template(
+                        gray.region(expected.region),
+                        expected.template,
+                        confidence_threshold=expected.confidence_threshold,
+                        template_pyramid=template_pyramid,
+                    )
+                    if is_match != expected.appears:
+                        continue
+
+                sent.result()
+                logger.debug(
+                    f"{last_button} confirmed on screen after {scheduler.elapsed:.2f}s."
+                )
+                return True
+
+            sent.result()
+            logger.debug(f"{last_button} not confirmed on screen within {timeout}s.")
+            return False
+
+    def tap_confirmed(
+        button: Button, expected: ExpectedChange, timeout: float | None = None
+    ) -> bool:
+        """
+        Taps a button and returns as soon as the screen shows its effect.
+
+        Parameters
+        ----------
+        button : Button
+            The specific button to tap.
+        expected : ExpectedChange
+            The change that confirms the tap (see `region_changes`,
+            `template_appears` and `template_disappears`).
+        timeout : float | None, optional
+            The longest time in seconds to wait after the release, i.e. the
+            fixed rest time this replaces. Falls back to the controller's
+            `DEFAULT_REST_TIME` if None.
+
+        Returns
+        -------
+        bool
+            True if the change was seen, or False if the timeout passed first.
+        """
+        actual_timeout = (
+            timeout if timeout is not None else controller.DEFAULT_REST_TIME
+        )
+        return sequence_confirmed(
+            [controller.tap_step(button, rest_time=0.0)], expected, actual_timeout
+        )
+
+    def hold_confirmed(
+        button: Button, expected: ExpectedChange, timeout: float | None = None
+    ) -> bool:
+        """
+        Holds a button and returns as soon as the screen shows its effect.
+
+        Parameters
+        ----------
+        button : Button
+            The specific button to hold.
+        expected : ExpectedChange
+            The change that confirms the hold (see `region_changes`,
+            `template_appears` and `template_disappears`).
+        timeout : float | None, optional
+            The longest time in seconds to wait after the release, i.e. the
+            fixed rest time this replaces. Falls back to the controller's
+            `DEFAULT_REST_TIME` if None.
+
+        Returns
+        -------
+        bool
+            True if the change was seen, or False if the timeout passed first.
+        """
+        actual_timeout = (
+            timeout if timeout is not None else controller.DEFAULT_REST_TIME
+        )
+        return sequence_confirmed(
+            [controller.hold_step(button, rest_time=0.0)], expected, actual_timeout
+        )
+
+    return (
+        hold_confirmed,
+        region_changes,
+        sequence_confirmed,
+        tap_confirmed,
+        template_appears,
+        template_disappears,
+    )
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Input Macros
+    #### `compile_macro`
+    #### `run_macro`
+    #### `record_macro`
+    """)
+    return
+
+
+@app.cell
+def _(
+    CompiledMacro,
+    ExpectedChange,
+    MacroSyntaxError,
+    MacroTiming,
+    Path,
+    StepTimer,
+    TemplateConfig,
+    Templates,
+    controller,
+    logger,
+    macros,
+    region_changes,
+    sequence_confirmed,
+    template_appears,
+    template_disappears,
+    time,
+):
+    def _parse_checkpoint(words: list[str], line_number: int) -> ExpectedChange:
+        """Parses the arguments of an `expect` statement."""
+        kind = words[1] if len(words) > 1 else None
+
+        if kind == "change":
+            if len(words) == 2:
+                return region_changes()
+            try:
+                left, top, right, bottom = (int(v) for v in words[2].split(","))
+            except ValueError as e:
+                raise MacroSyntaxError(
+                    f"Line {line_number}: expected a region as left,top,right,bottom."
+                ) from e
+            return region_changes((left, top, right, bottom))
+
+        if kind in ("appears", "disappears") and len(words) == 3:
+            config = getattr(Templates, words[2], None)
+            if not isinstance(config, TemplateConfig):
+                raise MacroSyntaxError(
+                    f"Line {line_number}: unknown template '{words[2]}'."
+                )
+            if kind == "appears":
+                return template_appears(config)
+            return template_disappears(config)
+
+        raise MacroSyntaxError(
+            f"Line {line_number}: expected 'expect change [region]' or "
+            "'expect appears|disappears <TEMPLATE>'."
+        )
+
+    # Macros are compiled and recorded with the controller's own timings.
+    _MACRO_TIMING = MacroTiming(
+        tap_time=controller.DEFAULT_TAP_TIME,
+        hold_time=controller.DEFAULT_HOLD_TIME,
+        rest_time=controller.DEFAULT_REST_TIME,
+    )
+
+    def compile_macro(text: str, name: str = "macro") -> CompiledMacro:
+        """
+        Compiles a macro for `controller`, with `Templates` checkpoints.
+
+        See `cfb_analysis.macros.compile_macro` for the text format.
+
+        Parameters
+        ----------
+        text : str
+            The macro source.
+        name : str, optional
+            The name runs are timed under. Default is "macro".
+
+        Returns
+        -------
+        CompiledMacro
+            The compiled macro.
+
+        Raises
+        ------
+        MacroSyntaxError
+            If a line cannot be parsed.
+        """
+        return macros.compile_macro(text, _MACRO_TIMING, _parse_checkpoint, name)
+
+    def run_macro(macro: CompiledMacro) -> list[bool]:
+        """
+        Plays a compiled macro.
+
+        A checkpoint that is not confirmed within its timeout does not stop
+        the macro; the results let the caller decide what that means.
+
+        Parameters
+        ----------
+        macro : CompiledMacro
+            The macro to play.
+
+        Returns
+        -------
+        list[bool]
+            Whether each checkpoint was confirmed, in order.
+        """
+        logger.debug(f"Running macro '{macro.name}'...")
+        confirmations = []
+
+        with StepTimer(f"macro[{macro.name}]"):
+            for segment in macro.segments:
+                if segment.delay:
+                    time.sleep(segment.delay)
+
+                if segment.checkpoint is None:
+                    controller.sequence(segment.steps)
+                else:
+                    confirmations.append(
+                        sequence_confirmed(
+                            segment.steps, segment.checkpoint, segment.timeout
+                        )
+                    )
+
+        return confirmations
+
+    def record_macro(
+        log_path: Path, phase: str | None = None, min_wait: float = 0.05
+    ) -> str:
+        """
+        Reconstructs the macro text of the inputs recorded in a session log.
+
+        See `cfb_analysis.macros.record_macro`.
+
+        Parameters
+        ----------
+        log_path : Path
+            A pipeline log file written with `CFB_LOG_FILE_LEVEL=TRACE` (see
+            `_configure_logging`).
+        phase : str | None, optional
+            Only record inputs logged in this phase (e.g. "launch"). Default
+            is None (all phases).
+        min_wait : float, optional
+            Idle gaps shorter than this many seconds are dropped. Default is
+            0.05.
 
-        finally:
-            camera.stop()
+        Returns
+        -------
+        str
+            The macro text, which `compile_macro` accepts.
+        """
+        return macros.record_macro(log_path, _MACRO_TIMING, phase, min_wait)
 
-    return (poll_for_template_match,)
+    return compile_macro, record_macro, run_macro
 
 
 @app.cell(hide_code=True)
@@ -876,10 +2950,24 @@ def _(
     Button,
     TemplateConfig,
     TemplateMatchTimeoutError,
+    Templates,
+    compile_macro,
     controller,
+    hold_confirmed,
     logger,
     poll_for_template_match,
+    run_macro,
+    template_appears,
 ):
+    _CLOSE_ACTIVE_GAME = compile_macro(
+        """
+        OPTIONS rest=0
+        expect change timeout=0.5   # the options menu opens
+        CROSS rest=3.0              # closing the game shows no matchable cue
+        """,
+        name="close_active_game",
+    )
+
     def focus_first_game_tile() -> None:
         """Move PS5 home screen cursor from welcome tile to first game tile."""
         logger.info("Moving from welcome tile to the first game tile...")
@@ -919,7 +3007,11 @@ def _(
     def return_to_home_screen() -> None:
         """Force PS5 to return to the home screen by holding the PS button."""
         logger.info("Holding PS button to return to the home screen...")
-        controller.hold(Button.PS, rest_time=1.0)
+        # Done once the settings icon shows up, or after the former fixed rest
+        # if the home screen was already showing.
+        hold_confirmed(
+            Button.PS, template_appears(Templates.PS5_SETTINGS_ICON), timeout=1.0
+        )
 
     def close_active_game() -> None:
         """
@@ -930,8 +3022,7 @@ def _(
         for closing the game.
         """
         logger.info("Executing sequence to close the active game...")
-        controller.tap(Button.OPTIONS, rest_time=0.5)
-        controller.tap(Button.CROSS, rest_time=3.0)
+        run_macro(_CLOSE_ACTIVE_GAME)
 
     return (
         close_active_game,
@@ -959,15 +3050,20 @@ def _(
     ChiakiExecutableNotFoundError,
     ChiakiFullscreenError,
     ChiakiWindowNotFoundError,
+    IS_LIVE_CAPTURE,
     PS5SettingsIconNotFoundError,
     Path,
+    PollScheduler,
     TemplateConfig,
     TemplateMatchTimeoutError,
     WINDOW_TITLE,
     logger,
     poll_for_template_match,
+    poll_step,
     subprocess,
     time,
+    timed_step,
+    timeout_policy,
     win32api,
     win32con,
     win32gui,
@@ -992,7 +3088,8 @@ def _(
         subprocess.Popen([chiaki_path])
         logger.debug(f"Executed subprocess: {chiaki_path}")
 
-    def _find_and_focus_window(window_title: str) -> int:
+    @timed_step(timeout_errors=(ChiakiWindowNotFoundError,))
+    def _find_and_focus_window(window_title: str, timeout: float = 30.0) -> int:
         """
         Finds and readies the `window_title` window.
 
@@ -1003,6 +3100,9 @@ def _(
         ----------
         window_title : str
             The exact title of the window to search for.
+        timeout : float, optional
+            The maximum time in seconds to wait for the window. Default is
+            30.0 seconds.
 
         Returns
         -------
@@ -1014,16 +3114,16 @@ def _(
         ChiakiWindowNotFoundError
             If the window is not found or visible within the timeout period.
         """
-        timeout = 30.0
-        start_time = time.time()
+        # FindWindow is cheap, so poll it more often than frames are checked.
+        scheduler = PollScheduler(timeout=timeout, min_interval=0.02)
 
         logger.info(f"Polling OS for window '{window_title}' (Timeout: {timeout}s)...")
 
-        while time.time() - start_time < timeout:
+        while not scheduler.expired:
             hwnd = win32gui.FindWindow(None, window_title)
 
             if hwnd and win32gui.IsWindowVisible(hwnd):
-                elapsed = round(time.time() - start_time, 2)
+                elapsed = round(scheduler.elapsed, 2)
                 logger.success(
                     f"Window '{window_title}' found and visible after {elapsed}s."
                 )
@@ -1033,12 +3133,13 @@ def _(
 
             # Pause briefly to prevent CPU thrashing while polling the OS for
             # the window.
-            time.sleep(0.1)
+            scheduler.pause()
 
         raise ChiakiWindowNotFoundError(
             f"Window '{window_title}' failed to launch within the timeout period."
         )
 
+    @timed_step(timeout_errors=())
     def _ensure_fullscreen(hwnd: int, max_attempts: int = 3) -> None:
         """
         Verifies the window is in true full screen and attempts to correct it
@@ -1109,6 +3210,7 @@ def _(
 
         raise ChiakiFullscreenError("chiaki-ng fullscreen correction failed.")
 
+    @timed_step(timeout_errors=(PS5SettingsIconNotFoundError,))
     def launch_ps5(target_config: TemplateConfig) -> None:
         """
         Executes the startup sequence to establish a remote play connection.
@@ -1137,13 +3239,18 @@ def _(
             If forcing the chiaki-ng window into fullscreen mode fails.
         PS5SettingsIconNotFoundError
             If the PS5 settings icon is not detected on the screen within the
-            45.0-second polling timeout (e.g., if a game was left unclosed
-            and the console did not boot to the home screen).
+            polling timeout from `timeout_policy` (e.g., if a game was left
+            unclosed and the console did not boot to the home screen).
         """
-        _launch_chiaki_process()
-        hwnd = _find_and_focus_window(window_title=WINDOW_TITLE)
-        # Force full screen before initiating any template matching
-        _ensure_fullscreen(hwnd)
+        # Replayed and simulated sessions have no chiaki-ng window.
+        if IS_LIVE_CAPTURE:
+            _launch_chiaki_process()
+            hwnd = _find_and_focus_window(
+                window_title=WINDOW_TITLE,
+                timeout=timeout_policy.timeout("_find_and_focus_window"),
+            )
+            # Force full screen before initiating any template matching
+            _ensure_fullscreen(hwnd)
 
         try:
             # Check to see if the PS5 homescreen is showing.
@@ -1151,7 +3258,7 @@ def _(
                 template=target_config.template,
                 region=target_config.region,
                 log_context=target_config.log_context,
-                timeout=45.0,
+                timeout=timeout_policy.timeout(poll_step(target_config.log_context)),
             )
         except TemplateMatchTimeoutError as e:
             logger.warning("Settings icon not found. A game may have been left open.")
@@ -1166,6 +3273,7 @@ def _(
 def _(mo):
     mo.md(r"""
     ### Launch CFB Functions
+    #### `_locate_game_tile`
     #### `launch_cfb_game`
     """)
     return
@@ -1175,19 +3283,75 @@ def _(mo):
 def _(
     Button,
     CFBGameTitleNotFoundError,
+    GrayFrame,
+    HOME_TILE_ROW,
     TemplateConfig,
     TemplateMatchTimeoutError,
+    capture_session,
     controller,
+    find_template,
     logger,
     poll_for_template_match,
+    poll_step,
+    timed_step,
+    timeout_policy,
 ):
+    def _locate_game_tile(target_config: TemplateConfig) -> int | None:
+        """
+        Finds the target game's tile in the recent games row.
+
+        Captures the row's title labels once and searches them for the
+        game's title template. The x position of the match gives the tile.
+
+        Parameters
+        ----------
+        target_config : TemplateConfig
+            The configuration holding the game's title template.
+
+        Returns
+        -------
+        int | None
+            The number of DPAD_RIGHT taps from the first game tile to the
+            target tile, or None if the title was not found in the row.
+        """
+        tile_row = HOME_TILE_ROW.scaled(capture_session.resolution)
+
+        with capture_session.feed(tile_row.region) as feed:
+            frame = feed.get_latest_frame(timeout=1.0)
+
+        if frame is None:
+            return None
+
+        gray = GrayFrame()
+        gray.load(frame)
+        is_match, confidence, (x, _) = find_template(
+            gray.region(),
+            target_config.template,
+            confidence_threshold=target_config.confidence_threshold,
+        )
+
+        if not is_match:
+            logger.debug(
+                f"Game title not found in the tile row (Max confidence: {confidence:.2f})."
+            )
+            return None
+
+        return tile_row.tile_index(tile_row.region[0] + x)
+
+    @timed_step(timeout_errors=(CFBGameTitleNotFoundError,))
     def launch_cfb_game(target_config: TemplateConfig) -> None:
         """
         Navigates the PS5 home screen to find and launch CFB.
 
-        Iterates through the recent games list on the PS5 home screen, checking
-        each game tile's title against the provided template configuration. If
-        found, it launches the game.
+        The recent games row is captured once and searched for the game's
+        title, and the cursor is moved straight to its tile with one burst
+        of taps. If the title is not in the row, or the title shown after
+        the burst does not match, it iterates through the recent games list
+        instead, checking each game tile's title against the provided
+        template configuration. If found, it launches the game.
+
+        Expects the first game tile to be focused (see
+        `focus_first_game_tile`).
 
         Parameters
         ----------
@@ -1202,6 +3366,37 @@ def _(
             the specified maximum number of attempts.
         """
         max_attempts = 10
+        title_timeout = timeout_policy.timeout(poll_step(target_config.log_context))
+
+        tile_index = _locate_game_tile(target_config)
+        if tile_index is not None:
+            logger.debug(f"Game title located {tile_index} tile(s) to the right.")
+            controller.sequence(
+                [
+                    controller.tap_step(Button.DPAD_RIGHT, rest_time=0.1)
+                    for _ in range(tile_index)
+                ]
+            )
+
+            try:
+                poll_for_template_match(
+                    template=target_config.template,
+                    region=target_config.region,
+                    log_context=target_config.log_context,
+                    timeout=title_timeout,
+                )
+            except TemplateMatchTimeoutError:
+                logger.debug("Row scan landed on the wrong title. Scanning per tile...")
+                controller.sequence(
+                    [
+                        controller.tap_step(Button.DPAD_LEFT, rest_time=0.1)
+                        for _ in range(tile_index)
+                    ]
+                )
+            else:
+                logger.success("Target game located. Launching...")
+                controller.tap(Button.CROSS)
+                return
 
         for attempt in range(max_attempts):
             logger.debug(f"Evaluating game title {attempt + 1}...")
@@ -1211,184 +3406,770 @@ def _(
                     template=target_config.template,
                     region=target_config.region,
                     log_context=target_config.log_context,
-                    timeout=3.0,
+                    timeout=title_timeout,
                 )
             except TemplateMatchTimeoutError:
                 logger.debug("Target game not found. Shifting to next title...")
                 controller.tap(Button.DPAD_RIGHT)
                 continue
 
-            logger.success("Target game located. Launching...")
-            controller.tap(Button.CROSS)
-            return
+            logger.success("Target game located. Launching...")
+            controller.tap(Button.CROSS)
+            return
+
+        raise CFBGameTitleNotFoundError(
+            f"Target game could not be located after {max_attempts} title shifts."
+        )
+
+    return (launch_cfb_game,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Launch Dynasty Functions
+    #### `_poll_main_menu_with_interrupts`
+    #### `launch_dynasty`
+    #### `navigate_to_rosters`
+    #### `ensure_live_layout_measured`
+    """)
+    return
+
+
+@app.cell
+def _(
+    Button,
+    CFBMainMenuState,
+    HotfixAppliedError,
+    IS_SIMULATED,
+    LiveLayoutNotMeasuredError,
+    PollScheduler,
+    ROSTER_TABLE,
+    ROSTER_TABLE_MEASURED,
+    RosterPageTimeoutError,
+    RosterTable,
+    ScreenEventType,
+    ScreenWatchers,
+    StabilizationWindow,
+    StepTimer,
+    TemplateBank,
+    TemplateConfig,
+    TemplateFileNotFoundError,
+    TemplateMatchTimeoutError,
+    Templates,
+    capture_session,
+    controller,
+    logger,
+    region_changes,
+    tap_confirmed,
+    template_disappears,
+    timed_step,
+    timeout_policy,
+    timing_store,
+):
+    @timed_step()
+    def _poll_main_menu_with_interrupts(
+        main_menu_config: TemplateConfig,
+        hotfix_overlay_config: TemplateConfig,
+        timeout: float = 60.0,
+        false_negative_budget: float = 0.02,
+    ) -> CFBMainMenuState:
+        """
+        Polls for the main menu while dismissing pop-ups and checking for hotfixes.
+
+        This function actively captures the screen to identify either the top-half
+        main menu template or a hotfix overlay. It continuously taps the circle
+        button to dismiss "Featured News" or "Press any button" prompts until the
+        main menu is found. Once the main menu is detected, it enters a brief
+        stabilization phase to ensure a delayed hotfix overlay does not appear,
+        which ends early once recorded history shows a late overlay is
+        unlikely.
+
+        Parameters
+        ----------
+        top_menu_config : TemplateConfig
+            The configuration object containing the visual template and capture
+            region for a stable main menu UI element.
+        hotfix_config : TemplateConfig
+            The configuration object containing the visual template and capture
+            region for the hotfix overlay "Yes/No" button prompt.
+        timeout : float, optional
+            The maximum time in seconds to poll for the menu or hotfix before
+            timing out. Default is 60.0.
+        false_negative_budget : float, optional
+            The accepted probability of ending stabilization before a late
+            hotfix overlay appears (see `StabilizationWindow`). Default is
+            0.02.
+
+        Returns
+        -------
+        MenuState
+            The final evaluated state of the UI, returning either MAIN_MENU or
+            HOTFIX.
+
+        Raises
+        ------
+        TemplateMatchTimeoutError
+            If neither the main menu nor the hotfix overlay is detected within
+            the specified timeout period.
+        """
+        logger.info("Polling for CFB main menu while handling potential pop-ups...")
+
+        # Compile both targets once; each is watched on its own thread.
+        bank = TemplateBank(
+            {
+                "HOTFIX": hotfix_overlay_config,
+                # Lowered for potential dimming.
+                "MAIN_MENU": main_menu_config._replace(confidence_threshold=0.80),
+            }
+        )
+
+        scheduler = PollScheduler(timeout=timeout)
+        stabilization: StabilizationWindow | None = None
+        # Time left before CIRCLE is tapped again.
+        tap_rest: PollScheduler | None = None
+
+        # The watchers inspect frames on their own threads, so a hotfix is
+        # seen while a tap is still in flight; this loop only reacts.
+        with ScreenWatchers(bank) as watchers:
+            while not scheduler.expired:
+                if stabilization is None and (tap_rest is None or tap_rest.expired):
+                    # Keep mashing CIRCLE to get to the main menu.
+                    controller.tap_async(Button.CIRCLE, rest_time=0.0)
+                    tap_rest = PollScheduler(timeout=1.0)
+
+                # While stabilizing, wake up regularly to check whether the
+                # window has settled even if no events arrive.
+                wait = tap_rest.remaining if stabilization is None else 0.1
+                event = watchers.next_event(timeout=min(wait, scheduler.remaining))
+
+                if event is not None and event.name == "HOTFIX":
+                    if event.type == ScreenEventType.APPEARED:
+                        logger.warning(
+                            f"Hotfix overlay detected! (Confidence: {event.confidence:.2f})"
+                        )
+                        if stabilization is not None:
+                            # Record how late the overlay arrived so future
+                            # stabilization windows can end sooner safely.
+                            stabilization.record_arrival(event.confidence, timing_store)
+                        return CFBMainMenuState.HOTFIX
+
+                    if stabilization is not None:
+                        stabilization.observe(event.type == ScreenEventType.CHANGED)
+
+                elif (
+                    event is not None
+                    and event.name == "MAIN_MENU"
+                    and event.type == ScreenEventType.APPEARED
+                    and stabilization is None
+                ):
+                    logger.info(
+                        f"CFB main menu located! (Confidence: {event.confidence:.2f}). Stabilizing..."
+                    )
+                    # Only the hotfix overlay is still of interest.
+                    watchers.stop("MAIN_MENU")
+                    stabilization = StabilizationWindow.from_history(
+                        timeout_policy.timeout("main_menu_stabilization"),
+                        timing_store,
+                        false_negative_budget=false_negative_budget,
+                    )
+
+                # Wait until a late hotfix overlay is unlikely to slide in.
+                if stabilization is not None and stabilization.is_settled:
+                    logger.success(
+                        f"CFB main menu stabilized after {stabilization.elapsed:.1f}s. "
+                        "No hotfix overlays detected."
+                    )
+                    stabilization.record_no_arrival(timing_store)
+                    return CFBMainMenuState.MAIN_MENU
+
+        raise TemplateMatchTimeoutError(
+            "Failed to reach CFB main menu within the timeout."
+        )
+
+    @timed_step()
+    def launch_dynasty(
+        top_menu_config: TemplateConfig | None, hotfix_config: TemplateConfig | None
+    ) -> None:
+        """
+        Navigates to the Dynasty mode hub, handling potential hotfixes.
+
+        This function coordinates the transition from the initial load screen
+        to the main menu. It evaluates the current menu state via the polling
+        function. If a hotfix overlay is detected, it selects "No" to dismiss
+        the prompt and raises an error to trigger a clean pipeline restart.
+        Otherwise it opens Dynasty mode and waits for the main menu to leave
+        the screen.
+
+        Parameters
+        ----------
+        top_menu_config : TemplateConfig | None
+            The configuration object containing the visual template and capture
+            region for the top-half main menu target, e.g.
+            `Templates.CFB_MAIN_MENU`.
+        hotfix_config : TemplateConfig | None
+            The configuration object containing the visual template and capture
+            region for the hotfix overlay target, e.g.
+            `Templates.CFB_HOTFIX_OVERLAY`.
+
+        Raises
+        ------
+        TemplateFileNotFoundError
+            If either template is None because its asset does not exist yet.
+        HotfixAppliedError
+            If a hotfix overlay is detected and dismissed, signaling the error
+            router to restart the game.
+        TemplateMatchTimeoutError
+            If the main menu is still shown after selecting Dynasty.
+        """
+        if top_menu_config is None or hotfix_config is None:
+            raise TemplateFileNotFoundError(
+                "Critical: The CFB main menu and hotfix overlay templates are "
+                "missing; cut them from a live screen before launching Dynasty."
+            )
+
+        logger.info("Executing sequence to reach Dynasty mode...")
+
+        menu_state = _poll_main_menu_with_interrupts(
+            main_menu_config=top_menu_config,
+            hotfix_overlay_config=hotfix_config,
+            timeout=timeout_policy.timeout("_poll_main_menu_with_interrupts"),
+        )
+
+        if menu_state == CFBMainMenuState.HOTFIX:
+            logger.info(
+                "Hotfix overlay detected. Selecting 'No' to dismiss and force restart..."
+            )
+            controller.tap(Button.CROSS, rest_time=2.0)
+
+            # Throw the error so the router can close and relaunch the game.
+            raise HotfixAppliedError("Hotfix dismissed. Game requires a clean restart.")
+
+        logger.info("Entering Dynasty mode...")
+        timeout = timeout_policy.timeout("enter_dynasty")
+
+        with StepTimer("enter_dynasty", timeout):
+            # Assumes the menu opens on the last played Dynasty save, as the
+            # simulator models it; confirm on a live screen once the menu
+            # templates are cut.
+            if not tap_confirmed(
+                Button.CROSS, template_disappears(top_menu_config), timeout
+            ):
+                raise TemplateMatchTimeoutError(
+                    f"The CFB main menu was still shown {timeout:.1f}s after "
+                    "selecting Dynasty."
+                )
+
+        logger.success("Entered Dynasty mode.")
+
+    @timed_step()
+    def navigate_to_rosters(table: RosterTable = ROSTER_TABLE) -> None:
+        """
+        Opens the View Rosters screen from the Dynasty hub.
+
+        The navigation is only confirmed once the player table starts
+        changing, so extraction never starts on the wrong screen.
+
+        Parameters
+        ----------
+        table : RosterTable, optional
+            The table geometry at `REFERENCE_RESOLUTION`. Default is
+            `ROSTER_TABLE`.
+
+        Raises
+        ------
+        LiveLayoutNotMeasuredError
+            If the run is not simulated, since only the simulated hub's path
+            to View Rosters is known so far.
+        RosterPageTimeoutError
+            If the roster table does not appear within the "open_rosters"
+            timeout.
+        """
+        if not IS_SIMULATED:
+            raise LiveLayoutNotMeasuredError(
+                "The path from the Dynasty hub to View Rosters is only known "
+                "for the simulator; record the live menu path first."
+            )
+
+        logger.info("Opening View Rosters...")
+        table = table.scaled(capture_session.resolution)
+        timeout = timeout_policy.timeout("open_rosters")
+
+        with StepTimer("open_rosters", timeout, (RosterPageTimeoutError,)):
+            # Triangle is the simulated hub's roster shortcut.
+            if not tap_confirmed(
+                Button.TRIANGLE, region_changes(table.region), timeout
+            ):
+                raise RosterPageTimeoutError(
+                    f"The roster table did not appear within {timeout:.1f}s."
+                )
+
+        logger.success("View Rosters opened.")
+
+    def ensure_live_layout_measured() -> None:
+        """
+        Checks that a run can get past the CFB launch on this capture source.
+
+        The simulator draws its own main menu and hotfix overlay templates,
+        and its hub and roster table follow the layout in `ROSTER_TABLE`.
+        Any other run needs those cut and measured from the real screens
+        first, so it stops here instead of partway through a launch.
+
+        Raises
+        ------
+        LiveLayoutNotMeasuredError
+            If the run is not simulated and a CFB template, the path to View
+            Rosters or the roster table layout is still missing.
+        """
+        if IS_SIMULATED:
+            return
+
+        missing = ["the Dynasty hub's path to View Rosters"]
+        if Templates.CFB_MAIN_MENU is None or Templates.CFB_HOTFIX_OVERLAY is None:
+            missing.append("the CFB main menu and hotfix overlay templates")
+        if not ROSTER_TABLE_MEASURED:
+            missing.append("the View Rosters table layout (`ROSTER_TABLE_MEASURED`)")
+
+        raise LiveLayoutNotMeasuredError(
+            f"Live runs still need: {'; '.join(missing)}. Measure them with "
+            "`preview_capture`, or run with CFB_CAPTURE_SOURCE=simulator."
+        )
+
+    return ensure_live_layout_measured, launch_dynasty, navigate_to_rosters
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Glyph OCR
+    #### `roster_glyph_bank`
+    """)
+    return
+
+
+@app.cell
+def _(GLYPH_DIR, GlyphBank, capture_session, console_simulator, logger):
+    # Glyphs only match cells captured at the resolution they were cut at.
+    _width, _height = capture_session.resolution
+    _glyph_dir = GLYPH_DIR / f"{_width}x{_height}"
+
+    if console_simulator is not None:
+        roster_glyph_bank = GlyphBank.from_samples(
+            console_simulator.glyph_samples(resolution=capture_session.resolution)
+        )
+    elif _glyph_dir.is_dir():
+        roster_glyph_bank = GlyphBank.load(_glyph_dir)
+    else:
+        roster_glyph_bank = None
+        logger.warning(
+            f"No roster glyphs in {_glyph_dir}; roster cells will not be read."
+        )
+    return (roster_glyph_bank,)
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Roster Extraction
+    #### `RosterPipeline`
+    #### `extract_roster`
+    """)
+    return
+
+
+@app.cell
+def _(
+    FrameChangeDetector,
+    GlyphBank,
+    Path,
+    PlayerRecord,
+    PollScheduler,
+    ROSTER_DIR,
+    ROSTER_TABLE,
+    RegionFeed,
+    RosterExtraction,
+    RosterKey,
+    RosterPageTimeoutError,
+    RosterPageTiming,
+    RosterTable,
+    StepTimer,
+    capture_session,
+    cv2,
+    datetime,
+    logger,
+    np,
+    os,
+    queue,
+    read_roster_page,
+    region_changes,
+    roster_glyph_bank,
+    roster_key,
+    roster_store,
+    segment_roster_page,
+    tap_confirmed,
+    threading,
+    time,
+    timeout_policy,
+    write_roster_records,
+):
+    def _wait_for_settled_page(
+        feed: RegionFeed, table: RosterTable, timeout: float, quiet_frames: int
+    ) -> list[dict[str, np.ndarray]]:
+        """
+        Returns the table's cells once the page has stopped changing.
+
+        A page counts as settled after `quiet_frames` consecutive frames
+        without a change and with at least one player row, so the blank or
+        half-drawn table shown while a page slides in is never read.
+
+        Raises
+        ------
+        RosterPageTimeoutError
+            If the table does not settle within `timeout` seconds.
+        """
+        change_detector = FrameChangeDetector()
+        scheduler = PollScheduler(timeout=timeout)
+        quiet = 0
+
+        while not scheduler.expired:
+            frame = scheduler.next_frame(feed)
+
+            if frame is None:
+                continue
+
+            if change_detector.has_changed(frame):
+                quiet = 0
+                continue
+
+            quiet += 1
+            if quiet < quiet_frames:
+                continue
+
+            rows = segment_roster_page(cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY), table)
+            if rows:
+                return rows
+
+        raise RosterPageTimeoutError(
+            f"The roster table did not settle within {timeout}s."
+        )
+
+    class RosterPipeline:
+        """
+        Reads and writes roster pages in the background of the navigation.
+
+        Pages handed to `submit` go through a bounded queue to a pool of
+        recognition workers. The players they read go through a second
+        bounded queue to a writer thread, which appends them to a JSON Lines
+        file in batches. The navigating thread therefore only waits when
+        `queue_size` pages are already waiting to be read, and the workers
+        keep reading while the console is still turning pages.
+
+        Use it as a context manager: leaving the block waits for every
+        submitted page to be read and written, and re-raises the first error
+        a worker or the writer hit.
+
+        Attributes
+        ----------
+        glyph_bank : GlyphBank | None
+            The glyphs cells are read with, or None to keep cells as images.
+        path : Path | None
+            The JSON Lines file players are appended to, or None to not
+            write them.
+        batch_size : int
+            The number of players written at a time.
+        """
+
+        def __init__(
+            self,
+            glyph_bank: GlyphBank | None,
+            path: Path | None,
+            workers: int = max(1, min(4, (os.cpu_count() or 1) - 1)),
+            queue_size: int = 4,
+            batch_size: int = 32,
+        ) -> None:
+            self.glyph_bank = glyph_bank
+            self.path = path
+            self.batch_size = batch_size
+            self.players: list[PlayerRecord] = []
+            self.recognition_times: dict[int, float] = {}
+            self._pages: queue.Queue = queue.Queue(maxsize=queue_size)
+            self._records: queue.Queue = queue.Queue(maxsize=queue_size)
+            self._errors: list[BaseException] = []
+            self._workers = [
+                threading.Thread(
+                    target=self._recognize, name=f"roster-reader-{i}", daemon=True
+                )
+                for i in range(workers)
+            ]
+            self._writer = threading.Thread(
+                target=self._write, name="roster-writer", daemon=True
+            )
+
+        def __enter__(self) -> "RosterPipeline":
+            for thread in (*self._workers, self._writer):
+                thread.start()
+            return self
 
-        raise CFBGameTitleNotFoundError(
-            f"Target game could not be located after {max_attempts} title shifts."
-        )
+        def __exit__(self, *exc_info) -> None:
+            for _ in self._workers:
+                self._pages.put(None)
+            for worker in self._workers:
+                worker.join()
 
-    return (launch_cfb_game,)
+            self._records.put(None)
+            self._writer.join()
 
+            self.players.sort(key=lambda player: (player.page, player.row))
+            if self._errors and exc_info[0] is None:
+                raise self._errors[0]
 
-@app.cell(hide_code=True)
-def _(mo):
-    mo.md(r"""
-    ### Launch Dynasty Functions
-    #### `_poll_main_menu_with_interrupts`
-    #### `launch_dynasty`
-    """)
-    return
+        def submit(self, page: int, rows: list[dict[str, np.ndarray]]) -> None:
+            """
+            Queues one page of cells to be read and written.
 
+            Parameters
+            ----------
+            page : int
+                The roster page, starting at 0.
+            rows : list[dict[str, np.ndarray]]
+                The page's cells, as returned by `segment_roster_page`.
+            """
+            if self._errors:
+                raise self._errors[0]
+            self._pages.put((page, rows))
+
+        def _recognize(self) -> None:
+            """Reads queued pages until told to stop."""
+            while (item := self._pages.get()) is not None:
+                page, rows = item
+                try:
+                    started = time.perf_counter()
+                    records = read_roster_page(page, rows, self.glyph_bank)
+                    self.recognition_times[page] = time.perf_counter() - started
+                    self._records.put(records)
+                except Exception as e:
+                    logger.exception(f"Failed to read roster page {page + 1}.")
+                    self._errors.append(e)
+
+        def _write(self) -> None:
+            """
+            Collects read players and appends them to `path` in batches.
 
-app._unparsable_cell(
-    """
-    def _poll_main_menu_with_interrupts(
-        main_menu_config: TemplateConfig,
-        hotfix_overlay_config: TemplateConfig,
-        timeout: float = 60.0,
-    ) -> CFBMainMenuState:
-        \"\"\"
-        Polls for the main menu while dismissing pop-ups and checking for hotfixes.
+            Errors are recorded and the queue is drained until told to stop,
+            so the workers never block on a full `_records` queue.
+            """
+            batch: list[PlayerRecord] = []
+
+            while (records := self._records.get()) is not None:
+                try:
+                    self.players.extend(records)
+                    batch.extend(records)
+                    if len(batch) >= self.batch_size:
+                        self._flush(batch)
+                        batch = []
+                except Exception as e:
+                    logger.exception("Failed to collect roster players.")
+                    self._errors.append(e)
+
+            self._flush(batch)
+
+        def _flush(self, batch: list[PlayerRecord]) -> None:
+            if self.path is None or not batch:
+                return
 
-        This function actively captures the screen to identify either the top-half
-        main menu template or a hotfix overlay. It continuously taps the circle
-        button to dismiss \"Featured News\" or \"Press any button\" prompts until the
-        main menu is found. Once the main menu is detected, it enters a brief
-        stabilization phase to ensure a delayed hotfix overlay does not appear.
+            try:
+                write_roster_records(self.path, batch)
+            except Exception as e:
+                logger.exception(f"Failed to write roster players to {self.path}.")
+                self._errors.append(e)
+
+    def extract_roster(
+        table: RosterTable = ROSTER_TABLE,
+        glyph_bank: GlyphBank | None = roster_glyph_bank,
+        output_path: Path | None = None,
+        quiet_frames: int = 2,
+        store_key: RosterKey | None = roster_key,
+    ) -> RosterExtraction:
+        """
+        Pages through the View Rosters table and extracts every player.
+
+        Each page is captured once it has settled and cut into cells by
+        `segment_roster_page`. The cells are handed to a `RosterPipeline`,
+        and the next page is requested with `table.next_page` right away.
+        The cells are read and written in the background while the console
+        turns the page. Extraction ends after a short page, after
+        `table.roster_size` players, or when turning the page no longer
+        changes the table. Every page is timed, recorded under the
+        "roster_page" step and logged.
 
         Parameters
         ----------
-        top_menu_config : TemplateConfig
-            The configuration object containing the visual template and capture
-            region for a stable main menu UI element.
-        hotfix_config : TemplateConfig
-            The configuration object containing the visual template and capture
-            region for the hotfix overlay \"Yes/No\" button prompt.
-        timeout : float, optional
-            The maximum time in seconds to poll for the menu or hotfix before
-            timing out. Default is 60.0.
+        table : RosterTable, optional
+            The table geometry at `REFERENCE_RESOLUTION`. Default is
+            `ROSTER_TABLE`.
+        glyph_bank : GlyphBank | None, optional
+            The glyphs that every page's cells are read with, in one batch
+            per page. Default is `roster_glyph_bank`; with None, cells are
+            kept as images only.
+        output_path : Path | None, optional
+            The JSON Lines file to write the players to. Default is None (a
+            new, timestamped file in `ROSTER_DIR`).
+        quiet_frames : int, optional
+            The consecutive unchanged frames after which a page counts as
+            settled. Default is 2.
+        store_key : RosterKey | None, optional
+            The dynasty, season, week and team to append the players to
+            `roster_store` under, or None to only write `output_path`.
+            Default is `roster_key`, from the command line.
 
         Returns
         -------
-        MenuState
-            The final evaluated state of the UI, returning either MAIN_MENU or
-            HOTFIX.
+        RosterExtraction
+            The extracted players, per-page timings and the output file.
 
         Raises
         ------
-        TemplateMatchTimeoutError
-            If neither the main menu nor the hotfix overlay is detected within
-            the specified timeout period.
-        \"\"\"
-        logger.info(\"Polling for CFB main menu while handling potential pop-ups...\")
-
-        camera.start(target_fps=10, region=None)
-        start_time = time.time()
-        main_menu_found = False
-        stabilization_start = 0.0
-
-        try:
-            while time.time() - start_time < timeout:
-                frame = camera.get_latest_frame()
-
-                if frame is not None and frame.max() > 0:
-                    # Check for the hotfix overlay first.
-                    h_left, h_top, h_right, h_bottom = hotfix_overlay_config.region
-                    hotfix_overlay_region = frame[h_top:h_bottom, h_left:h_right]
-                    is_hotfix_overlay, confidence_hotfix_overlay = is_image_match(
-                        frame=hotfix_overlay_region,
-                        template=hotfix_overlay_config.template,
-                    )
-
-                    if is_hotfix_overlay:
-                        logger.warning(
-                            f\"Hotfix overlay detected! (Confidence: {confidence_hotfix_overlay:.2f})\"
-                        )
-                        return CFBMainMenuState.HOTFIX
-
-                    # Check for the Top-Half Main Menu item.
-                    if not main_menu_found:
-                        m_left, m_top, m_right, m_bottom = main_menu_config.region
-                        main_menu_region = frame[m_top:m_bottom, m_left:m_right]
-                        is_main_menu, confidence_main_menu = is_image_match(
-                            frame=main_menu_region,
-                            template=main_menu_config.template,
-                            confidence_threshold=0.80,  # Lowered for potential dimming
+        RosterPageTimeoutError
+            If a page does not settle within the "roster_page" timeout.
+        """
+        logger.info("Extracting the roster...")
+        table = table.scaled(capture_session.resolution)
+        timeout = timeout_policy.timeout("roster_page")
+        if output_path is None:
+            output_path = ROSTER_DIR / f"roster_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+
+        started = time.perf_counter()
+        captured: list[tuple[int, int, float, float]] = []
+        n_players = 0
+
+        with (
+            RosterPipeline(glyph_bank, output_path) as pipeline,
+            capture_session.feed(table.region) as feed,
+        ):
+            for page in range(-(-table.roster_size // table.rows_per_page)):
+                page_started = time.perf_counter()
+
+                with StepTimer("roster_page", timeout, (RosterPageTimeoutError,)):
+                    rows = _wait_for_settled_page(feed, table, timeout, quiet_frames)
+                    settle_time = time.perf_counter() - page_started
+
+                    rows = rows[: table.roster_size - n_players]
+                    n_players += len(rows)
+                    pipeline.submit(page, rows)
+
+                    is_last_page = (
+                        len(rows) < table.rows_per_page
+                        or n_players >= table.roster_size
+                        or not tap_confirmed(
+                            table.next_page, region_changes(table.region), timeout
                         )
+                    )
 
-                        if is_main_menu:
-                            logger.info(
-                                f\"CFB main menu located! (Confidence: {confidence_main_menu:.2f}). Stabilizing...\"
-                            )
-                            main_menu_found = True
-                            stabilization_start = time.time()
-
-                # State actions.
-                if main_menu_found:
-                    # Wait 10 seconds to ensure a late hotfix overlay doesn't slide in.
-                    if time.time() - stabilization_start > 10.0:
-                        logger.success(
-                            \"CFB main menu stabilized. No hotfix overlays detected.\"
-                        )
-                        return CFBMainMenuState.MAIN_MENU
-                    # Sync with the background camera thread.
-                    time.sleep(0.1)
-                else:
-                    # Keep mashing CIRCLE to get to the main menu.
-                    controller.tap(Button.CIRCLE, rest_time=1.0)
+                captured.append(
+                    (page, len(rows), settle_time, time.perf_counter() - page_started)
+                )
+                logger.debug(
+                    f"Roster page {page + 1}: {len(rows)} players, settled in "
+                    f"{settle_time:.2f}s, {captured[-1][3]:.2f}s in total."
+                )
 
-            raise TemplateMatchTimeoutError(
-                \"Failed to reach CFB main menu within the timeout.\"
-            )
+                if is_last_page:
+                    break
 
-        finally:f
-            camera.stop()
+        pages = [
+            RosterPageTiming(*timing, pipeline.recognition_times.get(timing[0], 0.0))
+            for timing in captured
+        ]
+        extraction = RosterExtraction(
+            pipeline.players,
+            pages,
+            time.perf_counter() - started,
+            output_path,
+        )
+        logger.success(
+            f"Extracted {len(extraction.players)} players from {len(pages)} pages "
+            f"in {extraction.duration:.2f}s "
+            f"({sum(p.recognition_time for p in pages):.2f}s of reading overlapped)."
+        )
+        if store_key is not None:
+            roster_store.append(store_key, extraction.players)
+        return extraction
 
-    def launch_dynasty(
-        top_menu_config: TemplateConfig, hotfix_config: TemplateConfig
-    ) -> None:
-        \"\"\"
-        Navigates to the Dynasty mode hub, handling potential hotfixes.
+    return (extract_roster,)
 
-        This function coordinates the transition from the initial load screen
-        to the main menu. It evaluates the current menu state via the polling
-        function. If a hotfix overlay is detected, it selects \"No\" to dismiss
-        the prompt and raises an error to trigger a clean pipeline restart.
 
-        Parameters
-        ----------
-        top_menu_config : TemplateConfig
-            The configuration object containing the visual template and capture
-            region for the top-half main menu target.
-        hotfix_config : TemplateConfig
-            The configuration object containing the visual template and capture
-            region for the hotfix overlay target.
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Batch Roster Re-processing
+    """)
+    return
 
-        Raises
-        ------
-        HotfixAppliedError
-            If a hotfix overlay is detected and dismissed, signaling the error
-            router to restart the game.
-        \"\"\"
-        logger.info(\"Executing sequence to reach Dynasty mode...\")
 
-        menu_state = _poll_main_menu_with_interrupts(
-            main_menu_config=top_menu_config, hotfix_overlay_config=hotfix_config
+@app.cell
+def _(
+    Path,
+    REPROCESS_ARCHIVE,
+    ROSTER_DIR,
+    ROSTER_TABLE,
+    datetime,
+    mo,
+    reprocess_roster_archive,
+    roster_glyph_bank,
+    roster_key,
+    roster_store,
+):
+    # Run with `python roster_extract.py --reprocess DIRECTORY [--output FILE]
+    # [--workers N]`, plus the `roster_key` arguments to store the result.
+    # The pages are read in worker processes by `cfb_analysis.archive`.
+    if REPROCESS_ARCHIVE is not None:
+        _extraction = reprocess_roster_archive(
+            Path(REPROCESS_ARCHIVE),
+            output_path=(
+                Path(mo.cli_args()["output"])
+                if "output" in mo.cli_args()
+                else ROSTER_DIR / f"roster_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+            ),
+            table=ROSTER_TABLE,
+            glyph_bank=roster_glyph_bank,
+            workers=int(mo.cli_args().get("workers") or 0) or None,
         )
+        if roster_key is not None:
+            roster_store.append(roster_key, _extraction.players)
+    return
 
-        if menu_state == CFBMainMenuState.HOTFIX:
-            logger.info(
-                \"Hotfix overlay detected. Selecting 'No' to dismiss and force restart...\"
-            )
-            controller.tap(Button.CROSS, rest_time=2.0)
 
-            # Throw the error so the router can close and relaunch the game.
-            raise HotfixAppliedError(\"Hotfix dismissed. Game requires a clean restart.\")
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Roster Store
+    #### `roster_key`
+    #### `roster_store`
+    """)
+    return
+
 
-        logger.info(\"Entering Dynasty mode...\")
-        # Logic to navigate from the top menu item down to Dynasty and click Continue.
-    """,
-    name="_"
-)
+@app.cell
+def _(ROSTER_STORE_DIR, RosterKey, RosterStore, mo):
+    # `--dynasty NAME --season YEAR --week N --team TEAM` stores every
+    # extracted roster under that key (see `RosterStore`).
+    _args = mo.cli_args()
+    _missing = [name for name in RosterKey._fields if name not in _args]
+    if _missing and len(_missing) < len(RosterKey._fields):
+        raise ValueError(f"Storing a roster also needs --{', --'.join(_missing)}.")
+
+    roster_key = (
+        RosterKey(
+            dynasty=str(_args["dynasty"]),
+            season=int(_args["season"]),
+            week=int(_args["week"]),
+            team=str(_args["team"]),
+        )
+        if not _missing
+        else None
+    )
+    roster_store = RosterStore(ROSTER_STORE_DIR)
+    return roster_key, roster_store
 
 
 @app.cell(hide_code=True)
@@ -1409,15 +4190,16 @@ def _(
     HotfixAppliedError,
     LaunchState,
     PS5SettingsIconNotFoundError,
+    RosterPageTimeoutError,
     Templates,
     close_active_game,
     focus_first_game_tile,
     focus_welcome_tile,
-    is_home_screen_visible,
     launch_cfb_game,
     logger,
     reset_pipeline_and_ps5,
     return_to_home_screen,
+    wait_for_screen,
 ):
     def route_launch_error(
         e: Exception, attempt: int, max_attempts: int
@@ -1453,7 +4235,10 @@ def _(
             return_to_home_screen()
             focus_welcome_tile()
 
-            if is_home_screen_visible(target_config=Templates.PS5_SETTINGS_ICON):
+            # Any recognized home screen element proves the stream is alive.
+            screen = wait_for_screen(candidates=["PS5_SETTINGS_ICON", "CFB_GAME_TITLE"])
+
+            if screen.state is not None:
                 logger.info(
                     "Stream is active. Initiating recovery sequence for unclosed game..."
                 )
@@ -1501,8 +4286,23 @@ def _(
             logger.info("Hotfix overlay was dismissed. Closing and restarting CFB...")
             return_to_home_screen()
             close_active_game()
+            # The next attempt starts from the welcome tile, as after a fresh
+            # connection.
+            focus_welcome_tile()
             return LaunchState.RETRY
 
+        elif isinstance(e, RosterPageTimeoutError):
+            # Domain: Remote PS5 UI (View Rosters).
+            logger.error(f"The roster table stopped responding: {e}")
+            return_to_home_screen()
+            close_active_game()
+            focus_welcome_tile()
+            if attempt + 1 < max_attempts:
+                logger.info("Closed CFB. Restarting the launch sequence...")
+                return LaunchState.RETRY
+            logger.error("Max launch attempts reached. Aborting pipeline.")
+            return LaunchState.ABORT
+
         else:
             # Catch-all for unforeseen errors.
             logger.exception("An unforeseen error crashed the main launch sequence.")
@@ -1523,7 +4323,16 @@ def _(mo):
 
 
 @app.cell
-def _(camera: "dxcam.DXCamera", controller, logger, subprocess, time):
+def _(
+    IS_LIVE_CAPTURE,
+    capture_session,
+    controller,
+    logger,
+    subprocess,
+    time,
+    timed_step,
+    timeout_policy,
+):
     def _shutdown_chiaki_process() -> None:
         """
         Terminates the chiaki-ng application, prioritizing a graceful shutdown.
@@ -1567,6 +4376,13 @@ def _(camera: "dxcam.DXCamera", controller, logger, subprocess, time):
                 "Critical error occurred while attempting to terminate chiaki-ng."
             )
 
+    def _stop_controller_inputs() -> None:
+        """Drops queued controller inputs and waits for the one playing."""
+        try:
+            controller.stop()
+        except Exception:
+            logger.exception("Failed to stop the controller input dispatcher.")
+
     def _reset_virtual_controller() -> None:
         """Resets the virtual gamepad to a neutral state."""
         try:
@@ -1579,26 +4395,30 @@ def _(camera: "dxcam.DXCamera", controller, logger, subprocess, time):
     def _stop_camera_capture() -> None:
         """Safely terminates the background dxcam capture thread if active."""
         try:
-            if camera.is_capturing:
-                camera.stop()
+            if capture_session.is_capturing:
+                capture_session.stop()
                 logger.debug("Global dxcam capture thread stopped.")
         except Exception:
             logger.exception("Failed to stop dxcam globally.")
 
+    @timed_step(timeout_errors=())
     def shutdown_pipeline() -> None:
         """
         Releases hardware resources and forcefully stops external applications.
 
-        Acts as the master cleanup routine for the data pipeline. It resets
-        the virtual gamepad to a neutral state to prevent stuck inputs on the
-        OS level, stops the global background camera capture thread if it
-        remains active, and terminates the remote play stream process.
+        Acts as the master cleanup routine for the data pipeline. It stops
+        the controller's queued inputs and then resets the virtual gamepad to
+        a neutral state to prevent stuck inputs on the OS level, stops the
+        global background camera capture thread if it remains active, and
+        terminates the remote play stream process.
         """
         logger.info("Executing global pipeline shutdown...")
 
+        _stop_controller_inputs()
         _reset_virtual_controller()
         _stop_camera_capture()
-        _shutdown_chiaki_process()
+        if IS_LIVE_CAPTURE:
+            _shutdown_chiaki_process()
 
     def reset_pipeline_and_ps5() -> None:
         """Shuts down the pipeline and waits for the PS5 to enter rest mode."""
@@ -1606,7 +4426,8 @@ def _(camera: "dxcam.DXCamera", controller, logger, subprocess, time):
             "Shutting down pipeline and waiting for PS5 to fully enter rest mode before retrying..."
         )
         shutdown_pipeline()
-        time.sleep(30.0)
+        if IS_LIVE_CAPTURE:
+            time.sleep(timeout_policy.timeout("ps5_rest_mode"))
 
     return reset_pipeline_and_ps5, shutdown_pipeline
 
@@ -1667,12 +4488,12 @@ def _(mo):
 
 
 @app.cell
-def _(Image, camera: "dxcam.DXCamera", cv2, mo, time):
+def _(Image, PollScheduler, capture_session, cv2, mo):
     def preview_capture(
         region: tuple[int, int, int, int], timeout: float = 3.0
     ) -> mo.Html:
         """
-        Captures a frame using grab() and outputs it via mo.image().
+        Captures a frame from the capture session and outputs it via mo.image().
 
         This function polls the camera for a specified duration until a valid,
         non-black frame is captured. If successful, it returns the frame as a
@@ -1695,22 +4516,20 @@ def _(Image, camera: "dxcam.DXCamera", cv2, mo, time):
             A Marimo HTML component containing either the captured image or
             a markdown-formatted error message.
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            frame = camera.grab(region=region)
+        scheduler = PollScheduler(timeout=timeout)
 
-            # Check that the frame is populated and not completely black.
-            if frame is not None and frame.max() > 0:
-                # Convert from dxcam native BGRA to RGB for correct Pillow
-                # rendering.
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
-                image = Image.fromarray(rgb_frame)
+        with capture_session.feed(region) as feed:
+            while not scheduler.expired:
+                frame = scheduler.next_frame(feed)
 
-                return mo.image(src=image)
+                # Check that the frame is populated and not completely black.
+                if frame is not None and frame.max() > 0:
+                    # Convert from dxcam native BGRA to RGB for correct Pillow
+                    # rendering.
+                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
+                    image = Image.fromarray(rgb_frame)
 
-            # Hold captures at ~10 FPS to prevent a CPU-hogging tight loop.
-            time.sleep(0.1)
+                    return mo.image(src=image)
 
         return mo.md("**Error:** Polling timed out. Failed to capture a valid frame.")
 
@@ -1724,5 +4543,499 @@ def _(Image, camera: "dxcam.DXCamera", cv2, mo, time):
     return
 
 
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Vision Benchmarks
+    #### `BENCHMARK_RESOLUTIONS`
+    #### `load_fixture_frames`
+    #### `build_benchmark_fixtures`
+    #### `run_vision_benchmarks`
+    #### `compare_benchmarks`
+    """)
+    return
+
+
+@app.cell
+def _(
+    FrameChangeDetector,
+    GrayFrame,
+    Path,
+    RawRecordingFrameSource,
+    TemplateBank,
+    TemplateConfig,
+    TemplateSpec,
+    TemplateSpecs,
+    build_template_pyramid,
+    create_frame_source,
+    ctypes,
+    cv2,
+    datetime,
+    find_template,
+    is_image_match,
+    json,
+    logger,
+    np,
+    os,
+    platform,
+    scale_template,
+    sys,
+    time,
+    tracemalloc,
+):
+    # Output sizes the capture box may run at. Fixtures are stored once per
+    # size and templates are scaled to match (see `scale_template`).
+    BENCHMARK_RESOLUTIONS = {
+        "720p": (1280, 720),
+        "1080p": (1920, 1080),
+        "4K": (3840, 2160),
+    }
+
+    def _resident_set_size() -> int:
+        """Returns the process's resident set size in bytes (0 if unknown)."""
+        if sys.platform == "win32":
+
+            class _MemoryCounters(ctypes.Structure):
+                _fields_ = (
+                    ("cb", ctypes.c_ulong),
+                    ("PageFaultCount", ctypes.c_ulong),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                )
+
+            counters = _MemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            ctypes.windll.psapi.GetProcessMemoryInfo(
+                ctypes.windll.kernel32.GetCurrentProcess(),
+                ctypes.byref(counters),
+                counters.cb,
+            )
+            return counters.WorkingSetSize
+
+        statm = Path("/proc/self/statm")
+        if statm.is_file():
+            return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+        return 0
+
+    def load_fixture_frames(path: Path) -> list[np.ndarray]:
+        """
+        Reads stored full-screen frames to benchmark against.
+
+        Parameters
+        ----------
+        path : Path
+            A directory of PNG frames or a raw BGRA recording captured with
+            `record_raw_session`, e.g. `BENCHMARK_FIXTURES`.
+
+        Returns
+        -------
+        list[np.ndarray]
+            The BGRA frames in capture order.
+        """
+        source = create_frame_source(str(path))
+        return [source.frame_at(i) for i in range(len(source))]
+
+    def build_benchmark_fixtures(
+        frames: list[np.ndarray],
+        directory: Path | None = None,
+        resolutions: dict[str, tuple[int, int]] = BENCHMARK_RESOLUTIONS,
+    ) -> dict[str, Path]:
+        """
+        Stores `frames` as one raw recording per benchmark resolution.
+
+        Parameters
+        ----------
+        frames : list[np.ndarray]
+            Full-screen BGRA frames, e.g. from `load_fixture_frames`.
+        directory : Path | None, optional
+            Where the recordings are written. Default is None
+            ("logs/benchmarks/fixtures").
+        resolutions : dict[str, tuple[int, int]], optional
+            The (width, height) of each fixture keyed by name. Default is
+            `BENCHMARK_RESOLUTIONS`.
+
+        Returns
+        -------
+        dict[str, Path]
+            The raw recording written for each resolution, readable with
+            `RawRecordingFrameSource`.
+        """
+        if directory is None:
+            directory = Path("logs") / "benchmarks" / "fixtures"
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = {}
+
+        for name, (width, height) in resolutions.items():
+            path = directory / f"{name}.raw"
+
+            with path.open("wb") as file:
+                for frame in frames:
+                    if frame.shape[:2] != (height, width):
+                        frame = cv2.resize(
+                            frame, (width, height), interpolation=cv2.INTER_AREA
+                        )
+                    np.ascontiguousarray(frame).tofile(file)
+
+            path.with_suffix(".json").write_text(
+                json.dumps({"height": height, "width": width, "fps": 60})
+            )
+            paths[name] = path
+
+        logger.info(
+            f"Stored {len(frames)} benchmark frames per resolution in {directory}."
+        )
+        return paths
+
+    def _strategies(config: TemplateConfig) -> dict:
+        """Builds the per-frame work of each matching strategy for `config`."""
+        left, top, right, bottom = config.region
+        threshold = config.confidence_threshold
+        pyramid = build_template_pyramid(config.template)
+        bank = TemplateBank({"target": config})
+        gray = GrayFrame()
+        change_detector = FrameChangeDetector()
+
+        def _is_image_match(frame: np.ndarray) -> float:
+            # A fresh gray copy of the crop and no precomputed pyramid.
+            crop = frame[top:bottom, left:right]
+            return is_image_match(crop, config.template, threshold)[1]
+
+        def _single_scale(frame: np.ndarray) -> float:
+            gray.load(frame[top:bottom, left:right])
+            return find_template(
+                gray.region(), config.template, threshold, max_pyramid_level=0
+            ).confidence
+
+        def _pyramid(frame: np.ndarray) -> float:
+            gray.load(frame[top:bottom, left:right])
+            return find_template(
+                gray.region(), config.template, threshold, template_pyramid=pyramid
+            ).confidence
+
+        def _poll_loop(frame: np.ndarray) -> float:
+            # The per-frame work of `poll_for_template_match`.
+            crop = frame[top:bottom, left:right]
+            if not change_detector.has_changed(crop):
+                return 0.0
+            return _pyramid(frame)
+
+        def _full_frame_bank(frame: np.ndarray) -> float:
+            # Full-screen frames cropped inside the bank, as the screen
+            # watchers in `_poll_main_menu_with_interrupts` do.
+            gray.load(frame)
+            return bank.match(gray)["target"].confidence
+
+        return {
+            "is_image_match": _is_image_match,
+            "single_scale": _single_scale,
+            "pyramid": _pyramid,
+            "poll_loop": _poll_loop,
+            "full_frame_bank": _full_frame_bank,
+        }
+
+    def _measure(step, frames: np.ndarray, repeats: int) -> dict[str, float]:
+        """Times `step` over `frames`, then measures its allocations."""
+        # Untimed pass: fills caches and pages the recording in.
+        for frame in frames:
+            step(frame)
+
+        rss_before = _resident_set_size()
+        latencies = np.empty(repeats * len(frames))
+        max_confidence = 0.0
+        start = time.perf_counter()
+
+        for i in range(latencies.size):
+            frame_start = time.perf_counter()
+            max_confidence = max(max_confidence, step(frames[i % len(frames)]))
+            latencies[i] = time.perf_counter() - frame_start
+
+        elapsed = time.perf_counter() - start
+        rss_growth = _resident_set_size() - rss_before
+
+        # tracemalloc slows allocation down, so it gets a pass of its own.
+        tracemalloc.start()
+        for frame in frames:
+            step(frame)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return {
+            "mean_ms": 1000 * float(latencies.mean()),
+            "p50_ms": 1000 * float(np.percentile(latencies, 50)),
+            "p95_ms": 1000 * float(np.percentile(latencies, 95)),
+            "frames_per_second": latencies.size / elapsed,
+            "peak_alloc_bytes": peak,
+            "rss_growth_bytes": rss_growth,
+            "max_confidence": max_confidence,
+        }
+
+    def run_vision_benchmarks(
+        fixtures: dict[str, Path],
+        output_path: Path | None = None,
+        templates: type = TemplateSpecs,
+        repeats: int = 5,
+    ) -> dict:
+        """
+        Benchmarks every matching strategy on every template and resolution.
+
+        Each template in `templates` is scaled to the fixture's resolution
+        and matched against every stored frame with each strategy:
+
+        - `is_image_match`: a fresh gray copy of the region per frame.
+        - `single_scale`: one full-resolution pass into a reused buffer.
+        - `pyramid`: the coarse-to-fine search with a precomputed pyramid.
+        - `poll_loop`: `pyramid` behind the frame change check, as in
+          `poll_for_template_match`. Regions that never change are skipped
+          entirely and report a confidence of 0.0.
+        - `full_frame_bank`: a full-screen frame matched through a
+          `TemplateBank`, as in `_poll_main_menu_with_interrupts`.
+
+        Parameters
+        ----------
+        fixtures : dict[str, Path]
+            The raw recording for each resolution (see
+            `build_benchmark_fixtures`).
+        output_path : Path | None, optional
+            Where the JSON results are written. Default is None (a
+            timestamped file in "logs/benchmarks").
+        templates : type, optional
+            The namespace of `TemplateSpec`s to benchmark. Default is
+            `TemplateSpecs`.
+        repeats : int, optional
+            How many times the fixture frames are replayed per timed
+            benchmark. Default is 5.
+
+        Returns
+        -------
+        dict
+            The run metadata and a `results` list with one row per
+            resolution, template and strategy.
+        """
+        specs = {
+            name: spec
+            for name, spec in vars(templates).items()
+            if isinstance(spec, TemplateSpec)
+        }
+        results = []
+
+        for resolution, path in fixtures.items():
+            source = RawRecordingFrameSource(path)
+            frames = source.frames
+
+            for template_name, spec in specs.items():
+                strategies = _strategies(scale_template(spec, source.resolution))
+
+                for strategy, step in strategies.items():
+                    row = {
+                        "resolution": resolution,
+                        "template": template_name,
+                        "strategy": strategy,
+                        **_measure(step, frames, repeats),
+                    }
+                    logger.debug(
+                        f"{resolution} {template_name} {strategy}: "
+                        f"{row['mean_ms']:.2f} ms/frame"
+                    )
+                    results.append(row)
+
+        run = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "n_frames": {
+                name: len(RawRecordingFrameSource(path))
+                for name, path in fixtures.items()
+            },
+            "results": results,
+        }
+
+        if output_path is None:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = Path("logs") / "benchmarks" / f"vision_{stamp}.json"
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(run, indent=2))
+        logger.success(f"Wrote {len(results)} benchmark results to {output_path}.")
+        return run
+
+    def compare_benchmarks(
+        baseline_path: Path,
+        current_path: Path,
+        tolerance: float = 0.10,
+        min_delta_ms: float = 0.05,
+    ) -> list[dict]:
+        """
+        Lists the benchmarks that got slower between two runs.
+
+        Latency is compared on the median, which is far less sensitive to
+        scheduler noise than the mean.
+
+        Parameters
+        ----------
+        baseline_path : Path
+            The JSON results of the reference run.
+        current_path : Path
+            The JSON results of the run to check.
+        tolerance : float, optional
+            The relative growth in median latency or peak allocations that is
+            still accepted. Default is 0.10.
+        min_delta_ms : float, optional
+            Latency growth below this many milliseconds is never reported.
+            Default is 0.05.
+
+        Returns
+        -------
+        list[dict]
+            One row per regressed benchmark with the baseline and current
+            median latency and peak allocations. Empty if nothing regressed.
+        """
+
+        def _key(row: dict) -> tuple[str, str, str]:
+            return row["resolution"], row["template"], row["strategy"]
+
+        baseline = {
+            _key(row): row
+            for row in json.loads(Path(baseline_path).read_text())["results"]
+        }
+        regressions = []
+
+        for row in json.loads(Path(current_path).read_text())["results"]:
+            before = baseline.get(_key(row))
+            if before is None:
+                continue
+
+            slower = row["p50_ms"] > max(
+                before["p50_ms"] * (1 + tolerance), before["p50_ms"] + min_delta_ms
+            )
+            # Peaks of a few hundred bytes are noise rather than regressions.
+            heavier = row["peak_alloc_bytes"] > max(
+                before["peak_alloc_bytes"] * (1 + tolerance), 4096
+            )
+
+            if slower or heavier:
+                regressions.append(
+                    {
+                        "resolution": row["resolution"],
+                        "template": row["template"],
+                        "strategy": row["strategy"],
+                        "baseline_p50_ms": before["p50_ms"],
+                        "p50_ms": row["p50_ms"],
+                        "baseline_peak_alloc_bytes": before["peak_alloc_bytes"],
+                        "peak_alloc_bytes": row["peak_alloc_bytes"],
+                    }
+                )
+
+        for regression in regressions:
+            logger.warning(f"Benchmark regression: {regression}")
+
+        return regressions
+
+    return (
+        build_benchmark_fixtures,
+        compare_benchmarks,
+        load_fixture_frames,
+        run_vision_benchmarks,
+    )
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Benchmark Command
+    """)
+    return
+
+
+@app.cell
+def _(
+    BENCHMARK_BASELINE,
+    BENCHMARK_FIXTURES,
+    BenchmarkRegressionError,
+    Path,
+    RUN_BENCHMARKS,
+    build_benchmark_fixtures,
+    compare_benchmarks,
+    datetime,
+    json,
+    load_fixture_frames,
+    logger,
+    mo,
+    run_vision_benchmarks,
+):
+    # Run with `python roster_extract.py --benchmark [FILE] [--repeats N]
+    # [--tolerance T]` to benchmark the vision hot path on the frames in
+    # `BENCHMARK_FIXTURES` and compare the results with `BENCHMARK_BASELINE`.
+    # `--fixtures PATH` replays another capture (a PNG directory or a raw
+    # recording), `--baseline FILE` compares with another run, and
+    # `--update-baseline` replaces the baseline with this run.
+    # Latency only compares across runs on the same machine, so regressions
+    # are only logged unless `--check` is passed, which fails the run on any
+    # regression. Use it on the machine the baseline was recorded on.
+    if RUN_BENCHMARKS:
+        _args = mo.cli_args()
+        _baseline = Path(_args.get("baseline") or BENCHMARK_BASELINE)
+        if "update-baseline" in _args:
+            _output = BENCHMARK_BASELINE
+        elif _args["benchmark"]:
+            _output = Path(_args["benchmark"])
+        else:
+            _output = (
+                Path("logs")
+                / "benchmarks"
+                / f"vision_{datetime.now():%Y%m%d_%H%M%S}.json"
+            )
+        _fixtures = Path(_args.get("fixtures") or BENCHMARK_FIXTURES)
+        _run = run_vision_benchmarks(
+            build_benchmark_fixtures(load_fixture_frames(_fixtures)),
+            _output,
+            repeats=int(_args.get("repeats") or 5),
+        )
+
+        if _output != _baseline and _baseline.is_file():
+            if json.loads(_baseline.read_text())["platform"] != _run["platform"]:
+                logger.warning(
+                    f"{_baseline} was recorded on another platform; "
+                    "latency comparisons are unreliable."
+                )
+            _regressions = compare_benchmarks(
+                _baseline, _output, tolerance=float(_args.get("tolerance") or 0.10)
+            )
+            if _regressions and "check" in _args:
+                raise BenchmarkRegressionError(
+                    f"{len(_regressions)} benchmarks regressed against {_baseline}."
+                )
+            if not _regressions:
+                logger.success(f"No benchmark regressions against {_baseline}.")
+    return
+
+
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ### Step Timing Report
+    Recorded durations (completed runs only) next to each step's configured
+    timeout.
+    """)
+    return
+
+
+@app.cell
+def _(mo, timing_report):
+    mo.ui.table(timing_report(), selection=None)
+    return
+
+
 if __name__ == "__main__":
     app.run()
@@ -0,0 +1,8 @@
+"""
+Reusable pieces of the roster extraction pipeline.
+
+The `notebooks/roster_extract.py` notebook drives the console and imports
+these modules. Code lives here instead of in a notebook cell when it has to
+be importable on its own: by worker processes, by the console simulator
+(`cfb_analysis.sim`) and by the tests.
+"""
@@ -0,0 +1,160 @@
+"""
+Re-reading archived roster pages across worker processes.
+
+The worker functions live in this module, rather than in a notebook cell, so
+that a `ProcessPoolExecutor` can import them under the spawn and forkserver
+start methods. Forking the notebook's process is not safe: it runs capture,
+controller and logging threads whose locks a forked child would inherit.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import cv2
+from loguru import logger
+
+from cfb_analysis.frames import create_frame_source
+from cfb_analysis.glyphs import GlyphBank
+from cfb_analysis.roster import (
+    PlayerRecord,
+    RosterExtraction,
+    RosterPageTiming,
+    RosterTable,
+    read_roster_page,
+    segment_roster_page,
+    write_roster_records,
+)
+
+# The archive, table and glyph bank of the current worker process, set once
+# by `_start_worker` so they are not pickled with every page.
+_worker = None
+
+
+def _start_worker(
+    archive: Path, table: RosterTable, glyph_bank: GlyphBank | None
+) -> None:
+    """Opens the archive inside a new worker process."""
+    global _worker
+
+    # One OpenCV thread per worker, so workers do not compete for cores.
+    cv2.setNumThreads(1)
+    _worker = (create_frame_source(str(archive)), table, glyph_bank)
+
+
+def _read_archived_page(
+    index: int,
+) -> tuple[int, list[PlayerRecord] | None, str, float]:
+    """
+    Reads the archived page at `index` inside a worker process.
+
+    Returns
+    -------
+    tuple[int, list[PlayerRecord] | None, str, float]
+        The page index, its players (None if the page could not be read),
+        the error that stopped it and the reading time in seconds.
+    """
+    source, table, glyph_bank = _worker
+    left, top, right, bottom = table.region
+    started = time.perf_counter()
+
+    try:
+        frame = source.frame_at(index)
+        table_image = cv2.cvtColor(frame[top:bottom, left:right], cv2.COLOR_BGRA2GRAY)
+        records = read_roster_page(
+            index, segment_roster_page(table_image, table), glyph_bank
+        )
+    except Exception as e:
+        return index, None, f"{type(e).__name__}: {e}", 0.0
+
+    # Cell images are not sent back, so no image is ever pickled.
+    players = [record._replace(cells={}) for record in records]
+    return index, players, "", time.perf_counter() - started
+
+
+def reprocess_roster_archive(
+    archive: Path,
+    output_path: Path,
+    table: RosterTable,
+    glyph_bank: GlyphBank | None,
+    workers: int | None = None,
+) -> RosterExtraction:
+    """
+    Re-reads an archive of captured roster pages across worker processes.
+
+    Every frame of `archive` is one settled roster page, in page order.
+    The pages are read by a pool of `workers` processes. Each process opens
+    the archive once and crops, segments and reads the pages it is given:
+    PNG frames are decoded in the worker, and raw recordings are read
+    through a shared read-only memory map. Only the read text crosses back
+    to this process. The players are then written in the same JSON Lines
+    format as `extract_roster`.
+
+    Unreadable frames are logged and skipped. Cell images are not kept,
+    so `PlayerRecord.cells` is empty.
+
+    Parameters
+    ----------
+    archive : Path
+        A directory of PNG frames or a raw BGRA recording (see
+        `create_frame_source`).
+    output_path : Path
+        The JSON Lines file to write the players to.
+    table : RosterTable
+        The table geometry at `REFERENCE_RESOLUTION`.
+    glyph_bank : GlyphBank | None
+        The glyphs the cells are read with. It must match the archive's
+        resolution. With None, only the rows are counted.
+    workers : int | None, optional
+        The number of worker processes. Default is None (one per CPU).
+
+    Returns
+    -------
+    RosterExtraction
+        The players read, the per-page reading times and the output
+        file. The settle times are 0.0.
+    """
+    archive = Path(archive)
+    source = create_frame_source(str(archive))
+    n_pages = len(source)
+    table = table.scaled(source.resolution)
+    workers = max(1, min(workers or os.cpu_count() or 1, n_pages))
+
+    logger.info(
+        f"Re-processing {n_pages} roster pages from {archive} on {workers} workers..."
+    )
+    started = time.perf_counter()
+
+    players = []
+    timings = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_start_worker,
+        initargs=(archive, table, glyph_bank),
+    ) as executor:
+        results = executor.map(
+            _read_archived_page,
+            range(n_pages),
+            chunksize=max(1, n_pages // (workers * 4)),
+        )
+
+        for index, records, error, elapsed in results:
+            if records is None:
+                logger.warning(f"Skipped archived roster page {index}: {error}")
+                continue
+
+            players.extend(records)
+            timings.append(RosterPageTiming(index, len(records), 0.0, elapsed, elapsed))
+
+    write_roster_records(output_path, players)
+
+    extraction = RosterExtraction(
+        players, timings, time.perf_counter() - started, output_path
+    )
+    logger.success(
+        f"Re-processed {len(players)} players from {len(timings)} pages in "
+        f"{extraction.duration:.2f}s ({len(timings) / extraction.duration:.1f} "
+        f"pages/s) into {output_path}."
+    )
+    return extraction
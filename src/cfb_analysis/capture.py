@@ -0,0 +1,539 @@
+"""
+The capture session shared by every vision waiter.
+
+One `CaptureSession` owns the frame source for the whole run. Waiters read
+through `RegionFeed`s, which register the screen regions they look at so
+the session only copies those pixels out of each captured frame.
+"""
+
+import math
+import threading
+import time
+import weakref
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from cfb_analysis.frames import FrameSource
+from cfb_analysis.geometry import bounding_rect, plan_capture_regions, rect_area
+
+
+class CaptureSession:
+    """
+    A long-lived capture shared by every vision waiter.
+
+    The underlying frame source is started once, the first time a frame
+    is requested, and keeps running until `stop`.
+
+    Every open feed registers the regions it reads, and the session copies
+    only the rectangles of `plan_capture_regions` over all of them out of
+    each captured frame. Pixels outside the plan are black, so waiters
+    keep using screen coordinates. A feed without regions receives the
+    full frame.
+
+    The source itself captures the bounding box of the plan, padded by
+    `region_margin`. Restarting a live capture drops the frames around
+    the restart, so the box changes with hysteresis: it grows as soon as
+    the plan leaves it, but only shrinks once the plan has fit in less
+    than half of it for `shrink_after` published frames.
+
+    Published frames are written into a pool of preallocated arrays, so no
+    frame is allocated per capture. Each feed holds the frame it returned
+    last until it asks for the next one or is closed, and a held array is
+    never written, so waiters on other threads never see a frame change
+    under them. The pool grows to one array per concurrent reader plus
+    one. Full frames that need neither cropping nor resizing are published
+    as the source delivered them.
+
+    Frames are pulled on demand: whichever waiter asks first reads the
+    next frame from the source and publishes it, and every other waiter
+    that is behind receives that same frame. No extra thread is needed
+    and replayed sessions stay deterministic.
+
+    If `output_size` is set, every frame is downscaled to it once when it
+    is published, so all matching runs at that size (see `Templates`).
+    Capture itself still runs at the source's resolution.
+
+    Attributes
+    ----------
+    source : FrameSource
+        The frame source being shared.
+    target_fps : int
+        The capture rate requested from the source.
+    output_size : tuple[int, int] | None
+        The (width, height) frames are resized to, or None to publish them
+        at the source's resolution.
+    merge_gap : int
+        The `plan_capture_regions` merge gap, in source pixels.
+    region_margin : int
+        The padding in source pixels around the plan's bounding box when
+        the source region is set, so small plan changes fit without a
+        restart.
+    shrink_after : int
+        The number of published frames the plan must fit in less than half
+        of the source region before the region shrinks.
+    """
+
+    def __init__(
+        self,
+        source: FrameSource,
+        target_fps: int = 60,
+        output_size: tuple[int, int] | None = None,
+        merge_gap: int = 32,
+        region_margin: int = 64,
+        shrink_after: int = 120,
+    ) -> None:
+        self.source = source
+        self.target_fps = target_fps
+        self.output_size = output_size
+        self.merge_gap = merge_gap
+        self.region_margin = region_margin
+        self.shrink_after = shrink_after
+        self._lock = threading.Lock()
+        self._frame: np.ndarray | None = None
+        self._sequence = 0
+
+        # Feeds register and release regions from any thread; the plan is
+        # only applied by the thread that holds `_lock`.
+        self._plan_lock = threading.Lock()
+        self._interests: dict[int, list | None] = {}
+        self._next_token = 0
+        self._plan_changed = False
+        # The rectangles copied out of each source frame, or None for all
+        # of it.
+        self._plan: list[tuple[int, int, int, int]] | None = None
+        # The region the source delivers, or None for the full screen, and
+        # the sequence number since which a smaller one would do.
+        self._region: tuple[int, int, int, int] | None = None
+        self._shrinkable_since: int | None = None
+
+        # The published frame pool, how many feeds hold each array, and the
+        # plan each array was last written with. The source-sized frame that
+        # planned rectangles are assembled in before being downscaled is
+        # never handed out.
+        self._buffers: list[np.ndarray] = []
+        self._holds: list[int] = []
+        self._buffer_plans: list[list | None] = []
+        self._canvas: np.ndarray | None = None
+
+    @property
+    def is_capturing(self) -> bool:
+        """True while the underlying frame source is running."""
+        return self.source.is_capturing
+
+    @property
+    def sequence(self) -> int:
+        """The number of frames published so far."""
+        return self._sequence
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        """The (width, height) of published frames."""
+        return self.output_size or self.source.resolution
+
+    def start(self) -> None:
+        """Starts capture if it is not already running."""
+        if not self.source.is_capturing:
+            logger.info("Starting persistent capture session...")
+            self.source.start(target_fps=self.target_fps, region=self._region)
+
+    def _register(self, regions: list | None) -> int:
+        """Adds a feed's regions to the plan and returns its token."""
+        with self._plan_lock:
+            token = self._next_token
+            self._next_token += 1
+            self._interests[token] = None if regions is None else list(regions)
+            self._plan_changed = True
+        return token
+
+    def _release(self, token: int) -> None:
+        """Removes the regions registered under `token` from the plan."""
+        with self._plan_lock:
+            self._interests.pop(token, None)
+            self._plan_changed = True
+
+    def _to_source(
+        self, region: tuple[int, int, int, int]
+    ) -> tuple[int, int, int, int]:
+        """Maps a region of published frames to source pixels."""
+        width, height = self.source.resolution
+        left, top, right, bottom = region
+
+        if self.output_size is not None:
+            scale_x = width / self.output_size[0]
+            scale_y = height / self.output_size[1]
+            left, right = math.floor(left * scale_x), math.ceil(right * scale_x)
+            top, bottom = math.floor(top * scale_y), math.ceil(bottom * scale_y)
+
+        return (
+            min(max(left, 0), width),
+            min(max(top, 0), height),
+            min(max(right, 0), width),
+            min(max(bottom, 0), height),
+        )
+
+    def _apply_plan(self) -> None:
+        """
+        Re-plans the copied rectangles after feeds were opened or closed.
+
+        Called with `_lock` held, so no frame is published while the plan
+        changes.
+        """
+        with self._plan_lock:
+            if not self._plan_changed:
+                return
+            self._plan_changed = False
+            interests = list(self._interests.values())
+
+        # With no open feeds, keep the current plan until one asks.
+        if not interests:
+            return
+
+        if any(regions is None for regions in interests):
+            plan = None
+        else:
+            plan = plan_capture_regions(
+                [self._to_source(r) for regions in interests for r in regions],
+                self.merge_gap,
+            )
+
+        if plan == self._plan:
+            return
+
+        self._plan = plan
+        # Rectangles dropped from the plan would otherwise keep showing
+        # their last copied pixels. Pool arrays are cleared when they are
+        # next written, as a feed may still be reading one.
+        if self._canvas is not None:
+            self._canvas.fill(0)
+
+        width, height = self.source.resolution
+        if plan is None:
+            logger.debug(f"Publishing the full screen ({width}x{height}).")
+        else:
+            area = sum(rect_area(rect) for rect in plan)
+            logger.debug(
+                f"Publishing {len(plan)} region(s) "
+                f"({area / (width * height):.1%} of the screen)."
+            )
+
+    def _wanted_region(self) -> tuple[int, int, int, int] | None:
+        """Returns the padded bounding box of the plan, or None if unplanned."""
+        if self._plan is None:
+            return None
+
+        width, height = self.source.resolution
+        left, top, right, bottom = bounding_rect(self._plan)
+        margin = self.region_margin
+        region = (
+            max(left - margin, 0),
+            max(top - margin, 0),
+            min(right + margin, width),
+            min(bottom + margin, height),
+        )
+        return None if region == (0, 0, width, height) else region
+
+    def _update_region(self) -> None:
+        """
+        Moves the source region towards the plan's bounding box.
+
+        Called with `_lock` held before each frame is read.
+        """
+        wanted = self._wanted_region()
+        current = self._region
+
+        if wanted == current:
+            self._shrinkable_since = None
+            return
+
+        fits = wanted is not None and (
+            current is None or bounding_rect([current, wanted]) == current
+        )
+        if fits:
+            full = (0, 0, *self.source.resolution)
+            if rect_area(wanted) * 2 > rect_area(current or full):
+                self._shrinkable_since = None
+                return
+            if self._shrinkable_since is None:
+                self._shrinkable_since = self._sequence
+            if self._sequence - self._shrinkable_since < self.shrink_after:
+                return
+
+        self._region = wanted
+        self._shrinkable_since = None
+        if self.source.is_capturing:
+            self.source.set_region(wanted, self.target_fps)
+        logger.debug(f"Capturing source region {wanted or 'full screen'}.")
+
+    def _free_buffer(self, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Returns a pool array no feed holds, cleared for the current plan."""
+        if self._buffers and self._buffers[0].shape != shape:
+            self._buffers, self._holds, self._buffer_plans = [], [], []
+
+        for i, buffer in enumerate(self._buffers):
+            if self._holds[i] == 0 and buffer is not self._frame:
+                break
+        else:
+            self._buffers.append(np.zeros(shape, dtype=dtype))
+            self._holds.append(0)
+            self._buffer_plans.append(self._plan)
+            i = len(self._buffers) - 1
+
+        if self._buffer_plans[i] != self._plan:
+            self._buffers[i].fill(0)
+            self._buffer_plans[i] = self._plan
+
+        return self._buffers[i]
+
+    def _hold(self, frame: np.ndarray | None, change: int) -> None:
+        """Adds `change` to the holds on `frame` if it is a pool array."""
+        for i, buffer in enumerate(self._buffers):
+            if buffer is frame:
+                self._holds[i] += change
+                return
+
+    def _publish(self, frame: np.ndarray) -> np.ndarray:
+        """Crops and resizes a source frame into a free published buffer."""
+        if self._plan is None and self.output_size is None:
+            return frame
+
+        width, height = self.resolution
+        buffer = self._free_buffer((height, width, frame.shape[2]), frame.dtype)
+
+        # The source region is the full screen whenever there is no plan.
+        if self._plan is None:
+            canvas = frame
+        else:
+            canvas = buffer
+            if self.output_size is not None:
+                source_width, source_height = self.source.resolution
+                shape = (source_height, source_width, frame.shape[2])
+                if self._canvas is None or self._canvas.shape != shape:
+                    self._canvas = np.zeros(shape, dtype=frame.dtype)
+                canvas = self._canvas
+
+            # The source delivers its region; planned rectangles are in
+            # screen coordinates.
+            offset_x, offset_y = (self._region or (0, 0))[:2]
+            for left, top, right, bottom in self._plan:
+                canvas[top:bottom, left:right] = frame[
+                    top - offset_y : bottom - offset_y,
+                    left - offset_x : right - offset_x,
+                ]
+
+        if canvas is not buffer:
+            cv2.resize(
+                canvas, self.output_size, dst=buffer, interpolation=cv2.INTER_AREA
+            )
+
+        return buffer
+
+    def stop(self) -> None:
+        """Stops the underlying frame source if it is running."""
+        if self.source.is_capturing:
+            self.source.stop()
+            logger.debug("Persistent capture session stopped.")
+
+    def wait_for_frame(
+        self,
+        after: int,
+        timeout: float | None = None,
+        held: np.ndarray | None = None,
+    ) -> tuple[int, np.ndarray] | None:
+        """
+        Returns the first published frame newer than sequence `after`.
+
+        The returned frame is held for the caller: it is not overwritten
+        until it is passed back as `held` or to `release`.
+
+        Parameters
+        ----------
+        after : int
+            The sequence number of the last frame the caller has seen.
+        timeout : float | None, optional
+            The longest time in seconds to wait, or None to wait
+            indefinitely. Default is None.
+        held : np.ndarray | None, optional
+            The frame the caller received last and is done with. It is
+            released even if no new frame arrives. Default is None.
+
+        Returns
+        -------
+        tuple[int, np.ndarray] | None
+            The frame's sequence number and the full BGRA frame, or None if
+            no newer frame arrived within `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            self.release(held)
+            return None
+
+        try:
+            self._hold(held, -1)
+
+            # Another waiter may have published a frame while this one was
+            # waiting for the lock. It is only reused if no feed opened
+            # since, as it may not contain the new feed's regions.
+            if (
+                self._sequence > after
+                and self._frame is not None
+                and not self._plan_changed
+            ):
+                self._hold(self._frame, 1)
+                return self._sequence, self._frame
+
+            self._apply_plan()
+            self._update_region()
+            self.start()
+            remaining = (
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+            frame = self.source.get_latest_frame(timeout=remaining)
+
+            if frame is None:
+                return None
+
+            frame = self._publish(frame)
+            self._sequence += 1
+            self._frame = frame
+            self._hold(frame, 1)
+            return self._sequence, frame
+
+        finally:
+            self._lock.release()
+
+    def release(self, frame: np.ndarray | None) -> None:
+        """
+        Lets the session overwrite a frame returned by `wait_for_frame`.
+
+        Parameters
+        ----------
+        frame : np.ndarray | None
+            The frame, or None to do nothing.
+        """
+        if frame is None:
+            return
+
+        with self._lock:
+            self._hold(frame, -1)
+
+    def feed(
+        self,
+        region: tuple[int, int, int, int] | None = None,
+        watch: list[tuple[int, int, int, int] | None] | None = None,
+    ) -> "RegionFeed":
+        """
+        Creates a feed of `region` views for a single waiter.
+
+        Parameters
+        ----------
+        region : tuple[int, int, int, int] | None, optional
+            The (left, top, right, bottom) region to view, or None for the
+            full frame. Default is None.
+        watch : list[tuple[int, int, int, int] | None] | None, optional
+            The regions of the full frame the waiter actually reads, when it
+            views the full frame but only looks at parts of it. A None entry
+            stands for the full screen. Default is None (`region`).
+
+        Returns
+        -------
+        RegionFeed
+            A feed that only yields frames captured after it was created.
+            Close it, or use it as a context manager, once done.
+        """
+        regions = [region] if watch is None else watch
+        return RegionFeed(self, region, None if None in regions else regions)
+
+
+class RegionFeed:
+    """
+    One waiter's view of a `CaptureSession`.
+
+    A feed only yields frames published after it was created, so a poll
+    that starts right after a controller input never evaluates a frame
+    from before that input. Frames are returned as views into the shared
+    published frame, which stays unchanged until the feed's next
+    `get_latest_frame` or `close`; keep a copy to use pixels after that.
+
+    The feed's regions are part of the session's capture plan until it is
+    closed (or garbage collected).
+
+    Attributes
+    ----------
+    session : CaptureSession
+        The session the feed reads from.
+    region : tuple[int, int, int, int] | None
+        The (left, top, right, bottom) region returned, or None for the full
+        frame.
+    """
+
+    def __init__(
+        self,
+        session: CaptureSession,
+        region: tuple[int, int, int, int] | None,
+        watch: list[tuple[int, int, int, int]] | None = None,
+    ) -> None:
+        self.session = session
+        self.region = region
+        self._last_sequence = session.sequence
+        # The published frame this feed holds, in a list the finalizer can
+        # see without keeping the feed alive.
+        self._held: list[np.ndarray | None] = [None]
+        self._release = weakref.finalize(
+            self, _close_feed, session, session._register(watch), self._held
+        )
+
+    def __enter__(self) -> "RegionFeed":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Removes the feed's regions from the session's capture plan and
+        releases the last frame it returned.
+        """
+        self._release()
+
+    def get_latest_frame(self, timeout: float | None = None) -> np.ndarray | None:
+        """
+        Waits for the next frame and returns the feed's region of it.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            The longest time in seconds to wait, or None to wait
+            indefinitely. Default is None.
+
+        Returns
+        -------
+        np.ndarray | None
+            A view of the region, or None if no new frame arrived in time.
+            Either way, the previously returned frame may now change.
+        """
+        held, self._held[0] = self._held[0], None
+        published = self.session.wait_for_frame(self._last_sequence, timeout, held)
+
+        if published is None:
+            return None
+
+        self._last_sequence, frame = published
+        self._held[0] = frame
+
+        if self.region is None:
+            return frame
+
+        left, top, right, bottom = self.region
+        return frame[top:bottom, left:right]
+
+
+def _close_feed(
+    session: CaptureSession, token: int, held: list[np.ndarray | None]
+) -> None:
+    """Releases a feed's plan registration and the frame it holds."""
+    session._release(token)
+    session.release(held[0])
+    held[0] = None
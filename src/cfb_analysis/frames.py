@@ -0,0 +1,475 @@
+"""
+Frame sources: the live desktop and recorded sessions.
+
+Every source supplies BGRA frames through the same small interface, so the
+vision code runs unchanged against the live chiaki-ng stream, a recording
+replayed on another machine, or the console simulator.
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import cv2
+import numpy as np
+from loguru import logger
+
+if TYPE_CHECKING:
+    import dxcam_cpp as dxcam
+
+
+class FrameSourceExhaustedError(Exception):
+    """Raised when a recorded frame source has no frames left to replay."""
+
+
+class FrameSource(ABC):
+    """
+    Common interface for everything that can supply BGRA frames.
+
+    The interface mirrors the subset of the dxcam `DXCamera` API that the
+    pipeline relies on, so the vision functions can run against the live
+    desktop or a recorded session without knowing which one they are
+    using.
+
+    Attributes
+    ----------
+    is_capturing : bool
+        True between `start` and `stop`.
+    """
+
+    is_capturing: bool = False
+
+    @property
+    @abstractmethod
+    def resolution(self) -> tuple[int, int]:
+        """The (width, height) of a full frame."""
+
+    @abstractmethod
+    def start(
+        self,
+        target_fps: int = 60,
+        region: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        """
+        Begins delivering frames through `get_latest_frame`.
+
+        Parameters
+        ----------
+        target_fps : int, optional
+            The requested capture rate. Default is 60.
+        region : tuple[int, int, int, int] | None, optional
+            The (left, top, right, bottom) region to deliver, or None for
+            the full frame. Default is None.
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stops delivering frames."""
+
+    def set_region(
+        self,
+        region: tuple[int, int, int, int] | None,
+        target_fps: int = 60,
+    ) -> None:
+        """
+        Changes the region delivered by a running source.
+
+        The default restarts capture with the new region. Sources that
+        crop in software override it to switch without a restart.
+
+        Parameters
+        ----------
+        region : tuple[int, int, int, int] | None
+            The (left, top, right, bottom) region to deliver, or None for
+            the full frame.
+        target_fps : int, optional
+            The capture rate to restart with. Default is 60.
+        """
+        if self.is_capturing:
+            self.stop()
+        self.start(target_fps=target_fps, region=region)
+
+    @abstractmethod
+    def get_latest_frame(self, timeout: float | None = None) -> np.ndarray | None:
+        """
+        Blocks until the next frame is available and returns it.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            The longest time in seconds to wait for a new frame, or None
+            to wait indefinitely. Default is None.
+
+        Returns
+        -------
+        np.ndarray | None
+            The BGRA frame (cropped to the active region), or None if no
+            frame arrived within `timeout`.
+        """
+
+    @abstractmethod
+    def grab(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray | None:
+        """
+        Returns a single frame without starting continuous capture.
+
+        Parameters
+        ----------
+        region : tuple[int, int, int, int] | None, optional
+            The (left, top, right, bottom) region to return, or None for
+            the full frame. Default is None.
+
+        Returns
+        -------
+        np.ndarray | None
+            The BGRA frame, or None if no new frame is available.
+        """
+
+
+class DXCamFrameSource(FrameSource):
+    """
+    Live desktop capture backed by a dxcam `DXCamera`.
+
+    Attributes
+    ----------
+    camera : dxcam.DXCamera
+        The underlying Desktop Duplication camera.
+    """
+
+    def __init__(self, camera: "dxcam.DXCamera") -> None:
+        """Wraps an already created dxcam camera."""
+        self.camera = camera
+
+    @property
+    def is_capturing(self) -> bool:
+        return self.camera.is_capturing
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        return self.camera.width, self.camera.height
+
+    def start(
+        self,
+        target_fps: int = 60,
+        region: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        # Video mode re-emits the last frame when the desktop is static,
+        # so `get_latest_frame` returns at least once per frame interval.
+        self.camera.start(target_fps=target_fps, region=region, video_mode=True)
+
+    def stop(self) -> None:
+        self.camera.stop()
+
+    def get_latest_frame(self, timeout: float | None = None) -> np.ndarray | None:
+        """
+        Blocks until the next frame is available and returns it.
+
+        `timeout` is ignored: dxcam's wait cannot be bounded, so the
+        capture runs in video mode, which re-emits the last frame and
+        returns within one frame interval of `target_fps` instead.
+        """
+        return self.camera.get_latest_frame()
+
+    def grab(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray | None:
+        return self.camera.grab(region=region)
+
+
+class _ReplayFrameSource(FrameSource):
+    """
+    Shared playback logic for recorded sessions.
+
+    Frames are replayed in order, one per `get_latest_frame` or `grab`
+    call. With `fps` set to None the recording is replayed as fast as the
+    caller consumes it, which is what benchmarks and regression runs want.
+    Otherwise playback is paced to the recorded frame rate.
+
+    Attributes
+    ----------
+    fps : float | None
+        The playback rate in frames per second, or None for unthrottled
+        playback.
+    loop : bool
+        If True, playback restarts at the first frame after the last one.
+    """
+
+    def __init__(self, fps: float | None = None, loop: bool = False) -> None:
+        self.fps = fps
+        self.loop = loop
+        self.is_capturing = False
+        self._region: tuple[int, int, int, int] | None = None
+        self._index = 0
+        self._next_frame_time = 0.0
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """The number of recorded frames."""
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        height, width = self._read_frame(0).shape[:2]
+        return width, height
+
+    @abstractmethod
+    def _read_frame(self, index: int) -> np.ndarray:
+        """Returns the full BGRA frame stored at `index`."""
+
+    def _next_frame(
+        self,
+        region: tuple[int, int, int, int] | None,
+        timeout: float | None = None,
+    ) -> np.ndarray | None:
+        """
+        Advances playback by one frame and returns it cropped to `region`.
+
+        Returns None without advancing if the next frame is not due within
+        `timeout` seconds.
+
+        Raises
+        ------
+        FrameSourceExhaustedError
+            If every frame has been replayed and `loop` is False.
+        """
+        if self._index >= len(self):
+            if not self.loop or len(self) == 0:
+                raise FrameSourceExhaustedError(
+                    f"Replay finished after {self._index} frames."
+                )
+            self._index = 0
+
+        if self.fps is not None:
+            # Hold each frame until its scheduled presentation time.
+            delay = self._next_frame_time - time.monotonic()
+            if timeout is not None and delay > timeout:
+                time.sleep(max(timeout, 0.0))
+                return None
+            if delay > 0:
+                time.sleep(delay)
+            self._next_frame_time = (
+                max(self._next_frame_time, time.monotonic()) + 1.0 / self.fps
+            )
+
+        frame = self._read_frame(self._index)
+        self._index += 1
+
+        if region is None:
+            return frame
+
+        left, top, right, bottom = region
+        return frame[top:bottom, left:right]
+
+    def start(
+        self,
+        target_fps: int = 60,
+        region: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        self._region = region
+        self._next_frame_time = time.monotonic()
+        self.is_capturing = True
+
+    def stop(self) -> None:
+        self.is_capturing = False
+
+    def set_region(
+        self,
+        region: tuple[int, int, int, int] | None,
+        target_fps: int = 60,
+    ) -> None:
+        self._region = region
+
+    def get_latest_frame(self, timeout: float | None = None) -> np.ndarray | None:
+        return self._next_frame(self._region, timeout)
+
+    def grab(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray | None:
+        return self._next_frame(region)
+
+    def rewind(self) -> None:
+        """Restarts playback from the first frame."""
+        self._index = 0
+
+    def frame_at(self, index: int) -> np.ndarray:
+        """Returns the full BGRA frame at `index` without moving playback."""
+        return self._read_frame(index)
+
+
+class ImageDirectoryFrameSource(_ReplayFrameSource):
+    """
+    Replays a directory of captured PNG frames in filename order.
+
+    Frames are decoded lazily, so arbitrarily long sessions can be
+    replayed without loading them into memory first.
+
+    Attributes
+    ----------
+    frame_paths : list[Path]
+        The sorted PNG files that make up the session.
+    """
+
+    def __init__(
+        self, directory: Path, fps: float | None = None, loop: bool = False
+    ) -> None:
+        super().__init__(fps=fps, loop=loop)
+        self.frame_paths = sorted(Path(directory).glob("*.png"))
+
+        if not self.frame_paths:
+            raise FileNotFoundError(f"No PNG frames found in {directory}")
+
+    def __len__(self) -> int:
+        return len(self.frame_paths)
+
+    def _read_frame(self, index: int) -> np.ndarray:
+        image = cv2.imread(self.frame_paths[index], cv2.IMREAD_UNCHANGED)
+
+        if image is None:
+            raise FileNotFoundError(f"Failed to read frame {self.frame_paths[index]}")
+
+        # Match dxcam's BGRA output regardless of how the PNG was saved.
+        if image.ndim == 2:
+            return cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
+        if image.shape[2] == 3:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+        return image
+
+
+class RawRecordingFrameSource(_ReplayFrameSource):
+    """
+    Replays a raw BGRA recording through a read-only memory map.
+
+    A recording is a flat file of back-to-back `height x width x 4` uint8
+    frames, paired with a JSON sidecar (same name, `.json` suffix) that
+    stores `width`, `height` and `fps`. Frames are returned as views into
+    the memory map, so replay costs no decoding and no copies.
+
+    Attributes
+    ----------
+    frames : np.memmap
+        The memory-mapped recording with shape (n_frames, height, width, 4).
+    """
+
+    def __init__(self, path: Path, realtime: bool = False, loop: bool = False) -> None:
+        path = Path(path)
+        metadata = json.loads(path.with_suffix(".json").read_text())
+        height, width = metadata["height"], metadata["width"]
+        n_frames = path.stat().st_size // (height * width * 4)
+
+        super().__init__(fps=metadata["fps"] if realtime else None, loop=loop)
+        self.frames = np.memmap(
+            path, dtype=np.uint8, mode="r", shape=(n_frames, height, width, 4)
+        )
+
+    def __len__(self) -> int:
+        return self.frames.shape[0]
+
+    def _read_frame(self, index: int) -> np.ndarray:
+        return self.frames[index]
+
+
+def create_frame_source(spec: str) -> FrameSource:
+    """
+    Builds the frame source described by `spec`.
+
+    Parameters
+    ----------
+    spec : str
+        "dxcam" for live desktop capture, the path to a directory of PNG
+        frames, or the path to a raw BGRA recording.
+
+    Returns
+    -------
+    FrameSource
+        The configured frame source.
+
+    Raises
+    ------
+    FileNotFoundError
+        If `spec` is neither "dxcam" nor an existing recording.
+    """
+    if spec == "dxcam":
+        # Desktop Duplication only exists on Windows.
+        import dxcam_cpp as dxcam
+
+        camera = dxcam.create(device_idx=0, output_idx=0, output_color="BGRA")
+        return DXCamFrameSource(camera)
+
+    path = Path(spec)
+
+    if path.is_dir():
+        return ImageDirectoryFrameSource(path)
+    if path.is_file():
+        return RawRecordingFrameSource(path)
+
+    raise FileNotFoundError(f"Capture source '{spec}' does not exist.")
+
+
+def record_raw_session(
+    source: FrameSource,
+    output_path: Path,
+    duration: float,
+    target_fps: int = 30,
+    region: tuple[int, int, int, int] | None = None,
+) -> int:
+    """
+    Records frames from `source` into a raw BGRA recording.
+
+    The output can be replayed with `RawRecordingFrameSource`, which is
+    how sessions captured on the Windows capture box are replayed on other
+    machines.
+
+    Parameters
+    ----------
+    source : FrameSource
+        The frame source to record from (normally the live dxcam source).
+    output_path : Path
+        The raw recording file to write. The JSON sidecar is written next
+        to it.
+    duration : float
+        The length of the recording in seconds.
+    target_fps : int, optional
+        The capture rate to request from the source. Default is 30.
+    region : tuple[int, int, int, int] | None, optional
+        The (left, top, right, bottom) region to record, or None for the
+        full frame. Default is None.
+
+    Returns
+    -------
+    int
+        The number of frames written.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    logger.info(f"Recording {duration}s of frames to {output_path}...")
+    source.start(target_fps=target_fps, region=region)
+    n_frames = 0
+    shape: tuple[int, ...] = ()
+
+    try:
+        with output_path.open("wb") as file:
+            deadline = time.monotonic() + duration
+
+            while time.monotonic() < deadline:
+                frame = source.get_latest_frame()
+
+                if frame is None:
+                    continue
+
+                frame.tofile(file)
+                shape = frame.shape
+                n_frames += 1
+
+    finally:
+        source.stop()
+
+    if n_frames:
+        output_path.with_suffix(".json").write_text(
+            json.dumps({"height": shape[0], "width": shape[1], "fps": target_fps})
+        )
+
+    logger.success(f"Recorded {n_frames} frames to {output_path}.")
+    return n_frames
@@ -0,0 +1,206 @@
+"""
+Virtual DualShock 4 (DS4) inputs.
+
+ViGEm, and with it `vgamepad`, only exists on Windows, so the DS4 input
+constants are defined here with the values `vgamepad` uses. The live
+`vgamepad.VDS4Gamepad` accepts them unchanged, and the runs that never touch
+a console (replays, re-processing and the simulator) do not import
+`vgamepad` at all.
+"""
+
+from enum import Enum, IntEnum, IntFlag, auto
+from typing import NamedTuple, Protocol
+
+
+class DS4_BUTTONS(IntFlag):
+    """The standard DS4 button bits of `vgamepad.DS4_BUTTONS`."""
+
+    DS4_BUTTON_SQUARE = 1 << 4
+    DS4_BUTTON_CROSS = 1 << 5
+    DS4_BUTTON_CIRCLE = 1 << 6
+    DS4_BUTTON_TRIANGLE = 1 << 7
+    DS4_BUTTON_SHOULDER_LEFT = 1 << 8
+    DS4_BUTTON_SHOULDER_RIGHT = 1 << 9
+    DS4_BUTTON_TRIGGER_LEFT = 1 << 10
+    DS4_BUTTON_TRIGGER_RIGHT = 1 << 11
+    DS4_BUTTON_OPTIONS = 1 << 13
+
+
+class DS4_DPAD_DIRECTIONS(IntEnum):
+    """The D-Pad directions of `vgamepad.DS4_DPAD_DIRECTIONS`."""
+
+    DS4_BUTTON_DPAD_NORTH = 0
+    DS4_BUTTON_DPAD_EAST = 2
+    DS4_BUTTON_DPAD_SOUTH = 4
+    DS4_BUTTON_DPAD_WEST = 6
+    DS4_BUTTON_DPAD_NONE = 8
+
+
+class DS4_SPECIAL_BUTTONS(IntFlag):
+    """The special button bits of `vgamepad.DS4_SPECIAL_BUTTONS`."""
+
+    DS4_SPECIAL_BUTTON_PS = 1 << 0
+
+
+class InputType(Enum):
+    """
+    Categorizes the types of virtual controller inputs.
+
+    This enumeration ensures that each button press is routed to the
+    correct underlying `vgamepad` method, as standard buttons, D-Pad
+    directions, and special buttons require different API calls.
+
+    Attributes
+    ----------
+    STANDARD : InputType
+        Represents standard face buttons, options button, bumpers, and
+        triggers.
+    DPAD : InputType
+        Represents directional pad inputs.
+    SPECIAL : InputType
+        Represents special buttons, such as the PlayStation button.
+    """
+
+    DPAD = auto()
+    SPECIAL = auto()
+    STANDARD = auto()
+
+
+class Button(Enum):
+    """
+    Mappings for virtual DualShock 4 (DS4) controller inputs.
+
+    This enumeration maps readable button names to their corresponding
+    input categories and vgamepad bitmasks. The `.value` property of each
+    member returns a `tuple[InputType, int]`.
+
+    Attributes
+    ----------
+    DPAD_UP : Button
+        The D-Pad North (Up) direction.
+    DPAD_DOWN : Button
+        The D-Pad South (Down) direction.
+    DPAD_LEFT : Button
+        The D-Pad West (Left) direction.
+    DPAD_RIGHT : Button
+        The D-Pad East (Right) direction.
+    DPAD_NEUTRAL : Button
+        The state representing a released or neutral D-Pad.
+    SQUARE : Button
+        The Square face button.
+    TRIANGLE : Button
+        The Triangle face button.
+    CROSS : Button
+        The Cross (X) face button.
+    CIRCLE : Button
+        The Circle face button.
+    L1 : Button
+        The L1 bumper button.
+    R1 : Button
+        The R1 bumper button.
+    L2 : Button
+        The L2 trigger button.
+    R2 : Button
+        The R2 trigger button.
+    PS : Button
+        The PlayStation (PS) special menu button.
+    OPTIONS : Button
+        The Options menu button.
+    """
+
+    # D-Pad Directions.
+    DPAD_UP = (InputType.DPAD, DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_NORTH)
+    DPAD_DOWN = (InputType.DPAD, DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_SOUTH)
+    DPAD_LEFT = (InputType.DPAD, DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_WEST)
+    DPAD_RIGHT = (InputType.DPAD, DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_EAST)
+    DPAD_NEUTRAL = (InputType.DPAD, DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_NONE)
+
+    # Face Buttons.
+    SQUARE = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_SQUARE)
+    TRIANGLE = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_TRIANGLE)
+    CROSS = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_CROSS)
+    CIRCLE = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_CIRCLE)
+
+    # Bumpers and Triggers.
+    L1 = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_SHOULDER_LEFT)
+    R1 = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_SHOULDER_RIGHT)
+    L2 = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_TRIGGER_LEFT)
+    R2 = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_TRIGGER_RIGHT)
+
+    # Menu Buttons.
+    PS = (InputType.SPECIAL, DS4_SPECIAL_BUTTONS.DS4_SPECIAL_BUTTON_PS)
+    OPTIONS = (InputType.STANDARD, DS4_BUTTONS.DS4_BUTTON_OPTIONS)
+
+
+class InputStep(NamedTuple):
+    """
+    One press-and-release of a controller button within an input sequence.
+
+    Attributes
+    ----------
+    button : Button
+        The button to press.
+    action_time : float
+        The duration in seconds the button is held down.
+    rest_time : float
+        The duration in seconds to wait after the release before the next
+        step is pressed.
+    """
+
+    button: Button
+    action_time: float
+    rest_time: float
+
+
+class Gamepad(Protocol):
+    """
+    The subset of the `vgamepad.VDS4Gamepad` API that `VirtualController`
+    calls.
+
+    `VDS4Gamepad`, `NullGamepad` and the console simulator's gamepad all
+    satisfy it.
+    """
+
+    def press_button(self, button: int) -> None: ...
+
+    def release_button(self, button: int) -> None: ...
+
+    def press_special_button(self, special_button: int) -> None: ...
+
+    def release_special_button(self, special_button: int) -> None: ...
+
+    def directional_pad(self, direction: int) -> None: ...
+
+    def reset(self) -> None: ...
+
+    def update(self) -> None: ...
+
+
+class NullGamepad:
+    """
+    A gamepad that accepts the `vgamepad.VDS4Gamepad` calls and sends nothing.
+
+    Used by runs that replay recorded frames, where there is no console to
+    send inputs to.
+    """
+
+    def press_button(self, button: int) -> None:
+        pass
+
+    def release_button(self, button: int) -> None:
+        pass
+
+    def press_special_button(self, special_button: int) -> None:
+        pass
+
+    def release_special_button(self, special_button: int) -> None:
+        pass
+
+    def directional_pad(self, direction: int) -> None:
+        pass
+
+    def reset(self) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
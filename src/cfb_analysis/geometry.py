@@ -0,0 +1,121 @@
+"""Screen geometry shared by the capture, vision and roster code."""
+
+import itertools
+
+# The output size the template assets were cut at.
+REFERENCE_RESOLUTION = (1920, 1080)
+
+
+def normalize_region(
+    region: tuple[int, int, int, int],
+    resolution: tuple[int, int] = REFERENCE_RESOLUTION,
+) -> tuple[float, float, float, float]:
+    """
+    Converts a pixel region to fractions of the screen size.
+
+    Parameters
+    ----------
+    region : tuple[int, int, int, int]
+        The (left, top, right, bottom) region in pixels.
+    resolution : tuple[int, int], optional
+        The (width, height) the region was measured at. Default is
+        `REFERENCE_RESOLUTION`.
+
+    Returns
+    -------
+    tuple[float, float, float, float]
+        The region with every coordinate between 0.0 and 1.0.
+    """
+    width, height = resolution
+    left, top, right, bottom = region
+    return (left / width, top / height, right / width, bottom / height)
+
+
+def denormalize_region(
+    region: tuple[float, float, float, float], resolution: tuple[int, int]
+) -> tuple[int, int, int, int]:
+    """
+    Converts a normalized region to pixels at `resolution`.
+
+    Parameters
+    ----------
+    region : tuple[float, float, float, float]
+        The (left, top, right, bottom) region as fractions of the screen.
+    resolution : tuple[int, int]
+        The (width, height) of the frames the region is applied to.
+
+    Returns
+    -------
+    tuple[int, int, int, int]
+        The region in pixels.
+    """
+    width, height = resolution
+    left, top, right, bottom = region
+    return (
+        round(left * width),
+        round(top * height),
+        round(right * width),
+        round(bottom * height),
+    )
+
+
+def bounding_rect(
+    regions: list[tuple[int, int, int, int]],
+) -> tuple[int, int, int, int]:
+    """Returns the smallest rectangle that contains every region."""
+    return (
+        min(region[0] for region in regions),
+        min(region[1] for region in regions),
+        max(region[2] for region in regions),
+        max(region[3] for region in regions),
+    )
+
+
+def rect_area(region: tuple[int, int, int, int]) -> int:
+    """Returns the area of a (left, top, right, bottom) rectangle, or 0."""
+    left, top, right, bottom = region
+    return max(0, right - left) * max(0, bottom - top)
+
+
+def plan_capture_regions(
+    regions: list[tuple[int, int, int, int]], merge_gap: int = 32
+) -> list[tuple[int, int, int, int]]:
+    """
+    Merges the regions being watched into as few capture rectangles as
+    possible.
+
+    Two rectangles are merged into their bounding rectangle when they
+    overlap or are at most `merge_gap` pixels apart both horizontally and
+    vertically, so icons that sit next to each other are captured as one
+    block while regions on opposite sides of the screen stay separate.
+    Merging repeats until no pair qualifies.
+
+    Parameters
+    ----------
+    regions : list[tuple[int, int, int, int]]
+        The (left, top, right, bottom) regions to capture.
+    merge_gap : int, optional
+        The largest gap in pixels that is captured rather than skipped to
+        save a rectangle. Default is 32.
+
+    Returns
+    -------
+    list[tuple[int, int, int, int]]
+        The merged capture rectangles, sorted by position.
+    """
+    plan = [tuple(region) for region in regions if rect_area(region) > 0]
+
+    merged = True
+    while merged:
+        merged = False
+        for i, j in itertools.combinations(range(len(plan)), 2):
+            a, b = plan[i], plan[j]
+            gap_x = max(a[0], b[0]) - min(a[2], b[2])
+            gap_y = max(a[1], b[1]) - min(a[3], b[3])
+            if gap_x <= merge_gap and gap_y <= merge_gap:
+                plan[i] = bounding_rect([a, b])
+                del plan[j]
+                merged = True
+                break
+
+    return sorted(plan)
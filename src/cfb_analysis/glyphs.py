@@ -0,0 +1,385 @@
+"""Reading the game's roster font with glyph templates."""
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+
+class CellReading(NamedTuple):
+    """
+    The text read from one cell by a `GlyphBank`.
+
+    Attributes
+    ----------
+    text : str
+        The recognized text. Characters that matched no glyph well
+        enough are read as "?".
+    confidences : tuple[float, ...]
+        The match confidence of each character, spaces excluded.
+    """
+
+    text: str
+    confidences: tuple[float, ...]
+
+    @property
+    def confidence(self) -> float:
+        """The lowest character confidence (1.0 for an empty cell)."""
+        return min(self.confidences, default=1.0)
+
+
+class GlyphBank:
+    """
+    Reads text drawn in the game's fixed font by matching glyph templates.
+
+    A cell is binarized and cut into glyphs at its blank columns. A run
+    of ink wider than any known glyph is two touching glyphs, and is
+    split at its thinnest column. Each glyph is scaled by the cell height,
+    so it keeps its width and its height above the baseline. It is then
+    centred in a `GLYPH_SIZE` canvas and scored against every template by
+    normalized cross-correlation. This is the `cv2.TM_CCOEFF_NORMED`
+    score that `cv2.matchTemplate` gives for a template of the same size.
+    Because every glyph has the same size, the scores for a whole batch
+    of cells come from one matrix product.
+
+    Attributes
+    ----------
+    characters : list[str]
+        The character each template stands for.
+    templates : np.ndarray
+        The `GLYPH_SIZE` glyph templates, stacked in `characters` order.
+    space_width : float
+        The narrowest gap between glyphs, as a fraction of the cell
+        height, that is read as a space.
+    max_glyph_width : float
+        The widest single glyph, as a fraction of the cell height.
+    min_confidence : float
+        The lowest score accepted as a character; worse glyphs are read
+        as "?".
+    """
+
+    GLYPH_SIZE = (32, 40)  # (width, height)
+    # Cells are resampled to this height before binarizing, so glyphs
+    # captured at any resolution are cut the same way.
+    CELL_HEIGHT = 60
+    METRICS_FILE = "metrics.json"
+    # A cell whose pixels vary less than this is empty.
+    MIN_CELL_STD = 8.0
+
+    def __init__(
+        self,
+        characters: list[str],
+        templates: np.ndarray,
+        space_width: float = 0.15,
+        max_glyph_width: float = 0.6,
+        min_confidence: float = 0.6,
+    ) -> None:
+        self.characters = characters
+        self.templates = templates
+        self.space_width = space_width
+        self.max_glyph_width = max_glyph_width
+        self.min_confidence = min_confidence
+        self._vectors = self._unit_vectors(templates)
+
+    @classmethod
+    def from_samples(
+        cls, samples: list[tuple[np.ndarray, str]], **kwargs
+    ) -> "GlyphBank":
+        """
+        Builds a bank from cells whose text is known.
+
+        Every sample is cut into glyphs, which are paired with the
+        sample's characters in order. Touching glyphs are split until
+        there is one glyph per character. The template of each character
+        is the mean of all of its glyphs. The space and glyph widths are
+        learned from the same samples. A sample that cannot be cut into
+        one glyph per character is skipped, with a warning.
+
+        Parameters
+        ----------
+        samples : list[tuple[np.ndarray, str]]
+            Grayscale cell images and the text shown in each.
+        **kwargs
+            Passed on to the constructor.
+
+        Returns
+        -------
+        GlyphBank
+            The bank of every character seen in `samples`.
+        """
+        glyphs: dict[str, list[np.ndarray]] = {}
+        widths, letter_gaps, space_gaps = [], [], []
+
+        for cell, text in samples:
+            ink, runs = cls._cut(cell)
+            characters = text.replace(" ", "")
+
+            while 0 < len(runs) < len(characters):
+                widest = max(range(len(runs)), key=lambda i: runs[i][1] - runs[i][0])
+                split = cls._split(ink, *runs[widest], max_width=1)
+                if len(split) == 1:
+                    break
+                runs[widest : widest + 1] = split[:2]
+
+            if len(runs) != len(characters):
+                logger.warning(
+                    f"Skipped glyph sample '{text}': found {len(runs)} glyphs "
+                    f"for {len(characters)} characters."
+                )
+                continue
+
+            height = ink.shape[0]
+            words = text.split()
+            is_space = [
+                i > 0 and j == 0
+                for i, word in enumerate(words)
+                for j in range(len(word))
+            ]
+            for i, (left, right) in enumerate(runs):
+                widths.append((right - left) / height)
+                if i > 0:
+                    gap = (left - runs[i - 1][1]) / height
+                    (space_gaps if is_space[i] else letter_gaps).append(gap)
+
+            for character, glyph in zip(
+                characters, cls._normalize(ink, runs), strict=True
+            ):
+                glyphs.setdefault(character, []).append(glyph)
+
+        if letter_gaps and space_gaps:
+            kwargs.setdefault("space_width", (max(letter_gaps) + min(space_gaps)) / 2)
+        if widths:
+            kwargs.setdefault("max_glyph_width", max(widths) * 1.1)
+
+        characters = sorted(glyphs)
+        templates = np.stack(
+            [np.mean(glyphs[c], axis=0).astype(np.uint8) for c in characters]
+        )
+        return cls(characters, templates, **kwargs)
+
+    @classmethod
+    def load(cls, directory: Path, **kwargs) -> "GlyphBank":
+        """
+        Loads a bank saved with `save`.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory holding one PNG per character, named by its
+            hexadecimal code point, and the learned widths, e.g.
+            `GLYPH_DIR / "1920x1080"`.
+        **kwargs
+            Passed on to the constructor.
+
+        Returns
+        -------
+        GlyphBank
+            The loaded bank.
+
+        Raises
+        ------
+        FileNotFoundError
+            If `directory` holds no glyph PNGs or one of them cannot be read.
+        """
+        paths = sorted(directory.glob("*.png"))
+        if not paths:
+            raise FileNotFoundError(f"No glyph PNGs found in {directory}")
+
+        characters = [chr(int(path.stem, 16)) for path in paths]
+        images = [cv2.imread(path, cv2.IMREAD_GRAYSCALE) for path in paths]
+        for path, image in zip(paths, images, strict=True):
+            if image is None:
+                raise FileNotFoundError(f"Failed to read glyph {path}")
+        templates = np.stack(images)
+
+        metrics = directory / cls.METRICS_FILE
+        if metrics.is_file():
+            for name, value in json.loads(metrics.read_text()).items():
+                kwargs.setdefault(name, value)
+
+        return cls(characters, templates, **kwargs)
+
+    def save(self, directory: Path) -> None:
+        """
+        Writes every template to `directory` as a PNG.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory to write to, e.g. `GLYPH_DIR / "1920x1080"`.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        for character, template in zip(self.characters, self.templates, strict=True):
+            cv2.imwrite(directory / f"{ord(character):04x}.png", template)
+
+        metrics = {
+            "space_width": self.space_width,
+            "max_glyph_width": self.max_glyph_width,
+        }
+        (directory / self.METRICS_FILE).write_text(json.dumps(metrics))
+
+    @classmethod
+    def _cut(cls, cell: np.ndarray) -> tuple[np.ndarray, list[tuple[int, int]]]:
+        """
+        Separates a grayscale cell's glyphs from its background and finds
+        the runs of inked columns.
+
+        Returns
+        -------
+        tuple[np.ndarray, list[tuple[int, int]]]
+            The cell's ink, bright on a black background with its
+            anti-aliasing kept, and the (left, right) column range of
+            every run, from left to right.
+        """
+        if cell.size == 0 or cell.std() < cls.MIN_CELL_STD:
+            return cell, []
+
+        height, width = cell.shape
+        if height != cls.CELL_HEIGHT:
+            cell = cv2.resize(
+                cell,
+                (max(1, round(width * cls.CELL_HEIGHT / height)), cls.CELL_HEIGHT),
+                interpolation=(
+                    cv2.INTER_AREA if height > cls.CELL_HEIGHT else cv2.INTER_CUBIC
+                ),
+            )
+
+        _, binary = cv2.threshold(cell, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        # Glyphs are the minority of the pixels, whatever the colours.
+        if np.count_nonzero(binary) > binary.size // 2:
+            binary = cv2.bitwise_not(binary)
+            cell = cv2.bitwise_not(cell)
+
+        ink = cv2.subtract(cell, int(np.median(cell)))
+        inked = np.concatenate(([False], binary.any(axis=0), [False]))
+        edges = np.flatnonzero(inked[1:] != inked[:-1])
+        return ink, list(zip(edges[::2].tolist(), edges[1::2].tolist(), strict=True))
+
+    @staticmethod
+    def _split(
+        ink: np.ndarray, left: int, right: int, max_width: int
+    ) -> list[tuple[int, int]]:
+        """Splits a run wider than `max_width` at its thinnest column."""
+        if right - left <= max_width or right - left < 4:
+            return [(left, right)]
+
+        # Glyphs that touch share only a pixel or two of ink.
+        column_ink = ink[:, left + 2 : right - 2].sum(axis=0)
+        cut = left + 2 + int(column_ink.argmin())
+        return [(left, cut), (cut, right)]
+
+    @classmethod
+    def _normalize(
+        cls, ink: np.ndarray, runs: list[tuple[int, int]]
+    ) -> list[np.ndarray]:
+        """Scales each run of `ink` into a `GLYPH_SIZE` glyph image."""
+        width, height = cls.GLYPH_SIZE
+        scale = height / ink.shape[0]
+        glyphs = []
+
+        for left, right in runs:
+            glyph_width = min(width, max(1, round((right - left) * scale)))
+            glyph = cv2.resize(
+                ink[:, left:right],
+                (glyph_width, height),
+                interpolation=cv2.INTER_AREA,
+            )
+            canvas = np.zeros((height, width), dtype=np.uint8)
+            offset = (width - glyph_width) // 2
+            canvas[:, offset : offset + glyph_width] = glyph
+            glyphs.append(canvas)
+
+        return glyphs
+
+    def _segment(self, cell: np.ndarray) -> tuple[list[np.ndarray], list[int]]:
+        """
+        Cuts a grayscale cell into normalized glyph images.
+
+        Returns
+        -------
+        tuple[list[np.ndarray], list[int]]
+            The `GLYPH_SIZE` glyphs from left to right, and the indices of
+            the glyphs that follow a space.
+        """
+        ink, runs = self._cut(cell)
+        height = ink.shape[0]
+        max_width = round(self.max_glyph_width * height)
+
+        glyph_runs: list[tuple[int, int]] = []
+        pending = runs[::-1]
+        while pending:
+            split = self._split(ink, *pending.pop(), max_width=max_width)
+            if len(split) == 1:
+                glyph_runs.append(split[0])
+            else:
+                pending.extend(split[::-1])
+
+        spaces = [
+            i
+            for i in range(1, len(glyph_runs))
+            if glyph_runs[i][0] - glyph_runs[i - 1][1] >= self.space_width * height
+        ]
+        return self._normalize(ink, glyph_runs), spaces
+
+    @staticmethod
+    def _unit_vectors(glyphs: np.ndarray) -> np.ndarray:
+        """Flattens glyphs into zero-mean, unit-length rows."""
+        vectors = glyphs.reshape(len(glyphs), -1).astype(np.float32)
+        vectors -= vectors.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-6)
+
+    def read_batch(self, cells: list[np.ndarray]) -> list[CellReading]:
+        """
+        Reads many cells in one pass.
+
+        Parameters
+        ----------
+        cells : list[np.ndarray]
+            Grayscale cell images. Cells from different columns, and of
+            different widths, can be mixed.
+
+        Returns
+        -------
+        list[CellReading]
+            The reading of each cell, in the order given.
+        """
+        segmented = [self._segment(cell) for cell in cells]
+        glyphs = [glyph for cut, _ in segmented for glyph in cut]
+
+        if not glyphs:
+            return [CellReading("", ()) for _ in cells]
+
+        scores = self._unit_vectors(np.stack(glyphs)) @ self._vectors.T
+        best = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(glyphs)), best]
+
+        readings = []
+        position = 0
+        for cut, spaces in segmented:
+            cell_best = best[position : position + len(cut)]
+            cell_confidences = confidences[position : position + len(cut)]
+            position += len(cut)
+
+            text = []
+            for i, (index, confidence) in enumerate(
+                zip(cell_best, cell_confidences, strict=True)
+            ):
+                if i in spaces:
+                    text.append(" ")
+                text.append(
+                    self.characters[index] if confidence >= self.min_confidence else "?"
+                )
+
+            readings.append(
+                CellReading("".join(text), tuple(cell_confidences.tolist()))
+            )
+
+        return readings
+
+    def read(self, cell: np.ndarray) -> CellReading:
+        """Reads a single cell (see `read_batch`)."""
+        return self.read_batch([cell])[0]
@@ -0,0 +1,79 @@
+"""The PS5 home screen's recent games row and where its tiles sit."""
+
+from typing import NamedTuple
+
+from cfb_analysis.geometry import REFERENCE_RESOLUTION
+
+
+class HomeTileRow(NamedTuple):
+    """
+    The geometry of the recent games row on the PS5 home screen.
+
+    Every game tile has its title label under it, starting at the tile's
+    left edge, so one capture of the label band shows where each game sits
+    in the row.
+
+    Attributes
+    ----------
+    region : tuple[int, int, int, int]
+        The screen coordinates (left, top, right, bottom) covering the
+        title labels of the whole row. All geometry is measured at
+        `REFERENCE_RESOLUTION`.
+    first_tile_x : int
+        The x coordinate where the first game tile (the one right of the
+        welcome tile) and its label start.
+    tile_pitch : int
+        The horizontal distance in pixels between neighbouring tiles.
+    """
+
+    region: tuple[int, int, int, int]  # (left, top, right, bottom)
+    first_tile_x: int
+    tile_pitch: int
+
+    def scaled(self, resolution: tuple[int, int]) -> "HomeTileRow":
+        """Scales geometry measured at `REFERENCE_RESOLUTION` to `resolution`."""
+        scale_x = resolution[0] / REFERENCE_RESOLUTION[0]
+        scale_y = resolution[1] / REFERENCE_RESOLUTION[1]
+
+        if (scale_x, scale_y) == (1.0, 1.0):
+            return self
+
+        left, top, right, bottom = self.region
+        return self._replace(
+            region=(
+                round(left * scale_x),
+                round(top * scale_y),
+                round(right * scale_x),
+                round(bottom * scale_y),
+            ),
+            first_tile_x=round(self.first_tile_x * scale_x),
+            tile_pitch=round(self.tile_pitch * scale_x),
+        )
+
+    def tile_index(self, x: int) -> int:
+        """
+        Returns the game tile whose label starts nearest to `x`.
+
+        Parameters
+        ----------
+        x : int
+            The screen x coordinate of a label, e.g. a template match
+            location offset by the region's left edge.
+
+        Returns
+        -------
+        int
+            The zero-based index of the tile in the row, which is also the
+            number of DPAD_RIGHT presses from the first game tile to it.
+        """
+        return max(0, round((x - self.first_tile_x) / self.tile_pitch))
+
+
+# Approximate geometry at `REFERENCE_RESOLUTION`; verify with
+# `preview_capture` against the live home screen. If the game's label is
+# not found in `region`, `launch_cfb_game` checks the tiles one at a time.
+HOME_TILE_ROW = HomeTileRow(
+    region=(180, 295, 1920, 345),
+    first_tile_x=200,
+    tile_pitch=130,
+)
@@ -0,0 +1,339 @@
+"""
+The text format of controller input macros.
+
+`compile_macro` turns macro text into pre-timed `InputStep` sequences that
+end in vision checkpoints, and `record_macro` recovers macro text from the
+controller inputs in a pipeline log. Playing a macro needs the controller
+and the capture session, so that is left to the notebook's `run_macro`.
+"""
+
+import re
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from cfb_analysis.gamepad import Button, InputStep
+
+# A controller input as `VirtualController` logs it, in the format of the
+# notebook's `_configure_logging`.
+_LOGGED_INPUT = re.compile(
+    r"^(?P<time>\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.\d{3}) \| \w+\s* \| "
+    r"(?P<phase>\S+) \| .* - Controller input executed: "
+    r"(?P<kind>tap|hold) (?P<button>\w+) \(rest time: (?P<rest>[\d.]+)s\)$"
+)
+
+
+class MacroSyntaxError(Exception):
+    """Raised when an input macro cannot be parsed."""
+
+
+class MacroTiming(NamedTuple):
+    """
+    The input timings a macro is compiled and recorded with.
+
+    Attributes
+    ----------
+    tap_time : float
+        The duration in seconds a tapped button is held down.
+    hold_time : float
+        The duration in seconds a held button is held down.
+    rest_time : float
+        The rest in seconds after an input without a `rest` option, and
+        the default checkpoint timeout.
+    """
+
+    tap_time: float
+    hold_time: float
+    rest_time: float
+
+
+class MacroSegment(NamedTuple):
+    """
+    A run of pre-timed inputs within a compiled macro.
+
+    Attributes
+    ----------
+    delay : float
+        The duration in seconds to wait before the first input.
+    steps : list[InputStep]
+        The inputs, played back to back as one controller sequence.
+    checkpoint : Any | None
+        The screen change that must follow the inputs, as built by the
+        `checkpoint` parser of `compile_macro`, or None.
+    timeout : float
+        The longest time in seconds to wait for `checkpoint` after the
+        inputs finish.
+    """
+
+    delay: float
+    steps: list[InputStep]
+    checkpoint: Any | None
+    timeout: float
+
+
+class CompiledMacro:
+    """
+    An input macro compiled into pre-timed controller sequences.
+
+    Inputs between checkpoints are played as one controller sequence, so
+    a macro costs only its own press and rest times plus the time each
+    checkpoint takes to appear on screen.
+
+    Attributes
+    ----------
+    name : str
+        The name runs of the macro are timed under.
+    segments : list[MacroSegment]
+        The input runs, each optionally ending in a vision checkpoint.
+    """
+
+    def __init__(self, name: str, segments: list[MacroSegment]) -> None:
+        self.name = name
+        self.segments = segments
+
+    def timeline(self) -> list[tuple[float, str, str]]:
+        """
+        Lists every press and release with its offset from the start.
+
+        Checkpoints are assumed to confirm immediately, so this is the
+        fastest possible run; comparing it across versions of a macro
+        shows the time their inputs alone cost.
+
+        Returns
+        -------
+        list[tuple[float, str, str]]
+            The offset in seconds, the button name, and "press" or
+            "release" for every input event.
+        """
+        events = []
+        offset = 0.0
+        for segment in self.segments:
+            offset += segment.delay
+            for step in segment.steps:
+                events.append((round(offset, 3), step.button.name, "press"))
+                offset += step.action_time
+                events.append((round(offset, 3), step.button.name, "release"))
+                offset += step.rest_time
+
+        return events
+
+    @property
+    def duration(self) -> float:
+        """The fastest possible run time in seconds (see `timeline`)."""
+        return sum(
+            segment.delay
+            + sum(step.action_time + step.rest_time for step in segment.steps)
+            for segment in self.segments
+        )
+
+
+def compile_macro(
+    text: str,
+    timing: MacroTiming,
+    checkpoint: Callable[[list[str], int], Any],
+    name: str = "macro",
+) -> CompiledMacro:
+    """
+    Compiles a macro from its text format.
+
+    One statement per line; `#` starts a comment::
+
+        DPAD_RIGHT x4 rest=0.1        # tap four times, 0.1 s apart
+        CROSS                         # tap with the default rest
+        PS hold rest=1.0              # hold instead of tap
+        wait 0.5                      # extra pause before the next input
+        expect change timeout=0.5     # any full-screen change
+        expect change 0,0,960,540     # any change in a region
+        expect appears PS5_SETTINGS_ICON timeout=2.0
+        expect disappears CFB_GAME_TITLE
+
+    An `expect` line is a vision checkpoint for the inputs since the
+    previous one: they are sent as one sequence and the macro continues
+    as soon as the change is seen, or after `timeout` (default:
+    `timing.rest_time`).
+
+    Parameters
+    ----------
+    text : str
+        The macro source.
+    timing : MacroTiming
+        The press times of taps and holds and the default rest.
+    checkpoint : Callable[[list[str], int], Any]
+        Builds the checkpoint of an `expect` line from its words (options
+        removed) and its line number. Raises `MacroSyntaxError` if the
+        words describe no known checkpoint.
+    name : str, optional
+        The name runs are timed under. Default is "macro".
+
+    Returns
+    -------
+    CompiledMacro
+        The compiled macro.
+
+    Raises
+    ------
+    MacroSyntaxError
+        If a line cannot be parsed.
+    """
+    segments: list[MacroSegment] = []
+    delay = 0.0
+    steps: list[InputStep] = []
+
+    for line_number, raw_line in enumerate(text.splitlines(), start=1):
+        words = raw_line.split("#", 1)[0].split()
+        if not words:
+            continue
+
+        options: dict[str, float] = {}
+        for word in [w for w in words if "=" in w]:
+            key, _, value = word.partition("=")
+            if key not in ("rest", "timeout"):
+                raise MacroSyntaxError(f"Line {line_number}: unknown option '{key}'.")
+            try:
+                options[key] = float(value)
+            except ValueError as e:
+                raise MacroSyntaxError(
+                    f"Line {line_number}: '{word}' is not a number."
+                ) from e
+        words = [w for w in words if "=" not in w]
+
+        if words[0] == "wait":
+            try:
+                seconds = float(words[1])
+            except (IndexError, ValueError) as e:
+                raise MacroSyntaxError(
+                    f"Line {line_number}: expected 'wait <seconds>'."
+                ) from e
+            # A pause is the previous input's rest, made longer.
+            if steps:
+                steps[-1] = steps[-1]._replace(rest_time=steps[-1].rest_time + seconds)
+            else:
+                delay += seconds
+
+        elif words[0] == "expect":
+            if not steps:
+                raise MacroSyntaxError(
+                    f"Line {line_number}: 'expect' must follow an input."
+                )
+            timeout = options.get("timeout", timing.rest_time)
+            segments.append(
+                MacroSegment(delay, steps, checkpoint(words, line_number), timeout)
+            )
+            delay, steps = 0.0, []
+
+        else:
+            try:
+                button = Button[words[0]]
+            except KeyError as e:
+                raise MacroSyntaxError(
+                    f"Line {line_number}: unknown button '{words[0]}'."
+                ) from e
+
+            count = 1
+            is_hold = False
+            for word in words[1:]:
+                if word == "hold":
+                    is_hold = True
+                elif word == "tap":
+                    is_hold = False
+                elif re.fullmatch(r"x\d+", word):
+                    count = int(word[1:])
+                else:
+                    raise MacroSyntaxError(f"Line {line_number}: unexpected '{word}'.")
+
+            step = InputStep(
+                button,
+                timing.hold_time if is_hold else timing.tap_time,
+                options.get("rest", timing.rest_time),
+            )
+            steps.extend([step] * count)
+
+    if steps or delay:
+        segments.append(MacroSegment(delay, steps, None, 0.0))
+
+    return CompiledMacro(name, segments)
+
+
+def record_macro(
+    log_path: Path,
+    timing: MacroTiming,
+    phase: str | None = None,
+    min_wait: float = 0.05,
+) -> str:
+    """
+    Reconstructs the macro text of the inputs recorded in a session log.
+
+    Every input the controller plays is logged at TRACE level with its
+    rest time, after that rest has passed, so the log must be written at
+    that level. Idle time between inputs beyond the logged rests (for
+    example while the pipeline was polling for a template) becomes a `wait`
+    statement, and consecutive identical taps are collapsed.
+
+    Parameters
+    ----------
+    log_path : Path
+        A pipeline log file.
+    timing : MacroTiming
+        The press times the logged inputs were played with.
+    phase : str | None, optional
+        Only record inputs logged in this phase (e.g. "launch"). Default
+        is None (all phases).
+    min_wait : float, optional
+        Idle gaps shorter than this many seconds are dropped. Default is
+        0.05.
+
+    Returns
+    -------
+    str
+        The macro text, which `compile_macro` accepts.
+    """
+    inputs = []
+    with Path(log_path).open(encoding="utf-8") as file:
+        for line in file:
+            logged = _LOGGED_INPUT.match(line.strip())
+            if logged is None or (phase and logged["phase"] != phase):
+                continue
+
+            inputs.append(
+                (
+                    datetime.strptime(logged["time"], "%Y-%m-%d %H:%M:%S.%f"),
+                    Button[logged["button"]],
+                    logged["kind"],
+                    float(logged["rest"]),
+                )
+            )
+
+    statements: list[list] = []  # [button, kind, rest, count, wait]
+    for index, (logged_at, button, kind, rest) in enumerate(inputs):
+        wait = 0.0
+        if index + 1 < len(inputs):
+            next_at, _, next_kind, next_rest = inputs[index + 1]
+            action = timing.hold_time if next_kind == "hold" else timing.tap_time
+            idle = (next_at - logged_at).total_seconds() - action - next_rest
+            wait = idle if idle >= min_wait else 0.0
+
+        previous = statements[-1] if statements else None
+        if (
+            previous is not None
+            and previous[:3] == [button, kind, rest]
+            and previous[4] == 0.0
+        ):
+            previous[3] += 1
+            previous[4] = wait
+        else:
+            statements.append([button, kind, rest, 1, wait])
+
+    lines = []
+    for button, kind, rest, count, wait in statements:
+        words = [button.name]
+        if kind == "hold":
+            words.append("hold")
+        if count > 1:
+            words.append(f"x{count}")
+        words.append(f"rest={rest:g}")
+        lines.append(" ".join(words))
+        if wait:
+            lines.append(f"wait {wait:.2f}")
+
+    return "\n".join(lines) + "\n"
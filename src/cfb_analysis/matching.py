@@ -0,0 +1,261 @@
+"""
+Coarse-to-fine template matching.
+
+`find_template` is the hot path of every vision waiter, so it searches a
+downscaled copy of large regions first and only matches at full resolution
+around the most promising coarse peaks.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+import cv2
+import numpy as np
+
+# The coarsest pyramid level must keep enough template detail to produce a
+# meaningful correlation peak.
+_MIN_COARSE_TEMPLATE_SIDE = 12
+# Below this many candidate positions a single full-resolution pass is
+# already cheaper than building a pyramid.
+_MIN_PYRAMID_POSITIONS = 4096
+# A true match scores somewhat lower on a blurred pyramid level, so the
+# coarse pass only rejects candidates well below the final threshold.
+_COARSE_REJECT_MARGIN = 0.25
+# Blurring can rank a look-alike above the true match, so this many
+# separate coarse peaks are refined at full resolution.
+_COARSE_CANDIDATES = 5
+
+# Per-thread scratch buffers reused across frames, keyed by shape and dtype,
+# so the polling hot path does not allocate new arrays for every frame.
+_scratch = threading.local()
+# The scratch buffers each thread keeps. A waiter needs a few shapes per
+# template (coarse image, coarse scores and fine scores), and fine windows
+# clipped at the image edge add more, so the least recently used are
+# dropped instead of growing with every shape ever matched.
+_MAX_SCRATCH_BUFFERS = 16
+
+
+class TemplateMatch(NamedTuple):
+    """
+    The outcome of searching an image for a template.
+
+    Attributes
+    ----------
+    is_match : bool
+        True if `confidence` exceeds the requested confidence threshold.
+    confidence : float
+        The best normalized correlation score (0.0 to 1.0) found.
+    location : tuple[int, int]
+        The (x, y) position of the top-left corner of the best match,
+        relative to the searched image.
+    """
+
+    is_match: bool
+    confidence: float
+    location: tuple[int, int]  # (x, y)
+
+
+def _scratch_buffer(shape: tuple[int, int], dtype: type) -> np.ndarray:
+    """Returns this thread's reusable buffer of the given shape and dtype."""
+    buffers = _scratch.__dict__.setdefault("buffers", OrderedDict())
+    buffer = buffers.get((shape, dtype))
+
+    if buffer is None:
+        buffer = buffers[shape, dtype] = np.empty(shape, dtype)
+        if len(buffers) > _MAX_SCRATCH_BUFFERS:
+            buffers.popitem(last=False)
+    else:
+        buffers.move_to_end((shape, dtype))
+
+    return buffer
+
+
+def _match_scores(image: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """Runs TM_CCOEFF_NORMED into a scratch buffer and returns the scores."""
+    result_shape = (
+        image.shape[0] - template.shape[0] + 1,
+        image.shape[1] - template.shape[1] + 1,
+    )
+    return cv2.matchTemplate(
+        image,
+        template,
+        cv2.TM_CCOEFF_NORMED,
+        result=_scratch_buffer(result_shape, np.float32),
+    )
+
+
+def _best_match(
+    image: np.ndarray, template: np.ndarray
+) -> tuple[float, tuple[int, int]]:
+    """Returns the peak score of `template` in `image` and its location."""
+    _, max_val, _, max_loc = cv2.minMaxLoc(_match_scores(image, template))
+    return max_val, max_loc
+
+
+def _coarse_peaks(
+    scores: np.ndarray, template_shape: tuple[int, ...], floor: float
+) -> list[tuple[float, tuple[int, int]]]:
+    """
+    Returns up to `_COARSE_CANDIDATES` separate peaks of `scores`.
+
+    Each peak suppresses the positions within half a template of it, so
+    the candidates are distinct places in the image rather than
+    neighbours of the best one. `scores` is overwritten.
+    """
+    template_h, template_w = template_shape[:2]
+    radius_x, radius_y = max(1, template_w // 2), max(1, template_h // 2)
+    peaks = []
+
+    while len(peaks) < _COARSE_CANDIDATES:
+        _, max_val, _, (x, y) = cv2.minMaxLoc(scores)
+        if max_val < floor:
+            break
+
+        peaks.append((max_val, (x, y)))
+        scores[
+            max(0, y - radius_y) : y + radius_y + 1,
+            max(0, x - radius_x) : x + radius_x + 1,
+        ] = -1.0
+
+    return peaks
+
+
+def build_template_pyramid(
+    template: np.ndarray, max_level: int = 3
+) -> list[np.ndarray]:
+    """
+    Precomputes the downscaled templates used by `find_template`.
+
+    Parameters
+    ----------
+    template : np.ndarray
+        The full-resolution grayscale template.
+    max_level : int, optional
+        The deepest level to compute. Default is 3.
+
+    Returns
+    -------
+    list[np.ndarray]
+        The template halved `i` times at index `i`, starting with the
+        template itself.
+    """
+    return [template] + [
+        cv2.resize(
+            template,
+            None,
+            fx=1.0 / (1 << level),
+            fy=1.0 / (1 << level),
+            interpolation=cv2.INTER_AREA,
+        )
+        for level in range(1, max_level + 1)
+    ]
+
+
+def _select_pyramid_level(
+    image_shape: tuple[int, ...], template_shape: tuple[int, ...], max_level: int
+) -> int:
+    """Returns the coarsest useful pyramid level for this search."""
+    image_h, image_w = image_shape[:2]
+    template_h, template_w = template_shape[:2]
+    positions = (image_h - template_h + 1) * (image_w - template_w + 1)
+
+    if positions < _MIN_PYRAMID_POSITIONS:
+        return 0
+
+    level = 0
+    while (
+        level < max_level
+        and min(template_h, template_w) >> (level + 1) >= _MIN_COARSE_TEMPLATE_SIDE
+    ):
+        level += 1
+
+    return level
+
+
+def find_template(
+    gray_image: np.ndarray,
+    template: np.ndarray,
+    confidence_threshold: float = 0.90,
+    max_pyramid_level: int = 3,
+    template_pyramid: list[np.ndarray] | None = None,
+) -> TemplateMatch:
+    """
+    Locates a template in a grayscale image using coarse-to-fine matching.
+
+    The search first runs on a downscaled copy of both images to find the
+    most likely match positions, then refines each of them at full
+    resolution inside a small window around it. For large search regions
+    this scans a fraction of the positions a single full-resolution pass
+    would. Small searches, where the pyramid cannot pay for itself, fall
+    back to a single full-resolution pass.
+
+    Parameters
+    ----------
+    gray_image : np.ndarray
+        The single-channel image to search.
+    template : np.ndarray
+        The grayscale image array used as the template for matching.
+    confidence_threshold : float, optional
+        The minimum match value (0.0 to 1.0) required to consider it a
+        successful match. Default is 0.90.
+    max_pyramid_level : int, optional
+        The maximum number of times both images may be halved for the
+        coarse pass. Default is 3.
+    template_pyramid : list[np.ndarray] | None, optional
+        Precomputed downscaled templates, where index `i` holds the template
+        halved `i` times (see `TemplateBank`). Missing levels are computed
+        on the fly. Default is None.
+
+    Returns
+    -------
+    TemplateMatch
+        The match flag, best confidence and top-left match location. If the
+        coarse pass already rules out a match, the confidence is the coarse
+        estimate.
+    """
+    level = _select_pyramid_level(gray_image.shape, template.shape, max_pyramid_level)
+
+    if level == 0:
+        max_val, max_loc = _best_match(gray_image, template)
+        return TemplateMatch(max_val > confidence_threshold, max_val, max_loc)
+
+    # Coarse pass on the downscaled image and template.
+    image_h, image_w = gray_image.shape[:2]
+    coarse_shape = (image_h >> level, image_w >> level)
+    coarse_image = cv2.resize(
+        gray_image,
+        (coarse_shape[1], coarse_shape[0]),
+        dst=_scratch_buffer(coarse_shape, np.uint8),
+        interpolation=cv2.INTER_AREA,
+    )
+    if template_pyramid is not None and level < len(template_pyramid):
+        coarse_template = template_pyramid[level]
+    else:
+        coarse_template = build_template_pyramid(template, level)[level]
+    coarse_scores = _match_scores(coarse_image, coarse_template)
+    _, coarse_val, _, (coarse_x, coarse_y) = cv2.minMaxLoc(coarse_scores)
+    coarse_floor = confidence_threshold - _COARSE_REJECT_MARGIN
+
+    if coarse_val < coarse_floor:
+        coarse_loc = (coarse_x << level, coarse_y << level)
+        return TemplateMatch(False, coarse_val, coarse_loc)
+
+    peaks = _coarse_peaks(coarse_scores, coarse_template.shape, coarse_floor)
+
+    # Fine pass on a full-resolution window around each coarse peak.
+    template_h, template_w = template.shape[:2]
+    margin = 2 << level
+    best_val, best_loc = -1.0, (0, 0)
+
+    for _, (coarse_x, coarse_y) in peaks:
+        left = max(0, (coarse_x << level) - margin)
+        top = max(0, (coarse_y << level) - margin)
+        right = min(image_w, (coarse_x << level) + template_w + margin)
+        bottom = min(image_h, (coarse_y << level) + template_h + margin)
+
+        max_val, (x, y) = _best_match(gray_image[top:bottom, left:right], template)
+        if max_val > best_val:
+            best_val, best_loc = max_val, (left + x, top + y)
+
+    return TemplateMatch(best_val > confidence_threshold, best_val, best_loc)
@@ -0,0 +1,312 @@
+"""The View Rosters player table: its geometry, cells and records."""
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from cfb_analysis.gamepad import Button
+from cfb_analysis.geometry import REFERENCE_RESOLUTION
+from cfb_analysis.glyphs import GlyphBank
+
+# A row whose name cell varies less than this is empty.
+_EMPTY_CELL_STD = 8.0
+
+
+class RosterColumn(NamedTuple):
+    """
+    One column of the View Rosters player table.
+
+    Attributes
+    ----------
+    name : str
+        The field the column's values are recorded under.
+    left : int
+        The x coordinate where the column starts.
+    right : int
+        The x coordinate where the column ends.
+    """
+
+    name: str
+    left: int
+    right: int
+
+
+class RosterTable(NamedTuple):
+    """
+    The geometry of the player table on the View Rosters screen.
+
+    Attributes
+    ----------
+    region : tuple[int, int, int, int]
+        The screen coordinates (left, top, right, bottom) covering the
+        player rows, without the header. All geometry is measured at
+        `REFERENCE_RESOLUTION`.
+    rows_per_page : int
+        The number of player rows shown on one page.
+    columns : tuple[RosterColumn, ...]
+        The columns to extract, in screen order.
+    next_page : Button, optional
+        The button that shows the next page of players. Default is
+        `Button.R1`.
+    roster_size : int, optional
+        The largest number of players on a roster. Default is 85.
+    """
+
+    region: tuple[int, int, int, int]  # (left, top, right, bottom)
+    rows_per_page: int
+    columns: tuple[RosterColumn, ...]
+    next_page: Button = Button.R1
+    roster_size: int = 85
+
+    @property
+    def row_height(self) -> float:
+        """The height in pixels of one player row."""
+        return (self.region[3] - self.region[1]) / self.rows_per_page
+
+    def scaled(self, resolution: tuple[int, int]) -> "RosterTable":
+        """Scales geometry measured at `REFERENCE_RESOLUTION` to `resolution`."""
+        scale_x = resolution[0] / REFERENCE_RESOLUTION[0]
+        scale_y = resolution[1] / REFERENCE_RESOLUTION[1]
+
+        if (scale_x, scale_y) == (1.0, 1.0):
+            return self
+
+        left, top, right, bottom = self.region
+        return self._replace(
+            region=(
+                round(left * scale_x),
+                round(top * scale_y),
+                round(right * scale_x),
+                round(bottom * scale_y),
+            ),
+            columns=tuple(
+                column._replace(
+                    left=round(column.left * scale_x),
+                    right=round(column.right * scale_x),
+                )
+                for column in self.columns
+            ),
+        )
+
+
+# Approximate geometry at `REFERENCE_RESOLUTION`; verify with
+# `preview_capture` against a live View Rosters screen, along with the
+# `next_page` button, then set `ROSTER_TABLE_MEASURED`.
+ROSTER_TABLE_MEASURED = False
+ROSTER_TABLE = RosterTable(
+    region=(120, 260, 1800, 980),
+    rows_per_page=12,
+    columns=(
+        RosterColumn("name", 140, 700),
+        RosterColumn("position", 720, 880),
+        RosterColumn("year", 900, 1100),
+        RosterColumn("overall", 1120, 1260),
+    ),
+)
+
+
+class PlayerRecord(NamedTuple):
+    """
+    One player row extracted from the roster table.
+
+    Attributes
+    ----------
+    page : int
+        The roster page the player was shown on, starting at 0.
+    row : int
+        The row on that page, starting at 0.
+    cells : dict[str, np.ndarray]
+        The grayscale image of each column's cell, keyed by column name.
+    fields : dict[str, str]
+        The text read from each cell, keyed by column name. Empty when
+        the extraction ran without a glyph bank.
+    confidences : dict[str, float]
+        The lowest character confidence of each read cell, keyed by
+        column name.
+    """
+
+    page: int
+    row: int
+    cells: dict[str, np.ndarray]
+    fields: dict[str, str]
+    confidences: dict[str, float]
+
+
+class RosterPageTiming(NamedTuple):
+    """
+    How long one roster page took to extract.
+
+    Attributes
+    ----------
+    page : int
+        The roster page, starting at 0.
+    players : int
+        The number of players read from the page.
+    settle_time : float
+        The time in seconds until the page had stopped changing.
+    duration : float
+        The time in seconds the page held up navigation, including
+        turning to the next one.
+    recognition_time : float
+        The time in seconds spent reading the page's cells, in the
+        background.
+    """
+
+    page: int
+    players: int
+    settle_time: float
+    duration: float
+    recognition_time: float
+
+
+class RosterExtraction(NamedTuple):
+    """
+    The result of extracting a full roster.
+
+    Attributes
+    ----------
+    players : list[PlayerRecord]
+        Every extracted player, in roster order.
+    pages : list[RosterPageTiming]
+        The timing of each page, in the order they were read.
+    duration : float
+        The wall-clock time in seconds from the first page to the last
+        record written.
+    path : Path | None
+        The JSON Lines file the players were written to, if any.
+    """
+
+    players: list[PlayerRecord]
+    pages: list[RosterPageTiming]
+    duration: float
+    path: Path | None
+
+
+def segment_roster_page(
+    table_image: np.ndarray, table: RosterTable = ROSTER_TABLE
+) -> list[dict[str, np.ndarray]]:
+    """
+    Cuts one page of the roster table into cells.
+
+    Rows are evenly spaced over the table region, and each row is cut at
+    the column boundaries. Reading stops at the first row whose first
+    column is blank, which is where a short last page ends.
+
+    Parameters
+    ----------
+    table_image : np.ndarray
+        The grayscale image of `table.region`.
+    table : RosterTable, optional
+        The table geometry, at the resolution of `table_image`. Default
+        is `ROSTER_TABLE`.
+
+    Returns
+    -------
+    list[dict[str, np.ndarray]]
+        One dictionary of cell images, keyed by column name, per player
+        row shown.
+    """
+    table_left = table.region[0]
+    first_column = table.columns[0]
+    rows = []
+
+    for row in range(table.rows_per_page):
+        top = round(row * table.row_height)
+        bottom = round((row + 1) * table.row_height)
+        band = table_image[top:bottom]
+
+        first_cell = band[
+            :, first_column.left - table_left : first_column.right - table_left
+        ]
+        if first_cell.size == 0 or first_cell.std() < _EMPTY_CELL_STD:
+            break
+
+        rows.append(
+            {
+                column.name: band[
+                    :, column.left - table_left : column.right - table_left
+                ].copy()
+                for column in table.columns
+            }
+        )
+
+    return rows
+
+
+def read_roster_page(
+    page: int, rows: list[dict[str, np.ndarray]], glyph_bank: GlyphBank | None
+) -> list[PlayerRecord]:
+    """
+    Reads every cell of a roster page in one batch.
+
+    Parameters
+    ----------
+    page : int
+        The roster page, starting at 0.
+    rows : list[dict[str, np.ndarray]]
+        The page's cells, as returned by `segment_roster_page`.
+    glyph_bank : GlyphBank | None
+        The glyphs the cells are read with, or None to keep them as images
+        only.
+
+    Returns
+    -------
+    list[PlayerRecord]
+        One record per row, in row order.
+    """
+    readings = iter(
+        glyph_bank.read_batch([cell for cells in rows for cell in cells.values()])
+        if glyph_bank is not None
+        else []
+    )
+
+    records = []
+    for row, cells in enumerate(rows):
+        read = (
+            {name: next(readings) for name in cells} if glyph_bank is not None else {}
+        )
+        records.append(
+            PlayerRecord(
+                page,
+                row,
+                cells,
+                {name: r.text for name, r in read.items()},
+                {name: r.confidence for name, r in read.items()},
+            )
+        )
+
+    return records
+
+
+def write_roster_records(path: Path, players: list[PlayerRecord]) -> None:
+    """
+    Appends players to a JSON Lines roster file.
+
+    Each line holds a player's page, row, read fields and per-field
+    confidences. Cell images are not written.
+
+    Parameters
+    ----------
+    path : Path
+        The roster file, created with its parent directories if needed.
+    players : list[PlayerRecord]
+        The players to append, in the order they are written.
+    """
+    lines = "".join(
+        json.dumps(
+            {
+                "page": player.page,
+                "row": player.row,
+                **player.fields,
+                "confidences": player.confidences,
+            }
+        )
+        + "\n"
+        for player in players
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as file:
+        file.write(lines)
@@ -0,0 +1,854 @@
+"""
+An in-process PS5 running CFB, for headless end-to-end runs.
+
+The simulator implements the `FrameSource` interface and takes its inputs
+through `FakeGamepad`, so the notebook can run the launch sequence and the
+roster extraction against it on any platform (`CFB_CAPTURE_SOURCE=simulator`).
+"""
+
+import heapq
+import json
+import os
+import threading
+import time
+from enum import Enum, auto
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from cfb_analysis.frames import FrameSource
+from cfb_analysis.gamepad import DS4_DPAD_DIRECTIONS, Button, InputType
+from cfb_analysis.geometry import REFERENCE_RESOLUTION, normalize_region
+from cfb_analysis.home import HOME_TILE_ROW
+from cfb_analysis.roster import ROSTER_TABLE
+
+# The simulator draws its screens from the repository's template assets, so
+# it runs from a source checkout rather than an installed wheel.
+TEMPLATES_DIR = Path(__file__).resolve().parents[2] / "assets" / "templates"
+
+
+@cache
+def _load_asset(name: str) -> np.ndarray:
+    """Loads a grayscale template asset from `TEMPLATES_DIR`."""
+    image = cv2.imread(TEMPLATES_DIR / name, cv2.IMREAD_GRAYSCALE)
+
+    if image is None:
+        raise FileNotFoundError(f"Failed to load template at {TEMPLATES_DIR / name}")
+
+    return image
+
+
+class SimulatedTemplate(NamedTuple):
+    """
+    A template the simulator cuts from its own drawing of a screen.
+
+    Attributes
+    ----------
+    template : np.ndarray
+        The grayscale template at `REFERENCE_RESOLUTION`.
+    region : tuple[float, float, float, float]
+        The normalized (left, top, right, bottom) search region.
+    log_context : str
+        A descriptive string identifying the target in logging output.
+    """
+
+    template: np.ndarray
+    region: tuple[float, float, float, float]
+    log_context: str
+
+
+class ConsoleState(Enum):
+    """
+    The screens modelled by the `ConsoleSimulator`.
+
+    Attributes
+    ----------
+    HOME : auto
+        The PS5 home screen with the recent games row.
+    OPTIONS_MENU : auto
+        The options menu of a home screen game tile.
+    LOADING : auto
+        A black screen shown while a game boots or closes.
+    TITLE_SCREEN : auto
+        CFB's "Press any button" screen.
+    POPUP : auto
+        A "Featured News" style pop-up covering the main menu.
+    MAIN_MENU : auto
+        CFB's main menu.
+    HOTFIX : auto
+        The hotfix overlay covering the main menu.
+    DYNASTY : auto
+        The Dynasty mode hub.
+    ROSTER : auto
+        The View Rosters player table.
+    HUNG : auto
+        A frozen stream that ignores every input.
+    """
+
+    HOME = auto()
+    OPTIONS_MENU = auto()
+    LOADING = auto()
+    TITLE_SCREEN = auto()
+    POPUP = auto()
+    MAIN_MENU = auto()
+    HOTFIX = auto()
+    DYNASTY = auto()
+    ROSTER = auto()
+    HUNG = auto()
+
+
+class SimulatorScenario(NamedTuple):
+    """
+    Latencies and injected failures for one `ConsoleSimulator` run.
+
+    Latencies are in console seconds and are divided by `time_scale`, so
+    a scenario can model realistic load times and still play out faster
+    than real time. The pipeline's own rest times are not scaled.
+
+    Attributes
+    ----------
+    time_scale : float, optional
+        How many times faster than real time the console runs. Default
+        is 1.0.
+    input_latency : float, optional
+        The time between a button release and the screen reacting.
+        Default is 0.05.
+    boot_latency : float, optional
+        The time a game spends loading before its title screen. Default
+        is 20.0.
+    close_latency : float, optional
+        The time a game takes to close. Default is 2.0.
+    popups : int, optional
+        The number of pop-ups shown between the title screen and the main
+        menu. Default is 1.
+    hotfix_delay : float | None, optional
+        The time after the main menu appears before the hotfix overlay
+        slides in, or None for no hotfix. The hotfix is installed once the
+        game is closed, so it only shows up once. Default is None.
+    game_left_open : bool, optional
+        If True, the console starts with CFB running instead of on the
+        home screen. Default is False.
+    hung_connections : int, optional
+        The number of capture sessions whose stream freezes as soon as it
+        starts. Default is 0.
+    cfb_tile_index : int, optional
+        CFB's position in the recent games row (0 is the first game
+        tile). Default is 2.
+    n_recent_games : int, optional
+        The number of tiles in the recent games row. Default is 5.
+    dropped_input_rate : float, optional
+        The probability that an input is lost. Default is 0.0.
+    roster_size : int, optional
+        The number of players on the simulated roster. Default is 85.
+    page_latency : float, optional
+        The time the roster table is blank while it turns to another
+        page. Default is 0.3.
+    seed : int, optional
+        The random seed for dropped inputs and the roster. Default is 0.
+    """
+
+    time_scale: float = 1.0
+    input_latency: float = 0.05
+    boot_latency: float = 20.0
+    close_latency: float = 2.0
+    popups: int = 1
+    hotfix_delay: float | None = None
+    game_left_open: bool = False
+    hung_connections: int = 0
+    cfb_tile_index: int = 2
+    n_recent_games: int = 5
+    dropped_input_rate: float = 0.0
+    roster_size: int = 85
+    page_latency: float = 0.3
+    seed: int = 0
+
+
+class FakeGamepad:
+    """
+    A stand-in for `vgamepad.VDS4Gamepad` that plays inputs into a simulator.
+
+    Only the subset of the vgamepad API used by `VirtualController` is
+    implemented. As with the real gamepad, state changes are only sent
+    by `update`; every button that `update` finds released is passed to
+    the console together with how long it was held.
+
+    Attributes
+    ----------
+    console : ConsoleSimulator
+        The simulator receiving the inputs.
+    """
+
+    _DPAD_NONE = int(DS4_DPAD_DIRECTIONS.DS4_BUTTON_DPAD_NONE)
+
+    def __init__(self, console: "ConsoleSimulator") -> None:
+        self.console = console
+        self._state = (0, 0, self._DPAD_NONE)
+        self._sent = self._state
+        self._pressed_at: dict[Button, float] = {}
+
+    def press_button(self, button: int) -> None:
+        buttons, special, dpad = self._state
+        self._state = (buttons | int(button), special, dpad)
+
+    def release_button(self, button: int) -> None:
+        buttons, special, dpad = self._state
+        self._state = (buttons & ~int(button), special, dpad)
+
+    def press_special_button(self, special_button: int) -> None:
+        buttons, special, dpad = self._state
+        self._state = (buttons, special | int(special_button), dpad)
+
+    def release_special_button(self, special_button: int) -> None:
+        buttons, special, dpad = self._state
+        self._state = (buttons, special & ~int(special_button), dpad)
+
+    def directional_pad(self, direction: int) -> None:
+        buttons, special, _ = self._state
+        self._state = (buttons, special, int(direction))
+
+    def reset(self) -> None:
+        self._state = (0, 0, self._DPAD_NONE)
+
+    def update(self) -> None:
+        """Sends the pending state and reports every completed press."""
+        now = time.monotonic()
+
+        for button in Button:
+            was_down = self._is_down(self._sent, button)
+            is_down = self._is_down(self._state, button)
+
+            if is_down and not was_down:
+                self._pressed_at[button] = now
+            elif was_down and not is_down:
+                hold = now - self._pressed_at.pop(button, now)
+                self.console.press(button, hold)
+
+        self._sent = self._state
+
+    def _is_down(self, state: tuple[int, int, int], button: Button) -> bool:
+        """Returns True if `button` is pressed in the gamepad `state`."""
+        input_type, value = button.value
+        buttons, special, dpad = state
+
+        if input_type == InputType.STANDARD:
+            return bool(buttons & int(value))
+        if input_type == InputType.SPECIAL:
+            return bool(special & int(value))
+        return dpad == int(value) and dpad != self._DPAD_NONE
+
+
+class ConsoleSimulator(FrameSource):
+    """
+    An in-process PS5 running CFB, for headless end-to-end runs.
+
+    The console is a small state machine covering the screens the launch
+    sequence visits: the home screen and its recent games row, the game's
+    options menu, CFB's loading and title screens, pop-ups, the main
+    menu, the hotfix overlay, the Dynasty hub and its View Rosters table.
+    Triangle on the hub opens the roster, standing in for the menu path
+    `navigate_to_rosters` will take. Inputs arrive through
+    `gamepad` and take effect after the scenario's latencies; frames are
+    rendered from the template PNGs, so the real vision code recognizes
+    them. The main menu and hotfix overlay have no template assets, so
+    the simulator draws its own and cuts matching templates (see
+    `screen_templates`). Frames are drawn at `REFERENCE_RESOLUTION`.
+
+    Scheduled transitions are applied lazily whenever a frame or input
+    arrives, so the simulator needs no thread of its own.
+
+    Attributes
+    ----------
+    scenario : SimulatorScenario
+        The latencies and injected failures in effect.
+    fps : float | None
+        The frame rate frames are paced to, or None for unthrottled
+        frames.
+    gamepad : FakeGamepad
+        The gamepad to pass to `VirtualController`.
+    roster : list[tuple[str, str, str, str]]
+        The simulated players as (name, position, year, overall).
+    """
+
+    SCREEN_SIZE = REFERENCE_RESOLUTION
+    CFB_GAME = "College Football"
+
+    def __init__(
+        self,
+        scenario: SimulatorScenario | None = None,
+        fps: float | None = 60,
+    ) -> None:
+        scenario = scenario or SimulatorScenario()
+        self.scenario = scenario
+        self.fps = fps
+        self.gamepad = FakeGamepad(self)
+        self.is_capturing = False
+        self._lock = threading.RLock()
+        self._region: tuple[int, int, int, int] | None = None
+        self._next_frame_time = 0.0
+        self._rng = np.random.default_rng(scenario.seed)
+        self._events: list[tuple[float, int, object]] = []
+        self._n_events = 0
+        self._frames: dict[tuple, np.ndarray] = {}
+
+        self._row = [f"Recent Game {i + 1}" for i in range(scenario.n_recent_games)]
+        self._row[scenario.cfb_tile_index] = self.CFB_GAME
+        # 0 is the welcome tile; n is the nth game tile.
+        self._cursor = 0
+        self._options_open = False
+        self._hung = False
+        self._hung_connections = scenario.hung_connections
+        self._hotfix_pending = scenario.hotfix_delay is not None
+        # The running game's screen, or None if no game is running. The
+        # session counter invalidates transitions scheduled by a game that
+        # has since been closed.
+        self._game_state: ConsoleState | None = None
+        self._on_home = True
+        self._closing = False
+        self._session = 0
+        self._popups_left = 0
+        self._roster_page = 0
+        self._paging = False
+        self.roster = self._generate_roster(scenario.roster_size, scenario.seed)
+
+        if scenario.game_left_open:
+            self._launch(self.CFB_GAME, at=time.monotonic())
+            # Already past the boot, so its title screen never shows.
+            self._events.clear()
+            self._game_state = ConsoleState.MAIN_MENU
+
+    def screen_templates(self) -> dict[str, SimulatedTemplate]:
+        """
+        Cuts templates of the screens that have no template asset yet.
+
+        Returns
+        -------
+        dict[str, SimulatedTemplate]
+            The simulated main menu ("CFB_MAIN_MENU") and hotfix overlay
+            ("CFB_HOTFIX_OVERLAY") at `REFERENCE_RESOLUTION`.
+        """
+        return {
+            "CFB_MAIN_MENU": SimulatedTemplate(
+                template=self._template(ConsoleState.MAIN_MENU, (120, 70, 1280, 130)),
+                region=normalize_region((100, 50, 1300, 150)),
+                log_context="CFB Main Menu",
+            ),
+            "CFB_HOTFIX_OVERLAY": SimulatedTemplate(
+                template=self._template(ConsoleState.HOTFIX, (640, 580, 1280, 660)),
+                region=normalize_region((560, 400, 1360, 700)),
+                log_context="CFB Hotfix Overlay",
+            ),
+        }
+
+    @classmethod
+    def from_env(cls) -> "ConsoleSimulator":
+        """
+        Builds a simulator from the `CFB_SIMULATOR_SCENARIO` variable.
+
+        The variable holds a JSON object of `SimulatorScenario` fields,
+        e.g. `{"time_scale": 10, "hotfix_delay": 2.0}`. Unset fields keep
+        their defaults.
+        """
+        fields = json.loads(os.environ.get("CFB_SIMULATOR_SCENARIO", "{}"))
+        return cls(SimulatorScenario(**fields))
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        return self.SCREEN_SIZE
+
+    @property
+    def state(self) -> ConsoleState:
+        """The screen currently shown."""
+        with self._lock:
+            self._advance(time.monotonic())
+            return self._visible_state()
+
+    def _visible_state(self) -> ConsoleState:
+        if self._hung:
+            return ConsoleState.HUNG
+        if self._closing:
+            return ConsoleState.LOADING
+        if self._on_home:
+            return (
+                ConsoleState.OPTIONS_MENU if self._options_open else ConsoleState.HOME
+            )
+        return self._game_state
+
+    # ==== Scheduling ===================================================
+    def _scaled(self, seconds: float) -> float:
+        """Converts console seconds to wall clock seconds."""
+        return seconds / self.scenario.time_scale
+
+    def _schedule(self, at: float, action, *args) -> None:
+        """Runs `action(at, *args)` once the clock passes `at`."""
+        self._n_events += 1
+        heapq.heappush(self._events, (at, self._n_events, (action, args)))
+
+    def _advance(self, now: float) -> None:
+        """Applies every scheduled transition that is due by `now`."""
+        while self._events and self._events[0][0] <= now:
+            at, _, (action, args) = heapq.heappop(self._events)
+            action(at, *args)
+
+    # ==== Inputs =======================================================
+    def press(self, button: Button, hold: float) -> None:
+        """
+        Receives a completed button press from the gamepad.
+
+        Parameters
+        ----------
+        button : Button
+            The button that was released.
+        hold : float
+            How long the button was held, in seconds.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            self._advance(now)
+
+            if self._hung:
+                return
+            if self._rng.random() < self.scenario.dropped_input_rate:
+                logger.debug(f"Simulator dropped {button.name}.")
+                return
+
+            self._schedule(
+                now + self._scaled(self.scenario.input_latency), self._react, button
+            )
+
+    def _react(self, at: float, button: Button) -> None:
+        """Applies the effect of `button` to the screen shown at `at`."""
+        # Inputs sent while a game is closing are lost.
+        if self._closing:
+            return
+
+        state = self._visible_state()
+
+        if button == Button.PS:
+            if self._game_state is not None and not self._on_home:
+                # Back home with the cursor on the running game.
+                self._on_home = True
+                self._cursor = 1
+            return
+
+        if state == ConsoleState.HOME:
+            self._react_home(at, button)
+        elif state == ConsoleState.OPTIONS_MENU:
+            if button == Button.CROSS:
+                self._close_game(at)
+            elif button == Button.CIRCLE:
+                self._options_open = False
+        elif state == ConsoleState.TITLE_SCREEN:
+            self._popups_left = self.scenario.popups
+            self._next_screen(at)
+        elif state == ConsoleState.POPUP:
+            if button in (Button.CIRCLE, Button.CROSS):
+                self._next_screen(at)
+        elif state == ConsoleState.MAIN_MENU:
+            if button == Button.CROSS:
+                self._game_state = ConsoleState.DYNASTY
+        elif state == ConsoleState.HOTFIX:
+            if button == Button.CROSS:
+                # "No": the update is skipped until the game restarts.
+                self._game_state = ConsoleState.MAIN_MENU
+        elif state == ConsoleState.DYNASTY:
+            if button == Button.CIRCLE:
+                self._game_state = ConsoleState.MAIN_MENU
+            elif button == Button.TRIANGLE:
+                self._game_state = ConsoleState.ROSTER
+                self._roster_page = 0
+        elif state == ConsoleState.ROSTER:
+            n_pages = -(-len(self.roster) // ROSTER_TABLE.rows_per_page)
+            if button == Button.CIRCLE:
+                self._game_state = ConsoleState.DYNASTY
+            elif button == ROSTER_TABLE.next_page:
+                self._turn_page(at, min(self._roster_page + 1, n_pages - 1))
+            elif button == Button.L1:
+                self._turn_page(at, max(self._roster_page - 1, 0))
+
+    def _react_home(self, at: float, button: Button) -> None:
+        if button == Button.DPAD_RIGHT:
+            self._cursor = min(self._cursor + 1, len(self._row))
+        elif button == Button.DPAD_LEFT:
+            self._cursor = max(self._cursor - 1, 0)
+        elif self._cursor == 0:
+            return
+        elif button == Button.OPTIONS:
+            self._options_open = True
+        elif button == Button.CROSS:
+            game = self._row[self._cursor - 1]
+
+            if self._game_state is None:
+                self._launch(game, at)
+            elif self._cursor == 1:
+                # Resume the running game.
+                self._on_home = False
+
+    def _launch(self, game: str, at: float) -> None:
+        """Boots `game` and moves it to the front of the recent games row."""
+        self._row.insert(0, self._row.pop(self._row.index(game)))
+        self._cursor = 1
+        self._session += 1
+        self._on_home = False
+        self._game_state = ConsoleState.LOADING
+        self._schedule(
+            at + self._scaled(self.scenario.boot_latency),
+            self._show_title_screen,
+            self._session,
+        )
+
+    def _show_title_screen(self, at: float, session: int) -> None:
+        if session == self._session:
+            self._game_state = ConsoleState.TITLE_SCREEN
+
+    def _next_screen(self, at: float) -> None:
+        """Dismisses the title screen or a pop-up."""
+        if self._popups_left > 0:
+            self._popups_left -= 1
+            self._game_state = ConsoleState.POPUP
+            return
+
+        self._game_state = ConsoleState.MAIN_MENU
+
+        if self._hotfix_pending:
+            self._schedule(
+                at + self._scaled(self.scenario.hotfix_delay),
+                self._show_hotfix,
+                self._session,
+            )
+
+    def _show_hotfix(self, at: float, session: int) -> None:
+        if session == self._session and self._game_state == ConsoleState.MAIN_MENU:
+            self._game_state = ConsoleState.HOTFIX
+            # Installed for good once this session is closed.
+            self._hotfix_pending = False
+
+    def _turn_page(self, at: float, page: int) -> None:
+        """Blanks the roster table while it moves to `page`."""
+        if page == self._roster_page:
+            return
+
+        self._roster_page = page
+        self._paging = True
+        self._schedule(
+            at + self._scaled(self.scenario.page_latency),
+            self._finish_page,
+            self._session,
+        )
+
+    def _finish_page(self, at: float, session: int) -> None:
+        if session == self._session:
+            self._paging = False
+
+    def _close_game(self, at: float) -> None:
+        self._options_open = False
+        self._game_state = None
+        self._session += 1
+        self._closing = True
+        self._schedule(
+            at + self._scaled(self.scenario.close_latency), self._finish_close
+        )
+
+    def _finish_close(self, at: float) -> None:
+        self._closing = False
+
+    # ==== Frames =======================================================
+    def start(
+        self,
+        target_fps: int = 60,
+        region: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        with self._lock:
+            self._region = region
+            self._next_frame_time = time.monotonic()
+            self.is_capturing = True
+
+            # Each capture session stands for one remote play connection,
+            # which wakes the console on the welcome tile unless a game
+            # was left running.
+            if self._game_state is None:
+                self._cursor = 0
+                self._options_open = False
+
+            self._hung = self._hung_connections > 0
+            if self._hung:
+                self._hung_connections -= 1
+                logger.debug("Simulated stream hung on connect.")
+
+    def stop(self) -> None:
+        self.is_capturing = False
+
+    def set_region(
+        self,
+        region: tuple[int, int, int, int] | None,
+        target_fps: int = 60,
+    ) -> None:
+        # A new region is not a new connection, so `start` is not rerun.
+        with self._lock:
+            self._region = region
+
+    def get_latest_frame(self, timeout: float | None = None) -> np.ndarray | None:
+        if self.fps is not None:
+            # Hold each frame until its scheduled presentation time.
+            delay = self._next_frame_time - time.monotonic()
+            if timeout is not None and delay > timeout:
+                time.sleep(max(timeout, 0.0))
+                return None
+            if delay > 0:
+                time.sleep(delay)
+            self._next_frame_time = (
+                max(self._next_frame_time, time.monotonic()) + 1.0 / self.fps
+            )
+
+        return self.grab(self._region)
+
+    def grab(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray | None:
+        with self._lock:
+            self._advance(time.monotonic())
+            frame = self._render()
+
+        if region is None:
+            return frame
+
+        left, top, right, bottom = region
+        return frame[top:bottom, left:right]
+
+    def _render(self) -> np.ndarray:
+        """Returns the (cached, read-only) BGRA frame for the current screen."""
+        state = self._visible_state()
+        key = (state,)
+
+        if state in (ConsoleState.HOME, ConsoleState.OPTIONS_MENU):
+            key = (state, self._cursor, tuple(self._row))
+        elif state == ConsoleState.ROSTER:
+            key = (state, self._roster_page, self._paging)
+
+        frame = self._frames.get(key)
+
+        if frame is None:
+            frame = self._draw(state)
+            frame.flags.writeable = False
+            self._frames[key] = frame
+
+        return frame
+
+    def _template(
+        self, state: ConsoleState, crop: tuple[int, int, int, int]
+    ) -> np.ndarray:
+        """Cuts a grayscale template out of a freshly drawn `state` frame."""
+        left, top, right, bottom = crop
+        gray = cv2.cvtColor(self._draw(state), cv2.COLOR_BGRA2GRAY)
+        return gray[top:bottom, left:right].copy()
+
+    def _draw(self, state: ConsoleState) -> np.ndarray:
+        """Draws the full BGRA frame for `state`."""
+        width, height = self.SCREEN_SIZE
+        frame = np.zeros((height, width, 4), dtype=np.uint8)
+        frame[..., 3] = 255
+
+        if state in (ConsoleState.LOADING, ConsoleState.HUNG):
+            return frame
+
+        if state in (ConsoleState.HOME, ConsoleState.OPTIONS_MENU):
+            self._draw_home(frame)
+            if state == ConsoleState.OPTIONS_MENU:
+                self._draw_box(frame, (1300, 300, 1860, 700), ["Close Game"])
+            return frame
+
+        frame[..., :3] = (60, 30, 20)
+
+        if state == ConsoleState.TITLE_SCREEN:
+            self._draw_text(frame, "PRESS ANY BUTTON", (700, 900), 1.5)
+            return frame
+
+        if state == ConsoleState.DYNASTY:
+            self._draw_text(frame, "DYNASTY HUB", (120, 110), 2.0)
+            return frame
+
+        if state == ConsoleState.ROSTER:
+            self._draw_roster(frame, None if self._paging else self._roster_page)
+            return frame
+
+        # The main menu, possibly covered by a pop-up or the hotfix.
+        tabs = "PLAY NOW    DYNASTY    ROAD TO GLORY    TEAM BUILDER"
+        self._draw_text(frame, tabs, (130, 115), 1.4)
+        for i, item in enumerate(["Continue", "New Dynasty", "Settings"]):
+            self._draw_text(frame, item, (160, 400 + 90 * i), 1.2)
+
+        if state == ConsoleState.POPUP:
+            frame[..., :3] //= 3
+            self._draw_box(
+                frame, (60, 30, 1860, 1050), ["FEATURED NEWS", "Press O to close"]
+            )
+        elif state == ConsoleState.HOTFIX:
+            frame[..., :3] //= 2
+            self._draw_box(
+                frame,
+                (560, 400, 1360, 700),
+                ["A new update is available.", "", "YES          NO"],
+            )
+
+        return frame
+
+    def _draw_home(self, frame: np.ndarray) -> None:
+        frame[..., :3] = (70, 35, 10)
+
+        # Settings icon, placed inside the region the pipeline searches.
+        self._paste(frame, _load_asset("ps5_settings_icon.png"), (1454, 41))
+
+        # Recent games row: the welcome tile, then the games.
+        tiles = ["Welcome", *self._row]
+        for i in range(len(tiles)):
+            x = HOME_TILE_ROW.first_tile_x + (i - 1) * HOME_TILE_ROW.tile_pitch
+            focused = i == self._cursor
+            shade = 200 if focused else 90 + (37 * i) % 80
+            size = 100 if focused else 80
+            cv2.rectangle(
+                frame, (x, 130), (x + size, 130 + size), (shade,) * 3 + (255,), -1
+            )
+
+        # Every game's label sits under its tile. CFB's is its title banner,
+        # drawn last because it is wider than a tile.
+        label_y = HOME_TILE_ROW.region[1] + 5
+        for i, game in enumerate(self._row):
+            x = HOME_TILE_ROW.first_tile_x + i * HOME_TILE_ROW.tile_pitch
+            if game != self.CFB_GAME:
+                self._draw_text(frame, game, (x, label_y + 25), 0.4)
+        if self.CFB_GAME in self._row:
+            x = HOME_TILE_ROW.first_tile_x + (
+                self._row.index(self.CFB_GAME) * HOME_TILE_ROW.tile_pitch
+            )
+            banner = _load_asset("cfb_game_title.png")
+            self._paste(frame, banner[:, : self.SCREEN_SIZE[0] - x], (x, label_y))
+
+        # The focused tile's title is shown between the row and the labels.
+        game = tiles[self._cursor]
+        if game == self.CFB_GAME:
+            self._paste(frame, _load_asset("cfb_game_title.png"), (350, 245))
+        else:
+            self._draw_text(frame, game, (350, 280), 1.2)
+
+    def _draw_roster(self, frame: np.ndarray, page: int | None) -> None:
+        """Draws the roster table showing `page` (None while paging)."""
+        self._draw_text(frame, "VIEW ROSTERS", (120, 110), 2.0)
+        left, top, right, _ = ROSTER_TABLE.region
+        for column in ROSTER_TABLE.columns:
+            self._draw_text(frame, column.name.upper(), (column.left, top - 30), 1.0)
+
+        if page is None:
+            return
+
+        first = page * ROSTER_TABLE.rows_per_page
+        players = self.roster[first : first + ROSTER_TABLE.rows_per_page]
+        row_height = ROSTER_TABLE.row_height
+        for i, player in enumerate(players):
+            row_top = round(top + i * row_height)
+            if i % 2:
+                row_bottom = round(row_top + row_height)
+                frame[row_top:row_bottom, left:right, :3] = (75, 40, 25)
+            baseline = round(row_top + 0.7 * row_height)
+            for column, value in zip(ROSTER_TABLE.columns, player):
+                self._draw_text(frame, value, (column.left + 10, baseline), 1.0)
+
+    def glyph_samples(
+        self,
+        n_pages: int = 3,
+        resolution: tuple[int, int] = REFERENCE_RESOLUTION,
+    ) -> list[tuple[np.ndarray, str]]:
+        """
+        Cuts labelled cells out of the first `n_pages` roster pages.
+
+        Stands in for roster cells captured from the game at `resolution`
+        and labelled by hand when building a `GlyphBank`.
+
+        Returns
+        -------
+        list[tuple[np.ndarray, str]]
+            Each cell's grayscale image and the text drawn in it.
+        """
+        width, height = self.SCREEN_SIZE
+        table = ROSTER_TABLE.scaled(resolution)
+        rows_per_page = table.rows_per_page
+        samples = []
+
+        for page in range(n_pages):
+            frame = np.zeros((height, width, 4), dtype=np.uint8)
+            frame[..., :3] = (60, 30, 20)
+            self._draw_roster(frame, page)
+            if resolution != self.SCREEN_SIZE:
+                # Scaled the way `CaptureSession` scales published frames.
+                frame = cv2.resize(frame, resolution, interpolation=cv2.INTER_AREA)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)
+
+            first = page * rows_per_page
+            players = self.roster[first : first + rows_per_page]
+            for i, player in enumerate(players):
+                top = table.region[1] + round(i * table.row_height)
+                bottom = table.region[1] + round((i + 1) * table.row_height)
+                for column, value in zip(table.columns, player):
+                    cell = gray[top:bottom, column.left : column.right]
+                    samples.append((cell.copy(), value))
+
+        return samples
+
+    @staticmethod
+    def _generate_roster(size: int, seed: int) -> list[tuple[str, str, str, str]]:
+        """Makes up `size` players, the same ones for the same `seed`."""
+        rng = np.random.default_rng(seed)
+        first_names = ["JALEN", "MARCUS", "TYLER", "DEVON", "CALEB", "ISAIAH"]
+        last_names = ["SMITH", "JOHNSON", "WILLIAMS", "BROWN", "DAVIS", "MOORE"]
+        positions = ["QB", "HB", "WR", "TE", "LT", "C", "DT", "MLB", "CB", "FS"]
+        years = ["FR", "SO", "JR", "SR", "FR (RS)", "SO (RS)"]
+
+        return [
+            (
+                f"{rng.choice(first_names)} {rng.choice(last_names)}",
+                str(rng.choice(positions)),
+                str(rng.choice(years)),
+                str(rng.integers(55, 96)),
+            )
+            for _ in range(size)
+        ]
+
+    def _draw_box(
+        self,
+        frame: np.ndarray,
+        box: tuple[int, int, int, int],
+        lines: list[str],
+    ) -> None:
+        left, top, right, bottom = box
+        cv2.rectangle(frame, (left, top), (right, bottom), (40, 40, 40, 255), -1)
+        cv2.rectangle(frame, (left, top), (right, bottom), (230, 230, 230, 255), 3)
+        for i, line in enumerate(lines):
+            self._draw_text(frame, line, (left + 60, top + 100 + 80 * i), 1.2)
+
+    def _draw_text(
+        self,
+        frame: np.ndarray,
+        text: str,
+        origin: tuple[int, int],
+        scale: float,
+    ) -> None:
+        cv2.putText(
+            frame,
+            text,
+            origin,
+            cv2.FONT_HERSHEY_SIMPLEX,
+            scale,
+            (255, 255, 255, 255),
+            2,
+            cv2.LINE_AA,
+        )
+
+    def _paste(
+        self, frame: np.ndarray, template: np.ndarray, origin: tuple[int, int]
+    ) -> None:
+        x, y = origin
+        height, width = template.shape
+        frame[y : y + height, x : x + width, :3] = template[..., None]
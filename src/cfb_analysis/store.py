@@ -0,0 +1,334 @@
+"""The columnar on-disk store of extracted rosters."""
+
+import json
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from loguru import logger
+
+from cfb_analysis.roster import PlayerRecord
+
+# "week_<week>_team_<team code>.npy", one per appended snapshot.
+_SNAPSHOT_NAME = re.compile(r"week_(\d+)_team_(\d+)\.npy")
+
+
+class RosterKey(NamedTuple):
+    """
+    Identifies one stored roster snapshot.
+
+    Attributes
+    ----------
+    dynasty : str
+        The dynasty name, made of letters, digits, "_" and "-".
+    season : int
+        The season, e.g. 2026.
+    week : int
+        The week of the season, from 0 to 255.
+    team : str
+        The team the roster belongs to.
+    """
+
+    dynasty: str
+    season: int
+    week: int
+    team: str
+
+
+class RosterSeason(NamedTuple):
+    """
+    Every stored roster snapshot of one dynasty season.
+
+    Attributes
+    ----------
+    players : np.ndarray
+        One `RosterStore.DTYPE` record per player and snapshot, ordered by
+        week, team and roster order. Dictionary-encoded columns hold codes
+        into `dictionaries`.
+    dictionaries : dict[str, np.ndarray]
+        The values of each dictionary-encoded column, indexed by code.
+    """
+
+    players: np.ndarray
+    dictionaries: dict[str, np.ndarray]
+
+    def decode(self, column: str) -> np.ndarray:
+        """Returns the values of a dictionary-encoded `column`."""
+        return self.dictionaries[column][self.players[column]]
+
+
+class RosterStore:
+    """
+    A columnar on-disk store of extracted rosters.
+
+    Rosters are kept per dynasty, season, week and team. Every extraction
+    run appends one snapshot: a NumPy structured array with one `DTYPE`
+    record per player, saved as
+    "<dynasty>/season_<season>/week_<week>_team_<team code>.npy". Storing
+    the same dynasty, season, week and team again replaces that snapshot,
+    even with an empty roster, and leaves every other one untouched.
+    `compact` merges a season's snapshots into one season file; loading
+    never writes.
+
+    Teams, names, positions and years are dictionary-encoded: each is
+    stored as an integer code into the dynasty's dictionaries. The
+    dictionaries only ever grow, so a code means the same value in every
+    season and snapshots never have to be rewritten. A player takes 12
+    bytes on disk and in memory.
+
+    Attributes
+    ----------
+    DTYPE : np.dtype
+        The record layout of a stored player. `overall` is 0 when it could
+        not be read, and `confidence` is the lowest of the player's field
+        confidences.
+    DICTIONARY_COLUMNS : tuple[str, ...]
+        The dictionary-encoded columns of `DTYPE`.
+    DICTIONARY_FILE : str
+        The file holding a dynasty's dictionaries.
+    SEASON_FILE : str
+        The file a season's snapshots are merged into by `compact`.
+    root : Path
+        The directory holding one directory per dynasty.
+    """
+
+    DTYPE = np.dtype(
+        [
+            ("week", np.uint8),
+            ("team", np.uint16),
+            ("name", np.uint32),
+            ("position", np.uint8),
+            ("year", np.uint8),
+            ("overall", np.uint8),
+            ("confidence", np.float16),
+        ]
+    )
+    DICTIONARY_COLUMNS = ("team", "name", "position", "year")
+    DICTIONARY_FILE = "dictionaries.json"
+    SEASON_FILE = "season.npy"
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        # Each dynasty's dictionaries as {column: {value: code}}.
+        self._codes: dict[str, dict[str, dict[str, int]]] = {}
+
+    def _dynasty_dir(self, dynasty: str) -> Path:
+        if not re.fullmatch(r"[\w-]+", dynasty):
+            raise ValueError(
+                f"Invalid dynasty name '{dynasty}': use letters, digits, "
+                "'_' and '-' only."
+            )
+        return self.root / dynasty
+
+    def _dictionaries(self, dynasty: str) -> dict[str, dict[str, int]]:
+        """Returns the dynasty's dictionaries, loading them once."""
+        if dynasty not in self._codes:
+            path = self._dynasty_dir(dynasty) / self.DICTIONARY_FILE
+            stored = (
+                json.loads(path.read_text(encoding="utf-8")) if path.is_file() else {}
+            )
+            self._codes[dynasty] = {
+                column: {value: code for code, value in enumerate(values)}
+                for column, values in (
+                    (column, stored.get(column, []))
+                    for column in self.DICTIONARY_COLUMNS
+                )
+            }
+        return self._codes[dynasty]
+
+    @staticmethod
+    def _write_atomic(path: Path, write) -> None:
+        """Writes `path` via a temporary file, so it is never seen half-written."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        with temporary.open("wb") as file:
+            write(file)
+        temporary.replace(path)
+
+    def append(self, key: RosterKey, players: list[PlayerRecord]) -> Path:
+        """
+        Stores one team's roster for a week.
+
+        Parameters
+        ----------
+        key : RosterKey
+            The dynasty, season, week and team the roster belongs to.
+        players : list[PlayerRecord]
+            The extracted players, e.g. `RosterExtraction.players`.
+
+        Returns
+        -------
+        Path
+            The snapshot file written.
+
+        Raises
+        ------
+        ValueError
+            If `key.dynasty` is not a valid name.
+        """
+        dynasty, season, week, team = key
+        dictionaries = self._dictionaries(dynasty)
+
+        def _encode(column: str, value: str) -> int:
+            codes = dictionaries[column]
+            return codes.setdefault(value, len(codes))
+
+        team_code = _encode("team", team)
+        fields = [player.fields for player in players]
+        overalls = [f.get("overall", "") for f in fields]
+        snapshot = np.empty(len(players), dtype=self.DTYPE)
+        snapshot["week"] = week
+        snapshot["team"] = team_code
+        for column in ("name", "position", "year"):
+            snapshot[column] = [_encode(column, f.get(column, "")) for f in fields]
+        snapshot["overall"] = [
+            int(overall) if overall.isdigit() and int(overall) < 256 else 0
+            for overall in overalls
+        ]
+        snapshot["confidence"] = [
+            min(player.confidences.values(), default=1.0) for player in players
+        ]
+
+        # Dictionaries first, so a snapshot's codes always resolve.
+        dynasty_dir = self._dynasty_dir(dynasty)
+        self._write_atomic(
+            dynasty_dir / self.DICTIONARY_FILE,
+            lambda file: file.write(
+                json.dumps(
+                    {column: list(codes) for column, codes in dictionaries.items()}
+                ).encode("utf-8")
+            ),
+        )
+        path = (
+            dynasty_dir
+            / f"season_{season}"
+            / f"week_{week:02d}_team_{team_code:04d}.npy"
+        )
+        self._write_atomic(path, lambda file: np.save(file, snapshot))
+
+        logger.info(
+            f"Stored {len(players)} {team} players for {dynasty} season "
+            f"{season}, week {week}."
+        )
+        return path
+
+    def _merge(self, season_dir: Path) -> tuple[np.ndarray, list[Path]]:
+        """Returns a season's merged players and the snapshot files merged."""
+        season_path = season_dir / self.SEASON_FILE
+        players = (
+            np.load(season_path)
+            if season_path.is_file()
+            else np.empty(0, dtype=self.DTYPE)
+        )
+
+        snapshot_paths = sorted(
+            path
+            for path in season_dir.glob("week_*_team_*.npy")
+            if _SNAPSHOT_NAME.fullmatch(path.name)
+        )
+        if not snapshot_paths:
+            return players, []
+
+        # A snapshot replaces its week and team, which are read from its
+        # name so that an empty snapshot still replaces an earlier one.
+        replaced = np.array(
+            [
+                self._key(*map(int, _SNAPSHOT_NAME.fullmatch(path.name).groups()))
+                for path in snapshot_paths
+            ],
+            dtype=np.uint32,
+        )
+        players = np.concatenate(
+            [
+                players[~np.isin(self._keys(players), replaced)],
+                *(np.load(path) for path in snapshot_paths),
+            ]
+        )
+        players = players[np.argsort(self._keys(players), kind="stable")]
+        return players, snapshot_paths
+
+    def load_season(self, dynasty: str, season: int) -> RosterSeason:
+        """
+        Loads every stored snapshot of a season.
+
+        The season file and the snapshots appended since the last `compact`
+        are merged in memory; a snapshot replaces the season file's players
+        for the same week and team. Nothing is written.
+
+        Parameters
+        ----------
+        dynasty : str
+            The dynasty name.
+        season : int
+            The season to load.
+
+        Returns
+        -------
+        RosterSeason
+            The season's players, ordered by week, team code and roster
+            order, and the dynasty's dictionaries. Empty if nothing was
+            stored.
+
+        Raises
+        ------
+        ValueError
+            If `dynasty` is not a valid name.
+        """
+        players, _ = self._merge(self._dynasty_dir(dynasty) / f"season_{season}")
+
+        # Another process may have appended, so dictionaries are reread.
+        self._codes.pop(dynasty, None)
+        dictionaries = {
+            column: np.array(list(codes), dtype=str)
+            for column, codes in self._dictionaries(dynasty).items()
+        }
+
+        return RosterSeason(players, dictionaries)
+
+    def compact(self, dynasty: str, season: int) -> Path:
+        """
+        Merges a season's snapshots into its season file.
+
+        The season file is written before the merged snapshots are removed,
+        so an interrupted compaction loses nothing and is finished by the
+        next one. Only one process should write to a dynasty at a time.
+
+        Parameters
+        ----------
+        dynasty : str
+            The dynasty name.
+        season : int
+            The season to compact.
+
+        Returns
+        -------
+        Path
+            The season file.
+
+        Raises
+        ------
+        ValueError
+            If `dynasty` is not a valid name.
+        """
+        season_dir = self._dynasty_dir(dynasty) / f"season_{season}"
+        season_path = season_dir / self.SEASON_FILE
+        players, snapshot_paths = self._merge(season_dir)
+
+        if snapshot_paths:
+            self._write_atomic(season_path, lambda file: np.save(file, players))
+            for path in snapshot_paths:
+                path.unlink()
+            logger.debug(f"Merged {len(snapshot_paths)} snapshots into {season_path}.")
+
+        return season_path
+
+    @staticmethod
+    def _key(week: int, team: int) -> int:
+        """Packs a week and team code into one sortable integer."""
+        return week << 16 | team
+
+    @staticmethod
+    def _keys(players: np.ndarray) -> np.ndarray:
+        """Packs each player's week and team into one sortable integer."""
+        return players["week"].astype(np.uint32) << 16 | players["team"]
@@ -0,0 +1,419 @@
+"""
+Step timing history and the timeouts derived from it.
+
+Pipeline steps append a `StepTiming` record per run to a `TimingStore`.
+`TimeoutPolicy` turns that history into per-step timeouts, and
+`StabilizationWindow` into an early end of the wait for late overlays.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+
+class StepTiming(NamedTuple):
+    """
+    One recorded execution of an instrumented pipeline step.
+
+    Attributes
+    ----------
+    step : str
+        The name of the step (e.g. a function name, or
+        `poll_for_template_match[<log_context>]`).
+    started_at : float
+        The wall-clock start time as a Unix timestamp.
+    duration : float
+        The elapsed time of the step in seconds.
+    timeout : float | None
+        The configured timeout in seconds, or None if the step has none.
+    timed_out : bool
+        True if the step ended by exceeding its timeout.
+    error : str | None
+        The name of the exception that ended the step, or None if it
+        completed.
+    max_confidence : float | None
+        The highest template match confidence seen, for matching steps.
+    censored : bool, optional
+        True if the step ended before the event it waits for was seen, so
+        `duration` is only a lower bound on its timing (e.g. a
+        `StabilizationWindow` that closed without an overlay). Default is
+        False.
+    """
+
+    step: str
+    started_at: float
+    duration: float
+    timeout: float | None
+    timed_out: bool
+    error: str | None
+    max_confidence: float | None = None
+    censored: bool = False
+
+
+class TimeoutBounds(NamedTuple):
+    """
+    The configured limits for one auto-tuned timeout.
+
+    Attributes
+    ----------
+    default : float
+        The timeout in seconds used until enough history is recorded.
+    floor : float
+        The shortest timeout in seconds the history may produce.
+    ceiling : float
+        The longest timeout in seconds the history may produce.
+    """
+
+    default: float
+    floor: float
+    ceiling: float
+
+
+class TimingStore:
+    """
+    An append-only JSON Lines file of `StepTiming` records.
+
+    Every pipeline run appends to the same file, so the history across
+    runs is available for reporting and for deriving timeouts.
+
+    Attributes
+    ----------
+    path : Path
+        The JSON Lines file records are appended to.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, record: StepTiming) -> None:
+        """Appends one record to the store."""
+        line = json.dumps(record._asdict())
+
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+    def load(self, step: str | None = None) -> list[StepTiming]:
+        """
+        Reads the recorded history.
+
+        Parameters
+        ----------
+        step : str | None, optional
+            Only return records of this step. Default is None (all steps).
+
+        Returns
+        -------
+        list[StepTiming]
+            The matching records in the order they were recorded.
+        """
+        if not self.path.exists():
+            return []
+
+        with self.path.open(encoding="utf-8") as file:
+            records = [StepTiming(**json.loads(line)) for line in file if line.strip()]
+
+        return [r for r in records if step is None or r.step == step]
+
+
+class TimeoutPolicy:
+    """
+    Derives step timeouts from the recorded latency history.
+
+    A step's timeout is the chosen percentile of its completed durations
+    multiplied by `margin`, clamped to the step's configured floor and
+    ceiling. Steps with fewer than `min_samples` completed runs use their
+    configured default. The history is read once, at construction or on
+    `refresh`, so every timeout within a run is consistent.
+
+    Attributes
+    ----------
+    bounds : dict[str, TimeoutBounds]
+        The configured default, floor and ceiling per step name.
+    store : TimingStore
+        The history the timeouts are derived from.
+    percentile : float
+        The latency percentile the timeout is based on.
+    margin : float
+        The multiplier applied to that percentile.
+    min_samples : int
+        The completed runs required before the history is trusted.
+    """
+
+    def __init__(
+        self,
+        bounds: dict[str, TimeoutBounds],
+        store: TimingStore,
+        percentile: float = 99.0,
+        margin: float = 1.5,
+        min_samples: int = 5,
+    ) -> None:
+        self.bounds = bounds
+        self.store = store
+        self.percentile = percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Reloads the completed durations of every configured step."""
+        durations: dict[str, list[float]] = {step: [] for step in self.bounds}
+        for record in self.store.load():
+            if (
+                record.step in durations
+                and record.error is None
+                and not record.timed_out
+                and not record.censored
+            ):
+                durations[record.step].append(record.duration)
+
+        self._durations = durations
+
+    def timeout(self, step: str) -> float:
+        """
+        Returns the timeout for `step`.
+
+        Parameters
+        ----------
+        step : str
+            A step name configured in `bounds`.
+
+        Returns
+        -------
+        float
+            The timeout in seconds.
+        """
+        bounds = self.bounds[step]
+        durations = self._durations[step]
+
+        if len(durations) < self.min_samples:
+            return bounds.default
+
+        tuned = float(np.percentile(durations, self.percentile)) * self.margin
+        return min(max(tuned, bounds.floor), bounds.ceiling)
+
+
+class StabilizationWindow:
+    """
+    Decides when a late overlay has become unlikely enough to stop waiting.
+
+    After a target screen is found, an overlay (such as the hotfix prompt)
+    can still slide in over it. Rather than always waiting out the full
+    window, the wait ends as soon as either of two estimates says the
+    chance of missing an overlay is within `false_negative_budget`:
+
+    - Arrival time: all but `budget` of the overlays seen so far arrived
+      within `deadline` of the screen appearing.
+    - Quiet time: the watched region has not changed for
+      `quiet_period`, which is the `1 - budget` quantile of how long the
+      region had been still right before past overlays arrived.
+
+    Each estimate needs `min_samples` recorded overlays before it is
+    trusted; until then the full `max_window` is waited out. Overlays that
+    do arrive are recorded with `record_arrival`, and windows that end
+    without one with `record_no_arrival`. A window that ended early only
+    shows that no overlay had arrived by then, so the arrival estimate
+    treats those runs as censored (Kaplan-Meier) rather than ignoring
+    them, and is not trusted until some window was watched in full.
+
+    Attributes
+    ----------
+    max_window : float
+        The longest time in seconds to wait.
+    deadline : float
+        The time in seconds after which the arrival-time estimate ends the
+        wait (`max_window` without enough history).
+    quiet_period : float | None
+        The stillness in seconds after which the quiet-time estimate ends
+        the wait, or None without enough history.
+    """
+
+    ARRIVAL_STEP = "hotfix_overlay_arrival"
+    QUIET_STEP = "hotfix_overlay_quiet"
+
+    def __init__(
+        self,
+        max_window: float,
+        arrivals: list[float] | None = None,
+        censored: list[float] | None = None,
+        quiet_gaps: list[float] | None = None,
+        false_negative_budget: float = 0.02,
+        min_samples: int = 10,
+    ) -> None:
+        """
+        Starts the window and derives its early exits from history.
+
+        Parameters
+        ----------
+        max_window : float
+            The longest time in seconds to wait.
+        arrivals : list[float] | None, optional
+            Past overlay arrival times in seconds after the screen
+            appeared. Default is None (no history).
+        censored : list[float] | None, optional
+            The lengths in seconds of past windows that ended without an
+            overlay. Default is None (no history).
+        quiet_gaps : list[float] | None, optional
+            Past stillness durations in seconds that preceded an overlay.
+            Default is None (no history).
+        false_negative_budget : float, optional
+            The accepted fraction of overlays arriving after the window
+            ends. Default is 0.02.
+        min_samples : int, optional
+            The recorded overlays required before an estimate is used.
+            Default is 10.
+        """
+        self.max_window = max_window
+        quantile = 1.0 - false_negative_budget
+
+        self.deadline = max_window
+        if arrivals and len(arrivals) >= min_samples:
+            self.deadline = self._arrival_deadline(
+                arrivals, censored or [], max_window, false_negative_budget
+            )
+
+        self.quiet_period = None
+        if quiet_gaps and len(quiet_gaps) >= min_samples:
+            self.quiet_period = float(
+                np.quantile(quiet_gaps, quantile, method="higher")
+            )
+
+        self._started_at = time.monotonic()
+        self._last_change = 0.0
+        self._quiet_before_change = 0.0
+
+    @staticmethod
+    def _arrival_deadline(
+        arrivals: list[float],
+        censored: list[float],
+        max_window: float,
+        budget: float,
+    ) -> float:
+        """
+        Returns the earliest arrival time that at most `budget` of overlays
+        arrive after, from the Kaplan-Meier estimate of arrival times.
+        """
+        times = np.concatenate([arrivals, censored])
+        # Late overlays can only have been seen by a full-length window.
+        if times.max() < max_window:
+            return max_window
+
+        arrived = np.concatenate(
+            [np.ones(len(arrivals), bool), np.zeros(len(censored), bool)]
+        )
+        # On ties, an arrival happened while the censored run was still
+        # being watched.
+        order = np.lexsort((~arrived, times))
+        times, arrived = times[order], arrived[order]
+
+        at_risk = np.arange(len(times), 0, -1)
+        survival = np.cumprod(1.0 - arrived / at_risk)
+        # Most windows never see an overlay, so survival levels off at
+        # the share of runs without one; `late` is the share of overlays
+        # still to arrive.
+        final = survival[-1]
+        late = (survival - final) / (1.0 - final)
+
+        deadline = times[arrived & (late <= budget)][0]
+        return min(max_window, float(deadline))
+
+    @classmethod
+    def from_history(
+        cls, max_window: float, store: TimingStore, **kwargs
+    ) -> "StabilizationWindow":
+        """Starts a window using the overlays recorded in `store`."""
+        records = store.load()
+        windows = [r for r in records if r.step == cls.ARRIVAL_STEP]
+        return cls(
+            max_window,
+            arrivals=[r.duration for r in windows if not r.censored],
+            censored=[r.duration for r in windows if r.censored],
+            quiet_gaps=[r.duration for r in records if r.step == cls.QUIET_STEP],
+            **kwargs,
+        )
+
+    @property
+    def elapsed(self) -> float:
+        """Time in seconds since the window started."""
+        return time.monotonic() - self._started_at
+
+    @property
+    def quiet_for(self) -> float:
+        """Time in seconds since the watched region last changed."""
+        return self.elapsed - self._last_change
+
+    @property
+    def is_settled(self) -> bool:
+        """Whether a late overlay is now unlikely enough to stop waiting."""
+        if self.elapsed >= self.deadline:
+            return True
+
+        return self.quiet_period is not None and self.quiet_for >= self.quiet_period
+
+    def observe(self, changed: bool) -> None:
+        """
+        Feeds the change signal of the watched region for one frame.
+
+        Parameters
+        ----------
+        changed : bool
+            True if the watched region changed in the latest frame.
+        """
+        if changed:
+            self._quiet_before_change = self.quiet_for
+            self._last_change = self.elapsed
+
+    def record_arrival(self, confidence: float, store: TimingStore) -> None:
+        """
+        Records an overlay that arrived during this window.
+
+        Parameters
+        ----------
+        confidence : float
+            The match confidence of the overlay.
+        store : TimingStore
+            The store to record to.
+        """
+        started_at = time.time() - self.elapsed
+        for step, duration in (
+            (self.ARRIVAL_STEP, self.elapsed),
+            (self.QUIET_STEP, self._quiet_before_change),
+        ):
+            store.append(
+                StepTiming(
+                    step=step,
+                    started_at=started_at,
+                    duration=duration,
+                    timeout=self.max_window,
+                    timed_out=False,
+                    error=None,
+                    max_confidence=confidence,
+                )
+            )
+
+    def record_no_arrival(self, store: TimingStore) -> None:
+        """
+        Records that this window ended without an overlay arriving.
+
+        Parameters
+        ----------
+        store : TimingStore
+            The store to record to.
+        """
+        store.append(
+            StepTiming(
+                step=self.ARRIVAL_STEP,
+                started_at=time.time() - self.elapsed,
+                duration=self.elapsed,
+                timeout=self.max_window,
+                timed_out=False,
+                error=None,
+                censored=True,
+            )
+        )
@@ -0,0 +1,71 @@
+import cv2
+import pytest
+
+from cfb_analysis.archive import reprocess_roster_archive
+from cfb_analysis.frames import create_frame_source
+from cfb_analysis.gamepad import Button
+from cfb_analysis.glyphs import GlyphBank
+from cfb_analysis.roster import (
+    ROSTER_TABLE,
+    read_roster_page,
+    segment_roster_page,
+    write_roster_records,
+)
+from cfb_analysis.sim import ConsoleSimulator, ConsoleState, SimulatorScenario
+
+N_PAGES = 3
+
+
+@pytest.fixture(scope="module")
+def archive(tmp_path_factory):
+    """A directory of PNG roster pages captured from the simulator."""
+    directory = tmp_path_factory.mktemp("archive")
+    console = ConsoleSimulator(
+        SimulatorScenario(
+            input_latency=0.0,
+            boot_latency=0.0,
+            close_latency=0.0,
+            page_latency=0.0,
+            game_left_open=True,
+        ),
+        fps=None,
+    )
+    console.start()
+    for button in (Button.CROSS, Button.TRIANGLE):
+        console.press(button, hold=0.1)
+    assert console.state == ConsoleState.ROSTER
+
+    for page in range(N_PAGES):
+        cv2.imwrite(directory / f"page_{page:03d}.png", console.grab())
+        console.press(ROSTER_TABLE.next_page, hold=0.1)
+
+    return directory
+
+
+@pytest.fixture(scope="module")
+def glyph_bank():
+    return GlyphBank.from_samples(ConsoleSimulator(fps=None).glyph_samples())
+
+
+def test_workers_match_a_single_process_read(archive, glyph_bank, tmp_path):
+    source = create_frame_source(str(archive))
+    left, top, right, bottom = ROSTER_TABLE.region
+    players = []
+    for page in range(len(source)):
+        gray = cv2.cvtColor(source.frame_at(page), cv2.COLOR_BGRA2GRAY)
+        rows = segment_roster_page(gray[top:bottom, left:right], ROSTER_TABLE)
+        players.extend(read_roster_page(page, rows, glyph_bank))
+    write_roster_records(tmp_path / "single.jsonl", players)
+
+    extraction = reprocess_roster_archive(
+        archive, tmp_path / "workers.jsonl", ROSTER_TABLE, glyph_bank, workers=2
+    )
+
+    roster = ConsoleSimulator(fps=None).roster
+    assert [player.fields["name"] for player in extraction.players] == [
+        name for name, *_ in roster[: N_PAGES * ROSTER_TABLE.rows_per_page]
+    ]
+    assert [timing.page for timing in extraction.pages] == list(range(N_PAGES))
+    assert (tmp_path / "workers.jsonl").read_text() == (
+        tmp_path / "single.jsonl"
+    ).read_text()
@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+BASELINE = PROJECT_DIR / "benchmarks" / "vision_baseline.json"
+FIXTURES = PROJECT_DIR / "benchmarks" / "fixtures"
+
+
+def run_benchmarks(project: Path, *args: str) -> subprocess.CompletedProcess:
+    """Runs the notebook's benchmark command in a scratch project."""
+    (project / "notebooks").mkdir(exist_ok=True)
+    shutil.copy(PROJECT_DIR / "notebooks" / "roster_extract.py", project / "notebooks")
+    if not (project / "assets").exists():
+        (project / "assets").symlink_to(PROJECT_DIR / "assets")
+
+    env = os.environ | {
+        "PYTHONPATH": str(PROJECT_DIR / "src"),
+    }
+    return subprocess.run(
+        [
+            sys.executable,
+            "roster_extract.py",
+            "--benchmark",
+            *args,
+            "--fixtures",
+            str(FIXTURES),
+        ],
+        cwd=project / "notebooks",
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+
+def benchmark_keys(run: dict) -> dict[tuple[str, str, str], dict]:
+    return {
+        (row["resolution"], row["template"], row["strategy"]): row
+        for row in run["results"]
+    }
+
+
+@pytest.fixture(scope="module")
+def benchmark_run(tmp_path_factory) -> dict:
+    project = tmp_path_factory.mktemp("project")
+    output = project / "vision.json"
+    result = run_benchmarks(project, str(output), "--repeats", "1")
+
+    assert result.returncode == 0, result.stderr
+    return json.loads(output.read_text())
+
+
+def test_benchmarks_cover_the_baseline(benchmark_run):
+    baseline = json.loads(BASELINE.read_text())
+
+    assert benchmark_keys(benchmark_run).keys() == benchmark_keys(baseline).keys()
+
+
+def test_allocations_do_not_regress(benchmark_run):
+    """Allocations, unlike latency, do not depend on the machine."""
+    baseline = benchmark_keys(json.loads(BASELINE.read_text()))
+
+    for key, row in benchmark_keys(benchmark_run).items():
+        allowed = max(baseline[key]["peak_alloc_bytes"] * 1.1, 4096)
+        assert row["peak_alloc_bytes"] <= allowed, key
+
+
+@pytest.fixture
+def faster_baseline(tmp_path, benchmark_run) -> Path:
+    faster = benchmark_run | {
+        "results": [row | {"p50_ms": 0.0} for row in benchmark_run["results"]]
+    }
+    baseline = tmp_path / "faster.json"
+    baseline.write_text(json.dumps(faster))
+    return baseline
+
+
+def test_regressions_are_only_logged_by_default(tmp_path, faster_baseline):
+    result = run_benchmarks(
+        tmp_path, "--repeats", "1", "--baseline", str(faster_baseline)
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Benchmark regression" in result.stdout
+
+
+def test_check_fails_the_run_on_regression(tmp_path, faster_baseline):
+    result = run_benchmarks(
+        tmp_path, "--repeats", "1", "--baseline", str(faster_baseline), "--check"
+    )
+
+    assert result.returncode != 0
+    assert "BenchmarkRegressionError" in result.stderr
@@ -0,0 +1,169 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+import pytest
+
+from cfb_analysis.capture import CaptureSession
+from cfb_analysis.frames import FrameSource
+
+
+class CountingFrameSource(FrameSource):
+    """
+    Serves random frames cropped to its region and records how it was
+    started. `last_frame` is the full screen the last frame was cut from.
+    """
+
+    def __init__(self, resolution: tuple[int, int] = (320, 180)) -> None:
+        self._resolution = resolution
+        self._rng = np.random.default_rng(0)
+        self.starts: list[tuple[int, int, int, int] | None] = []
+        self.region_changes = 0
+        self.region: tuple[int, int, int, int] | None = None
+        self.last_frame: np.ndarray | None = None
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        return self._resolution
+
+    def start(self, target_fps=60, region=None) -> None:
+        self.starts.append(region)
+        self.region = region
+        self.is_capturing = True
+
+    def stop(self) -> None:
+        self.is_capturing = False
+
+    def set_region(self, region, target_fps=60) -> None:
+        self.region_changes += 1
+        super().set_region(region, target_fps)
+
+    def get_latest_frame(self, timeout=None) -> np.ndarray:
+        width, height = self._resolution
+        self.last_frame = self._rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+        left, top, right, bottom = self.region or (0, 0, width, height)
+        return self.last_frame[top:bottom, left:right]
+
+    def grab(self, region=None) -> np.ndarray:
+        return self.get_latest_frame()
+
+
+def test_source_region_follows_the_plan_with_hysteresis():
+    source = CountingFrameSource()
+    session = CaptureSession(source, region_margin=8, shrink_after=3)
+
+    def read(watch, frames=1):
+        with session.feed(watch=watch) as feed:
+            for _ in range(frames):
+                frame = feed.get_latest_frame(timeout=1.0).copy()
+        return frame
+
+    # A small plan only shrinks the region once it has persisted.
+    read([(100, 100, 140, 140)], frames=3)
+    assert source.region is None
+    frame = read([(100, 100, 140, 140)])
+    assert source.region == (92, 92, 148, 148)
+    np.testing.assert_array_equal(
+        frame[100:140, 100:140], source.last_frame[100:140, 100:140]
+    )
+
+    # A plan outside the region moves it at once.
+    frame = read([(10, 10, 30, 30)])
+    assert source.region == (2, 2, 38, 38)
+    np.testing.assert_array_equal(frame[10:30, 10:30], source.last_frame[10:30, 10:30])
+
+    # A slightly smaller plan keeps the region.
+    read([(12, 12, 28, 28)], frames=5)
+    assert source.region == (2, 2, 38, 38)
+
+    # A full-frame feed needs the whole screen at once.
+    frame = read(None)
+    assert source.region is None
+    np.testing.assert_array_equal(frame, source.last_frame)
+
+    # Each change restarts the source, once per switch.
+    assert source.region_changes == 3
+    assert source.starts == [None, (92, 92, 148, 148), (2, 2, 38, 38), None]
+
+
+def test_crops_planned_regions_in_software():
+    source = CountingFrameSource()
+    session = CaptureSession(source)
+
+    with session.feed(watch=[(10, 20, 50, 60), (200, 100, 250, 150)]) as feed:
+        frame = feed.get_latest_frame(timeout=1.0)
+
+    expected = np.zeros_like(source.last_frame)
+    for left, top, right, bottom in [(10, 20, 50, 60), (200, 100, 250, 150)]:
+        expected[top:bottom, left:right] = source.last_frame[top:bottom, left:right]
+    np.testing.assert_array_equal(frame, expected)
+
+
+@pytest.mark.parametrize("output_size", [None, (160, 90)])
+def test_reuses_published_buffers(output_size):
+    source = CountingFrameSource()
+    session = CaptureSession(source, output_size=output_size)
+
+    with session.feed(watch=[(0, 0, 80, 40)]) as feed:
+        frames = [feed.get_latest_frame(timeout=1.0) for _ in range(5)]
+
+    assert frames[0] is not frames[1]
+    assert all(frame is frames[i % 2] for i, frame in enumerate(frames))
+    assert frames[0].shape[1::-1] == session.resolution
+
+
+def test_downscales_full_frames():
+    source = CountingFrameSource()
+    session = CaptureSession(source, output_size=(160, 90))
+
+    with session.feed() as feed:
+        frame = feed.get_latest_frame(timeout=1.0)
+
+    expected = cv2.resize(source.last_frame, (160, 90), interpolation=cv2.INTER_AREA)
+    np.testing.assert_array_equal(frame, expected)
+
+
+def test_clears_regions_dropped_from_the_plan():
+    source = CountingFrameSource()
+    session = CaptureSession(source)
+
+    with session.feed(watch=[(0, 0, 40, 40)]) as feed:
+        for _ in range(2):
+            feed.get_latest_frame(timeout=1.0)
+
+    with session.feed(watch=[(100, 100, 140, 140)]) as feed:
+        for _ in range(2):
+            frame = feed.get_latest_frame(timeout=1.0)
+
+    assert not frame[0:40, 0:40].any()
+    assert frame[100:140, 100:140].any()
+
+
+def test_held_frames_do_not_change_while_other_feeds_publish():
+    source = CountingFrameSource()
+    session = CaptureSession(source)
+
+    def read_and_hold(watch):
+        with session.feed(watch=watch) as feed:
+            for _ in range(20):
+                frame = feed.get_latest_frame(timeout=1.0)
+                seen = frame.copy()
+                published = session.sequence
+                deadline = time.monotonic() + 1.0
+                while session.sequence < published + 3:
+                    assert time.monotonic() < deadline
+                    time.sleep(0.001)
+                np.testing.assert_array_equal(frame, seen)
+
+    with ThreadPoolExecutor(2) as pool:
+        readers = [
+            pool.submit(read_and_hold, watch)
+            for watch in ([(0, 0, 80, 60)], [(200, 100, 300, 170)])
+        ]
+        with session.feed(watch=[(100, 50, 180, 120)]) as feed:
+            while not all(reader.done() for reader in readers):
+                feed.get_latest_frame(timeout=1.0)
+
+    for reader in readers:
+        reader.result()
@@ -0,0 +1,44 @@
+from cfb_analysis.geometry import (
+    denormalize_region,
+    normalize_region,
+    plan_capture_regions,
+)
+
+
+def test_region_round_trip():
+    region = (1430, 20, 1520, 105)
+    assert denormalize_region(normalize_region(region), (1920, 1080)) == region
+    assert denormalize_region(normalize_region(region), (1280, 720)) == (
+        953,
+        13,
+        1013,
+        70,
+    )
+
+
+def test_plan_merges_nearby_regions():
+    assert plan_capture_regions([(0, 0, 10, 10), (20, 0, 30, 10)], merge_gap=10) == [
+        (0, 0, 30, 10)
+    ]
+
+
+def test_plan_keeps_distant_regions_apart():
+    regions = [(500, 500, 600, 600), (0, 0, 10, 10)]
+    assert plan_capture_regions(regions, merge_gap=32) == sorted(regions)
+
+
+def test_plan_needs_both_gaps_small():
+    # Close horizontally but far apart vertically.
+    regions = [(0, 0, 10, 10), (15, 100, 25, 110)]
+    assert plan_capture_regions(regions, merge_gap=10) == regions
+
+
+def test_plan_merges_transitively():
+    # The merged first pair reaches the third region.
+    regions = [(0, 0, 10, 10), (15, 0, 25, 10), (30, 15, 40, 25)]
+    assert plan_capture_regions(regions, merge_gap=5) == [(0, 0, 40, 25)]
+
+
+def test_plan_drops_empty_regions():
+    assert plan_capture_regions([(5, 5, 5, 20), (0, 0, 10, 10)]) == [(0, 0, 10, 10)]
+    assert plan_capture_regions([]) == []
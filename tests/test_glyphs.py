@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from cfb_analysis.glyphs import CellReading, GlyphBank
+from cfb_analysis.sim import ConsoleSimulator
+
+
+@pytest.fixture(scope="module")
+def samples():
+    return ConsoleSimulator(fps=None).glyph_samples(n_pages=4)
+
+
+@pytest.fixture(scope="module")
+def bank(samples):
+    # Learned from the first three pages; the fourth is held out.
+    return GlyphBank.from_samples(samples[: len(samples) * 3 // 4])
+
+
+def held_out(samples):
+    return samples[len(samples) * 3 // 4 :]
+
+
+def test_from_samples_reads_unseen_cells(bank, samples):
+    cells, texts = zip(*held_out(samples), strict=True)
+
+    readings = bank.read_batch(list(cells))
+
+    assert [reading.text for reading in readings] == list(texts)
+    assert min(reading.confidence for reading in readings) >= bank.min_confidence
+
+
+def test_reads_cells_scaled_from_another_resolution(bank):
+    samples = ConsoleSimulator(fps=None).glyph_samples(
+        n_pages=1, resolution=(1280, 720)
+    )
+
+    readings = bank.read_batch([cell for cell, _ in samples])
+
+    correct = sum(
+        r.text == text for r, (_, text) in zip(readings, samples, strict=True)
+    )
+    assert correct >= 0.9 * len(samples)
+
+
+def test_read_matches_read_batch(bank, samples):
+    cells = [cell for cell, _ in held_out(samples)[:5]]
+
+    for single, batched in zip(
+        [bank.read(cell) for cell in cells], bank.read_batch(cells), strict=True
+    ):
+        assert single.text == batched.text
+        assert single.confidences == pytest.approx(batched.confidences, abs=1e-4)
+
+
+def test_save_load_round_trip(bank, samples, tmp_path):
+    bank.save(tmp_path)
+    loaded = GlyphBank.load(tmp_path)
+
+    assert loaded.characters == bank.characters
+    np.testing.assert_array_equal(loaded.templates, bank.templates)
+    assert loaded.space_width == pytest.approx(bank.space_width)
+    assert loaded.max_glyph_width == pytest.approx(bank.max_glyph_width)
+    cells = [cell for cell, _ in held_out(samples)]
+    assert [r.text for r in loaded.read_batch(cells)] == [
+        r.text for r in bank.read_batch(cells)
+    ]
+
+
+@pytest.mark.parametrize("create", [True, False], ids=["empty", "missing"])
+def test_load_without_glyphs_names_the_directory(tmp_path, create):
+    directory = tmp_path / "1920x1080"
+    if create:
+        directory.mkdir()
+
+    with pytest.raises(FileNotFoundError, match="1920x1080"):
+        GlyphBank.load(directory)
+
+
+def test_blank_cell_reads_empty(bank):
+    reading = bank.read(np.full((40, 120), 90, dtype=np.uint8))
+
+    assert reading == CellReading("", ())
+    assert reading.confidence == 1.0
+
+
+def test_low_confidence_glyphs_read_as_unknown(bank, samples):
+    strict = GlyphBank(bank.characters, bank.templates, min_confidence=1.01)
+    name = next((cell, text) for cell, text in held_out(samples) if " " in text)
+
+    reading = strict.read(name[0])
+
+    assert reading.text == "".join(" " if c == " " else "?" for c in name[1])
+
+
+def test_from_samples_skips_mislabelled_cells(samples):
+    blank = np.full((40, 120), 90, dtype=np.uint8)
+
+    bank = GlyphBank.from_samples([*samples[:8], (blank, "ZZ")])
+
+    assert "Z" not in bank.characters
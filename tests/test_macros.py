@@ -0,0 +1,145 @@
+import pytest
+
+from cfb_analysis.gamepad import Button, InputStep
+from cfb_analysis.macros import (
+    _LOGGED_INPUT,
+    MacroSyntaxError,
+    MacroTiming,
+    compile_macro,
+    record_macro,
+)
+
+# `VirtualController`'s defaults.
+TIMING = MacroTiming(tap_time=0.1, hold_time=1.2, rest_time=0.3)
+
+# Lines as `_configure_logging` writes them during a pipeline run.
+LOGGED_TAP = (
+    "2026-10-18 11:27:00.304 | TRACE    | launch | _play:2660 - "
+    "Controller input executed: tap DPAD_RIGHT (rest time: 0.3s)"
+)
+LOGGED_HOLD = (
+    "2026-10-18 11:27:05.104 | TRACE    | shutdown | _play:2660 - "
+    "Controller input executed: hold PS (rest time: 1.0s)"
+)
+
+
+def checkpoint(words: list[str], line_number: int) -> tuple[str, ...]:
+    if words[1:] == ["change"]:
+        return ("change",)
+    raise MacroSyntaxError(f"Line {line_number}: bad checkpoint.")
+
+
+def compile_text(text: str) -> list:
+    return compile_macro(text, TIMING, checkpoint).segments
+
+
+def test_inputs_between_checkpoints_form_one_segment():
+    segments = compile_text(
+        """
+        wait 0.5                      # before the first input
+        DPAD_RIGHT x3 rest=0.1
+        expect change timeout=2.0
+        PS hold
+        CROSS
+        """
+    )
+
+    assert len(segments) == 2
+    first, last = segments
+    assert first.delay == 0.5
+    assert first.steps == [InputStep(Button.DPAD_RIGHT, 0.1, 0.1)] * 3
+    assert first.checkpoint == ("change",)
+    assert first.timeout == 2.0
+    assert last.steps == [
+        InputStep(Button.PS, 1.2, 0.3),
+        InputStep(Button.CROSS, 0.1, 0.3),
+    ]
+    assert last.checkpoint is None
+
+
+def test_wait_lengthens_the_previous_rest():
+    (segment,) = compile_text("CROSS rest=0.2\nwait 0.5\nCIRCLE")
+
+    assert segment.steps[0].rest_time == pytest.approx(0.7)
+
+
+def test_checkpoint_timeout_defaults_to_rest_time():
+    (segment,) = compile_text("CROSS\nexpect change")
+
+    assert segment.timeout == TIMING.rest_time
+
+
+def test_timeline_and_duration():
+    macro = compile_macro("CROSS rest=0.2\nPS hold rest=0", TIMING, checkpoint)
+
+    assert macro.timeline() == [
+        (0.0, "CROSS", "press"),
+        (0.1, "CROSS", "release"),
+        (0.3, "PS", "press"),
+        (1.5, "PS", "release"),
+    ]
+    assert macro.duration == pytest.approx(1.5)
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("JUMP", "Line 1: unknown button 'JUMP'"),
+        ("CROSS twice", "Line 1: unexpected 'twice'"),
+        ("CROSS speed=2", "Line 1: unknown option 'speed'"),
+        ("CROSS rest=soon", "Line 1: 'rest=soon' is not a number"),
+        ("\nwait", "Line 2: expected 'wait <seconds>'"),
+        ("expect change", "Line 1: 'expect' must follow an input"),
+        ("CROSS\nexpect appears", "Line 2: bad checkpoint"),
+    ],
+)
+def test_syntax_errors_name_the_line(text, message):
+    with pytest.raises(MacroSyntaxError, match=message):
+        compile_text(text)
+
+
+def test_logged_input_pattern_matches_a_logged_line():
+    logged = _LOGGED_INPUT.match(LOGGED_TAP)
+
+    assert logged is not None
+    assert logged.group("phase", "kind", "button", "rest") == (
+        "launch",
+        "tap",
+        "DPAD_RIGHT",
+        "0.3",
+    )
+
+
+def test_record_macro_round_trips_through_compile(tmp_path):
+    log = tmp_path / "cfb_pipeline.log"
+    # Two taps back to back, then 2.2 s of polling before the hold.
+    log.write_text(
+        "\n".join(
+            [
+                LOGGED_TAP,
+                LOGGED_TAP.replace("00.304", "00.704"),
+                "2026-10-18 11:27:01.000 | INFO     | launch | poll:1 - Polling...",
+                LOGGED_HOLD,
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    text = record_macro(log, TIMING)
+
+    assert text == "DPAD_RIGHT x2 rest=0.3\nwait 2.20\nPS hold rest=1\n"
+    (segment,) = compile_text(text)
+    assert [step.button for step in segment.steps] == [
+        Button.DPAD_RIGHT,
+        Button.DPAD_RIGHT,
+        Button.PS,
+    ]
+    assert segment.steps[1].rest_time == pytest.approx(0.3 + 2.2)
+
+
+def test_record_macro_filters_by_phase(tmp_path):
+    log = tmp_path / "cfb_pipeline.log"
+    log.write_text(f"{LOGGED_TAP}\n{LOGGED_HOLD}\n", encoding="utf-8")
+
+    assert record_macro(log, TIMING, phase="shutdown") == "PS hold rest=1\n"
@@ -0,0 +1,74 @@
+import cv2
+import numpy as np
+import pytest
+
+from cfb_analysis import matching
+from cfb_analysis.matching import build_template_pyramid, find_template
+
+
+def smooth_noise(rng: np.random.Generator, shape: tuple[int, int], sigma: float):
+    noise = rng.integers(0, 256, shape, dtype=np.uint8)
+    return cv2.normalize(
+        cv2.GaussianBlur(noise, (0, 0), sigma), None, 0, 255, cv2.NORM_MINMAX
+    )
+
+
+def scene_with_look_alikes(seed: int):
+    """
+    Places a template below three blurred copies of it.
+
+    The blurred copies correlate with the template as well as the template
+    itself once both are downscaled, so they compete for the coarse peak.
+    """
+    rng = np.random.default_rng(seed)
+    image = smooth_noise(rng, (300, 600), 3.0)
+    template = smooth_noise(rng, (48, 48), 1.5)
+
+    look_alike = cv2.GaussianBlur(template, (0, 0), 2.0)
+    for x in (60, 220, 380):
+        image[20:68, x : x + 48] = look_alike
+
+    location = (int(rng.integers(0, 550)), 200)
+    x, y = location
+    image[y : y + 48, x : x + 48] = template
+    return image, template, location
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_finds_template_behind_look_alikes(seed):
+    image, template, location = scene_with_look_alikes(seed)
+
+    match = find_template(image, template)
+
+    assert match.is_match
+    assert match.location == location
+    assert match.confidence == pytest.approx(1.0, abs=1e-4)
+
+
+def test_agrees_with_full_resolution_pass():
+    image, template, location = scene_with_look_alikes(0)
+
+    coarse = find_template(
+        image, template, template_pyramid=build_template_pyramid(template)
+    )
+    full = find_template(image, template, max_pyramid_level=0)
+
+    assert coarse.location == full.location == location
+
+
+def test_rejects_absent_template():
+    rng = np.random.default_rng(0)
+    image = smooth_noise(rng, (300, 600), 3.0)
+    template = smooth_noise(rng, (48, 48), 1.5)
+
+    assert not find_template(image, template).is_match
+
+
+def test_scratch_buffers_are_bounded():
+    rng = np.random.default_rng(0)
+    image = smooth_noise(rng, (300, 600), 3.0)
+
+    for size in range(16, 80, 2):
+        find_template(image, smooth_noise(rng, (size, size), 1.5))
+
+    assert len(matching._scratch.buffers) == matching._MAX_SCRATCH_BUFFERS
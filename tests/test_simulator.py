@@ -0,0 +1,232 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import cv2
+import pytest
+
+from cfb_analysis.gamepad import Button, InputType
+from cfb_analysis.geometry import denormalize_region
+from cfb_analysis.home import HOME_TILE_ROW
+from cfb_analysis.macros import MacroTiming, compile_macro, record_macro
+from cfb_analysis.matching import find_template
+from cfb_analysis.sim import ConsoleSimulator, ConsoleState, SimulatorScenario
+from cfb_analysis.store import RosterStore
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+STORE_ARGS = ["--dynasty", "test", "--season", "2026", "--week", "1", "--team", "Texas"]
+
+# Fast enough that every scheduled transition is due by the next input.
+INSTANT = SimulatorScenario(
+    input_latency=0.0, boot_latency=0.0, close_latency=0.0, page_latency=0.0
+)
+
+
+def tap(console: ConsoleSimulator, *buttons: Button) -> None:
+    """Sends each press through the fake gamepad's vgamepad API."""
+    for button in buttons:
+        input_type, value = button.value
+        if input_type == InputType.DPAD:
+            console.gamepad.directional_pad(int(value))
+            console.gamepad.update()
+            console.gamepad.directional_pad(int(Button.DPAD_NEUTRAL.value[1]))
+        elif input_type == InputType.SPECIAL:
+            console.gamepad.press_special_button(int(value))
+            console.gamepad.update()
+            console.gamepad.release_special_button(int(value))
+        else:
+            console.gamepad.press_button(int(value))
+            console.gamepad.update()
+            console.gamepad.release_button(int(value))
+        console.gamepad.update()
+
+
+def launch_cfb(console: ConsoleSimulator) -> None:
+    tap(console, *[Button.DPAD_RIGHT] * (console.scenario.cfb_tile_index + 1))
+    tap(console, Button.CROSS)
+
+
+def test_launch_reaches_main_menu():
+    console = ConsoleSimulator(INSTANT, fps=None)
+    console.start()
+    assert console.state == ConsoleState.HOME
+
+    launch_cfb(console)
+    assert console.state == ConsoleState.TITLE_SCREEN
+
+    tap(console, Button.CROSS)
+    assert console.state == ConsoleState.POPUP
+
+    tap(console, Button.CIRCLE)
+    assert console.state == ConsoleState.MAIN_MENU
+
+
+def test_hotfix_shows_once():
+    console = ConsoleSimulator(INSTANT._replace(popups=0, hotfix_delay=0.0), fps=None)
+    console.start()
+    launch_cfb(console)
+    tap(console, Button.CROSS)
+    assert console.state == ConsoleState.HOTFIX
+
+    # Close the game from its options menu and launch it again.
+    tap(console, Button.PS, Button.OPTIONS, Button.CROSS)
+    assert console.state == ConsoleState.HOME
+    tap(console, Button.CROSS, Button.CROSS)
+    assert console.state == ConsoleState.MAIN_MENU
+
+
+def test_hung_connection_ignores_inputs():
+    console = ConsoleSimulator(INSTANT._replace(hung_connections=1), fps=None)
+    console.start()
+    tap(console, Button.DPAD_RIGHT)
+    assert console.state == ConsoleState.HUNG
+    assert not console.grab()[..., :3].any()
+
+    # The next connection is healthy.
+    console.stop()
+    console.start()
+    assert console.state == ConsoleState.HOME
+
+
+def test_roster_pages():
+    console = ConsoleSimulator(INSTANT._replace(game_left_open=True), fps=None)
+    console.start()
+    tap(console, Button.CROSS, Button.TRIANGLE)
+    assert console.state == ConsoleState.ROSTER
+
+    first_page = console.grab()
+    tap(console, Button.R1)
+    assert not (console.grab() == first_page).all()
+
+
+@pytest.mark.parametrize(
+    ("name", "state"),
+    [
+        ("CFB_MAIN_MENU", ConsoleState.MAIN_MENU),
+        ("CFB_HOTFIX_OVERLAY", ConsoleState.HOTFIX),
+    ],
+)
+def test_screen_templates_match_their_screens(name, state):
+    console = ConsoleSimulator(INSTANT, fps=None)
+    template, region, _ = console.screen_templates()[name]
+    left, top, right, bottom = denormalize_region(region, console.resolution)
+    frame = cv2.cvtColor(console._draw(state), cv2.COLOR_BGRA2GRAY)
+
+    scores = cv2.matchTemplate(
+        frame[top:bottom, left:right], template, cv2.TM_CCOEFF_NORMED
+    )
+    assert scores.max() > 0.99
+
+
+@pytest.mark.parametrize("cfb_tile_index", [0, 2, 4])
+@pytest.mark.parametrize("resolution", [(1920, 1080), (1280, 720)])
+def test_tile_row_scan_finds_the_cfb_tile(cfb_tile_index, resolution):
+    console = ConsoleSimulator(
+        INSTANT._replace(cfb_tile_index=cfb_tile_index), fps=None
+    )
+    console.start()
+    tile_row = HOME_TILE_ROW.scaled(resolution)
+    title = cv2.imread(PROJECT_DIR / "assets" / "templates" / "cfb_game_title.png", 0)
+    scale = resolution[0] / console.resolution[0]
+    title = cv2.resize(title, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    frame = cv2.resize(console.grab(), resolution, interpolation=cv2.INTER_AREA)
+    left, top, right, bottom = tile_row.region
+    gray = cv2.cvtColor(frame[top:bottom, left:right], cv2.COLOR_BGRA2GRAY)
+    is_match, _, (x, _) = find_template(gray, title)
+
+    assert is_match
+    assert tile_row.tile_index(left + x) == cfb_tile_index
+
+    # The located number of taps from the first game tile lands on CFB.
+    tap(console, *[Button.DPAD_RIGHT] * (cfb_tile_index + 1), Button.CROSS)
+    assert console.state == ConsoleState.TITLE_SCREEN
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        {},
+        {"hotfix_delay": 2.0},
+        {"game_left_open": True},
+        {"hung_connections": 1},
+    ],
+    ids=["default", "hotfix", "game_left_open", "hung_connection"],
+)
+def test_notebook_extracts_roster(tmp_path, scenario):
+    """Runs the whole notebook against the simulator in a scratch project."""
+    simulated_roster = ConsoleSimulator(SimulatorScenario(**scenario)).roster
+    (tmp_path / "notebooks").mkdir()
+    shutil.copy(PROJECT_DIR / "notebooks" / "roster_extract.py", tmp_path / "notebooks")
+    (tmp_path / "assets").symlink_to(PROJECT_DIR / "assets")
+
+    env = os.environ | {
+        "CFB_CAPTURE_SOURCE": "simulator",
+        # Controller inputs are only logged at TRACE.
+        "CFB_LOG_FILE_LEVEL": "TRACE",
+        "CFB_SIMULATOR_SCENARIO": json.dumps({"time_scale": 20} | scenario),
+        "PYTHONPATH": str(PROJECT_DIR / "src"),
+    }
+    result = subprocess.run(
+        [sys.executable, "roster_extract.py", *STORE_ARGS],
+        cwd=tmp_path / "notebooks",
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Main launch sequence completed successfully!" in result.stdout
+    assert "Extracted 85 players" in result.stdout
+
+    (roster,) = (tmp_path / "data" / "rosters").glob("*.jsonl")
+    assert len(roster.read_text().splitlines()) == 85
+
+    season = RosterStore(tmp_path / "data" / "store").load_season("test", 2026)
+    assert season.decode("name").tolist() == [name for name, *_ in simulated_roster]
+
+    # Every input the run logged is recovered as a macro step.
+    (log,) = (tmp_path / "notebooks" / "logs").glob("cfb_pipeline_*.log")
+    timing = MacroTiming(tap_time=0.1, hold_time=1.2, rest_time=0.3)
+    macro = compile_macro(record_macro(log, timing), timing, checkpoint=None)
+    (segment,) = macro.segments
+    log_text = log.read_text(encoding="utf-8")
+    logged = log_text.count("Controller input executed")
+    assert len(segment.steps) == logged > 0
+
+    # A fresh launch finds the CFB tile with one scan of the row.
+    if not scenario.get("game_left_open"):
+        assert "Game title located 2 tile(s) to the right." in log_text
+        assert "Evaluating game title" not in log_text
+
+
+def test_notebook_stops_live_runs_without_measured_layouts(tmp_path):
+    """Runs that are not simulated stop before sending any input."""
+    (tmp_path / "notebooks").mkdir()
+    shutil.copy(PROJECT_DIR / "notebooks" / "roster_extract.py", tmp_path / "notebooks")
+    (tmp_path / "assets").symlink_to(PROJECT_DIR / "assets")
+
+    env = os.environ | {
+        # A replayed capture stands in for the live stream.
+        "CFB_CAPTURE_SOURCE": str(PROJECT_DIR / "benchmarks" / "fixtures"),
+        "CFB_LOG_FILE_LEVEL": "TRACE",
+        "PYTHONPATH": str(PROJECT_DIR / "src"),
+    }
+    result = subprocess.run(
+        [sys.executable, "roster_extract.py", *STORE_ARGS],
+        cwd=tmp_path / "notebooks",
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    assert result.returncode != 0
+    assert "LiveLayoutNotMeasuredError" in result.stderr
+    assert "ROSTER_TABLE_MEASURED" in result.stderr
+    (log,) = (tmp_path / "notebooks" / "logs").glob("cfb_pipeline_*.log")
+    assert "Controller input executed" not in log.read_text(encoding="utf-8")
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from cfb_analysis.roster import PlayerRecord
+from cfb_analysis.store import RosterKey, RosterStore
+
+
+def player(row: int, name: str, overall: str = "80") -> PlayerRecord:
+    return PlayerRecord(
+        page=0,
+        row=row,
+        cells={},
+        fields={"name": name, "position": "QB", "year": "SR", "overall": overall},
+        confidences={"name": 0.9, "overall": 0.75},
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RosterStore(tmp_path)
+
+
+def test_append_load_round_trip(store):
+    key = RosterKey("my_dynasty", 2026, 3, "Texas")
+    store.append(key, [player(0, "JALEN SMITH", "91"), player(1, "TYLER MOORE", "x")])
+
+    season = store.load_season("my_dynasty", 2026)
+
+    assert season.decode("name").tolist() == ["JALEN SMITH", "TYLER MOORE"]
+    assert season.decode("team").tolist() == ["Texas", "Texas"]
+    assert season.players["week"].tolist() == [3, 3]
+    assert season.players["overall"].tolist() == [91, 0]
+    np.testing.assert_allclose(season.players["confidence"], 0.75)
+
+
+def test_append_replaces_same_week_and_team(store):
+    store.append(RosterKey("d", 2026, 1, "Texas"), [player(0, "OLD")])
+    store.append(RosterKey("d", 2026, 1, "Ohio State"), [player(0, "OTHER")])
+    store.append(RosterKey("d", 2026, 1, "Texas"), [player(0, "NEW")])
+
+    season = store.load_season("d", 2026)
+
+    assert sorted(season.decode("name").tolist()) == ["NEW", "OTHER"]
+
+
+def test_empty_roster_replaces_snapshot(store):
+    key = RosterKey("d", 2026, 1, "Texas")
+    store.append(key, [player(0, "JALEN SMITH")])
+    store.compact("d", 2026)
+    store.append(key, [])
+
+    assert len(store.load_season("d", 2026).players) == 0
+    store.compact("d", 2026)
+    assert len(store.load_season("d", 2026).players) == 0
+
+
+def test_load_does_not_write(store, tmp_path):
+    store.append(RosterKey("d", 2026, 1, "Texas"), [player(0, "A")])
+    before = sorted(path.name for path in (tmp_path / "d" / "season_2026").iterdir())
+
+    store.load_season("d", 2026)
+
+    after = sorted(path.name for path in (tmp_path / "d" / "season_2026").iterdir())
+    assert before == after == ["week_01_team_0000.npy"]
+
+
+def test_compact_merges_snapshots(store, tmp_path):
+    store.append(RosterKey("d", 2026, 2, "Texas"), [player(0, "B")])
+    store.append(RosterKey("d", 2026, 1, "Texas"), [player(0, "A")])
+    expected = store.load_season("d", 2026)
+
+    path = store.compact("d", 2026)
+    season = store.load_season("d", 2026)
+
+    assert [p.name for p in (tmp_path / "d" / "season_2026").iterdir()] == [path.name]
+    np.testing.assert_array_equal(season.players, expected.players)
+    assert season.decode("name").tolist() == ["A", "B"]
+
+
+def test_codes_are_shared_across_seasons(tmp_path):
+    RosterStore(tmp_path).append(RosterKey("d", 2025, 1, "Texas"), [player(0, "A")])
+    RosterStore(tmp_path).append(RosterKey("d", 2026, 1, "Texas"), [player(0, "B")])
+
+    store = RosterStore(tmp_path)
+    assert store.load_season("d", 2025).decode("name").tolist() == ["A"]
+    assert store.load_season("d", 2026).decode("name").tolist() == ["B"]
+
+
+def test_rejects_invalid_dynasty(store):
+    with pytest.raises(ValueError):
+        store.append(RosterKey("../d", 2026, 1, "Texas"), [])
+
+
+def test_missing_season_is_empty(store):
+    season = store.load_season("d", 2026)
+    assert len(season.players) == 0
+    assert season.players.dtype == RosterStore.DTYPE
@@ -0,0 +1,183 @@
+import time
+
+import pytest
+
+from cfb_analysis.timing import (
+    StabilizationWindow,
+    StepTiming,
+    TimeoutBounds,
+    TimeoutPolicy,
+    TimingStore,
+)
+
+BOUNDS = {"step": TimeoutBounds(default=10.0, floor=1.0, ceiling=20.0)}
+
+
+def run(step: str, duration: float, **kwargs) -> StepTiming:
+    return StepTiming(
+        step=step,
+        started_at=0.0,
+        duration=duration,
+        timeout=None,
+        timed_out=kwargs.pop("timed_out", False),
+        error=kwargs.pop("error", None),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TimingStore(tmp_path / "logs" / "step_timings.jsonl")
+
+
+def test_store_round_trip(store):
+    assert store.load() == []
+
+    store.append(run("a", 1.0, max_confidence=0.9))
+    store.append(run("b", 2.0, timed_out=True))
+
+    assert store.load() == [
+        run("a", 1.0, max_confidence=0.9),
+        run("b", 2.0, timed_out=True),
+    ]
+    assert store.load("b") == [run("b", 2.0, timed_out=True)]
+
+
+def test_policy_uses_default_until_enough_history(store):
+    for _ in range(4):
+        store.append(run("step", 2.0))
+
+    assert TimeoutPolicy(BOUNDS, store).timeout("step") == 10.0
+
+
+def test_policy_scales_the_percentile_by_the_margin(store):
+    for duration in (1.0, 2.0, 3.0, 4.0, 5.0):
+        store.append(run("step", duration))
+
+    policy = TimeoutPolicy(BOUNDS, store, percentile=50.0, margin=2.0)
+
+    assert policy.timeout("step") == pytest.approx(6.0)
+
+
+@pytest.mark.parametrize("duration, expected", [(0.1, 1.0), (100.0, 20.0)])
+def test_policy_clamps_to_the_bounds(store, duration, expected):
+    for _ in range(5):
+        store.append(run("step", duration))
+
+    assert TimeoutPolicy(BOUNDS, store).timeout("step") == expected
+
+
+def test_policy_ignores_failed_runs_and_other_steps(store):
+    for _ in range(5):
+        store.append(run("step", 2.0))
+        store.append(run("step", 50.0, timed_out=True))
+        store.append(run("step", 50.0, error="OSError"))
+        store.append(run("step", 50.0, censored=True))
+        store.append(run("other", 50.0))
+
+    assert TimeoutPolicy(BOUNDS, store, margin=1.0).timeout("step") == 2.0
+
+
+def test_policy_reads_new_history_on_refresh(store):
+    policy = TimeoutPolicy(BOUNDS, store)
+    for _ in range(5):
+        store.append(run("step", 2.0))
+
+    assert policy.timeout("step") == 10.0
+    policy.refresh()
+    assert policy.timeout("step") == pytest.approx(3.0)
+
+
+def test_window_without_history_waits_in_full():
+    window = StabilizationWindow(10.0, arrivals=[1.0] * 9, quiet_gaps=[0.5] * 9)
+
+    assert window.deadline == 10.0
+    assert window.quiet_period is None
+    assert not window.is_settled
+
+
+def test_window_deadline_from_arrivals():
+    # Full-length windows that saw nothing make the estimate trustworthy.
+    window = StabilizationWindow(
+        10.0,
+        arrivals=[float(t) for t in range(1, 11)],
+        censored=[10.0] * 90,
+        false_negative_budget=0.1,
+    )
+
+    assert window.deadline == 9.0
+
+
+def test_window_deadline_counts_early_ends_as_censored():
+    arrivals = [float(t) for t in range(1, 11)]
+
+    # Windows cut short at 5 s leave the later arrivals with fewer
+    # runs at risk, so each of them counts for more.
+    window = StabilizationWindow(
+        10.0,
+        arrivals=arrivals,
+        censored=[5.0] * 80 + [10.0] * 10,
+        false_negative_budget=0.25,
+    )
+    ignoring_early_ends = StabilizationWindow(
+        10.0,
+        arrivals=arrivals,
+        censored=[10.0] * 10,
+        false_negative_budget=0.25,
+    )
+
+    assert window.deadline == 9.0
+    assert ignoring_early_ends.deadline == 8.0
+
+
+def test_window_needs_a_full_length_window_to_trust_arrivals():
+    window = StabilizationWindow(10.0, arrivals=[1.0] * 10, censored=[5.0] * 90)
+
+    assert window.deadline == 10.0
+
+
+def test_window_quiet_period_is_the_budget_quantile():
+    window = StabilizationWindow(
+        10.0, quiet_gaps=[float(t) for t in range(1, 11)], false_negative_budget=0.2
+    )
+
+    assert window.quiet_period == 9.0
+
+
+def test_window_settles_on_quiet_or_expiry():
+    quiet = StabilizationWindow(10.0, quiet_gaps=[0.0] * 10)
+    expired = StabilizationWindow(0.0)
+
+    assert quiet.is_settled
+    assert expired.is_settled
+
+
+def test_window_observe_restarts_the_quiet_time():
+    window = StabilizationWindow(10.0)
+    time.sleep(0.02)
+
+    window.observe(changed=False)
+    assert window.quiet_for >= 0.02
+    window.observe(changed=True)
+    assert window.quiet_for < 0.02
+
+
+def test_window_history_round_trip(store):
+    for _ in range(10):
+        window = StabilizationWindow(10.0)
+        window.record_arrival(0.95, store)
+    StabilizationWindow(0.0).record_no_arrival(store)
+
+    arrivals = store.load(StabilizationWindow.ARRIVAL_STEP)
+    quiet_gaps = store.load(StabilizationWindow.QUIET_STEP)
+    assert len(arrivals) == 11
+    assert len(quiet_gaps) == 10
+    assert arrivals[-1].censored
+    assert not arrivals[-1].timed_out and arrivals[-1].error is None
+    assert all(r.max_confidence == 0.95 for r in quiet_gaps)
+
+    window = StabilizationWindow.from_history(10.0, store)
+    # Every window ended early, so the arrival estimate is not trusted,
+    # while the overlays arrived right after a change.
+    assert window.deadline == 10.0
+    assert window.quiet_period == pytest.approx(0.0, abs=0.01)